@@ -0,0 +1,107 @@
+import numpy as np
+
+import transferFunction as tfModules
+
+
+def _estimateErrors(tfs_left, tfs_mid, tfs_right):
+    # 区間の両端から線形補間で予測した中点の値と、実際の中点の値との差を求める
+    gains_left = 20 * np.log10(np.abs(tfs_left))
+    gains_mid = 20 * np.log10(np.abs(tfs_mid))
+    gains_right = 20 * np.log10(np.abs(tfs_right))
+    gainErrors_dB = np.abs(gains_mid - (gains_left + gains_right) / 2)
+
+    # 位相は両端の位相差の半分だけ進んだ値を予測値とする(位相の折り返しを考慮する)
+    phaseDiffs = np.angle(tfs_right / tfs_left)
+    predictedPhases = np.angle(tfs_left) + phaseDiffs / 2
+    phaseErrors_deg = np.abs(
+        np.degrees(np.angle(tfs_mid * np.exp(-1j * predictedPhases)))
+    )
+    return gainErrors_dB, phaseErrors_deg
+
+
+def calcTfsAdaptively(
+    startFrequency_Hz,
+    stopFrequency_Hz,
+    endCondition,
+    cable,
+    tolerance_dB=0.05,
+    tolerance_deg=1.0,
+    nInitialPoints=201,
+    maxPoints=20000,
+    minInterval_Hz=1.0,
+):
+    """
+    |H|や位相の変化が大きい区間だけを細かく分割しながら伝達関数を求める
+
+    粗い等間隔の周波数から始め、各区間の中点における|H|[dB]と位相の値が、
+    両端からの線形補間による予測値と許容誤差以上ずれている区間だけを二分割していく
+
+    Parameters
+    ----------
+    startFrequency_Hz, stopFrequency_Hz : float
+        周波数の範囲(Hz)
+    endCondition: dict
+        受電端の抵抗の条件
+    cable : instance
+        Cableクラスのインスタンス
+    tolerance_dB : float
+        |H|の許容誤差(dB)
+    tolerance_deg : float
+        位相の許容誤差(度)
+    nInitialPoints : int
+        最初の等間隔の周波数の点数
+    maxPoints : int
+        周波数の点数の上限
+    minInterval_Hz : float
+        これより狭い区間は分割しない
+
+    Returns
+    -------
+    frequencies_Hz : ndarray
+        非等間隔の周波数(Hz)の配列(昇順)
+    tfs : ndarray
+        各周波数の伝達関数
+    """
+    frequencies_Hz = np.linspace(startFrequency_Hz, stopFrequency_Hz, nInitialPoints)
+    tfs = tfModules.createTransferFunctions(
+        frequencies_Hz, endCondition, cable, cache=None
+    )
+    # 分割の対象となる区間(i番目の区間はfrequencies_Hz[i]からfrequencies_Hz[i + 1]まで)
+    shouldRefine = np.ones(len(frequencies_Hz) - 1, dtype=bool)
+
+    while True:
+        intervals = np.diff(frequencies_Hz)
+        shouldRefine &= intervals > minInterval_Hz
+        indexes = np.flatnonzero(shouldRefine)
+        nRemainingPoints = maxPoints - len(frequencies_Hz)
+        if len(indexes) == 0 or nRemainingPoints <= 0:
+            break
+        if len(indexes) > nRemainingPoints:
+            # 点数の上限を超える場合は、幅の広い区間から優先して分割する
+            indexes = np.sort(
+                indexes[np.argsort(-intervals[indexes], kind="stable")][
+                    :nRemainingPoints
+                ]
+            )
+
+        frequencies_mid = (frequencies_Hz[indexes] + frequencies_Hz[indexes + 1]) / 2
+        tfs_mid = tfModules.createTransferFunctions(
+            frequencies_mid, endCondition, cable, cache=None
+        )
+        gainErrors_dB, phaseErrors_deg = _estimateErrors(
+            tfs[indexes], tfs_mid, tfs[indexes + 1]
+        )
+        isInaccurate = (gainErrors_dB > tolerance_dB) | (
+            phaseErrors_deg > tolerance_deg
+        )
+
+        # 中点を挿入し、誤差の大きかった区間から生まれた2つの区間を次の分割の対象にする
+        frequencies_Hz = np.insert(frequencies_Hz, indexes + 1, frequencies_mid)
+        tfs = np.insert(tfs, indexes + 1, tfs_mid)
+        nextShouldRefine = np.zeros(len(frequencies_Hz) - 1, dtype=bool)
+        newIndexes = indexes + np.arange(len(indexes))
+        nextShouldRefine[newIndexes] = isInaccurate
+        nextShouldRefine[newIndexes + 1] = isInaccurate
+        shouldRefine = nextShouldRefine
+
+    return frequencies_Hz, tfs
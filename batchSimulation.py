@@ -0,0 +1,111 @@
+import numpy as np
+
+import fftContext
+import fMatrix
+from sweep import LabeledArray
+
+# 出力する電圧の種類(C1: 受電端の電圧, C2: 送電端の電圧)
+PROBES = ("outputVoltage", "inputVoltage")
+
+
+def calcBatchTransferFunctions(
+    frequencies_Hz, cable, endConditions, sourceImpedance=50
+):
+    """
+    受電端の条件ごとに、電源電圧から受電端・送電端の電圧への伝達関数を一括で求める
+
+    受電端の電圧はH = 1 / (A + B / R2 + R1 * C + (R1 / R2) * D)、
+    送電端の電圧はZ11 / (R1 + Z11) (Z11は送電端から見たインピーダンス)で求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    endConditions : list
+        受電端の抵抗の条件のリスト
+    sourceImpedance : float
+        電源の内部インピーダンス
+
+    Returns
+    -------
+    tfs : ndarray
+        形状が(len(PROBES), len(endConditions), len(frequencies_Hz))の伝達関数
+    """
+    # F行列は受電端の条件に依存しないため、1回だけ求めて共有する
+    f_matrixes = fMatrix.FMatrixes.fromCable(frequencies_Hz, cable)
+    Z0 = cable.calcCharacteristicImpedances(frequencies_Hz)
+
+    tfs = np.empty((len(PROBES), len(endConditions), len(f_matrixes)), dtype=complex)
+    for i, endCondition in enumerate(endConditions):
+        if endCondition["shouldMatching"]:
+            endImpedances = Z0
+        else:
+            endImpedances = endCondition["impedance"]
+        Z11 = f_matrixes.calcInputImpedances(endImpedances)
+        tfs[0, i] = f_matrixes.calcTransferFunctions(endImpedances, sourceImpedance)
+        tfs[1, i] = Z11 / (sourceImpedance + Z11)
+    return tfs
+
+
+def simulateBatch(
+    times,
+    inputWaves,
+    cable,
+    endConditions,
+    waveNames=None,
+    sourceImpedance=50,
+    context=None,
+):
+    """
+    複数の入力波形と受電端の条件のすべての組み合わせについて、受電端・送電端の電圧波形を一括で求める
+
+    入力波形は1回の2次元rfftでまとめて変換し、伝達関数との積を
+    (電圧の種類, 受電端の条件, 入力波形, 周波数)の配列として1回のirfftで逆変換する
+
+    Parameters
+    ----------
+    times : array_like
+        時刻(s)の配列(等間隔)
+    inputWaves : array_like
+        形状が(入力波形の数, len(times))の電源電圧の波形
+    cable : instance
+        Cableクラスのインスタンス
+    endConditions : list
+        受電端の抵抗の条件のリスト
+    waveNames : list
+        入力波形の名前(Noneの場合は番号)
+    sourceImpedance : float
+        電源の内部インピーダンス
+    context : instance
+        FftContextのインスタンス(Noneの場合は時間軸から取得する)
+
+    Returns
+    -------
+    waves : LabeledArray
+        軸が("probe", "endCondition", "wave", "time")の電圧波形
+    """
+    times = np.asarray(times, dtype=float)
+    inputWaves = np.atleast_2d(np.asarray(inputWaves, dtype=float))
+    if waveNames is None:
+        waveNames = list(range(len(inputWaves)))
+    if context is None:
+        context = fftContext.getFftContext(len(times), times[1] - times[0])
+
+    spectra = context.rfft(inputWaves)
+    tfs = calcBatchTransferFunctions(
+        context.frequencies, cable, endConditions, sourceImpedance
+    )
+    waves = context.applyTransferFunctions(spectra, tfs[:, :, np.newaxis, :])
+
+    return LabeledArray(
+        waves,
+        ("probe", "endCondition", "wave", "time"),
+        {
+            "probe": list(PROBES),
+            "endCondition": list(endConditions),
+            "wave": list(waveNames),
+            "time": times,
+        },
+    )
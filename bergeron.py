@@ -0,0 +1,214 @@
+import math
+
+import numpy as np
+
+
+def createVoltageSource(waves, resistance=50):
+    """
+    内部抵抗を持つ電圧源の端子条件を作成する
+
+    端子条件は (端子電圧v, 時刻のインデックスn) を受け取り、
+    (端子から線路に流れ込む電流i, di/dv) を返す関数
+
+    Parameters
+    ----------
+    waves : array_like
+        電源電圧(V)の配列
+    resistance : float
+        内部抵抗(Ω)
+    """
+    waves = np.asarray(waves, dtype=float)
+    conductance = 1 / resistance
+
+    def termination(voltage, n):
+        return (waves[n] - voltage) * conductance, -conductance
+
+    return termination
+
+
+def createResistorLoad(resistance):
+    """
+    抵抗の端子条件を作成する(np.infの場合は開放)
+
+    Parameters
+    ----------
+    resistance : float
+        抵抗値(Ω)
+    """
+    conductance = 0.0 if np.isinf(resistance) else 1 / resistance
+
+    def termination(voltage, n):
+        return -voltage * conductance, -conductance
+
+    return termination
+
+
+def createDiodeClampLoad(
+    resistance=1e6,
+    upperVoltage=3.3,
+    lowerVoltage=0.0,
+    saturationCurrent=1e-14,
+    thermalVoltage=0.02585,
+    emissionCoefficient=1.0,
+):
+    """
+    抵抗と、電源・GNDへのクランプダイオードを並列に接続した端子条件を作成する(非線形)
+
+    電圧がupperVoltageを超えると上側の、lowerVoltageを下回ると下側のダイオードが導通する
+
+    Parameters
+    ----------
+    resistance : float
+        端子の入力抵抗(Ω)
+    upperVoltage : float
+        上側のダイオードが接続された電源電圧(V)
+    lowerVoltage : float
+        下側のダイオードが接続された電圧(V)
+    saturationCurrent : float
+        ダイオードの飽和電流(A)
+    thermalVoltage : float
+        熱電圧(V)
+    emissionCoefficient : float
+        ダイオードの放出係数
+    """
+    conductance = 0.0 if np.isinf(resistance) else 1 / resistance
+    nVt = emissionCoefficient * thermalVoltage
+
+    def termination(voltage, n):
+        # exp(x)のオーバーフローを防ぐため、x > 40ではexp(40)での接線で近似する
+        upper = min((voltage - upperVoltage) / nVt, 40.0)
+        lower = min((lowerVoltage - voltage) / nVt, 40.0)
+        upperExp = math.exp(upper)
+        lowerExp = math.exp(lower)
+        upperCurrent = saturationCurrent * (
+            upperExp * (1 + (voltage - upperVoltage) / nVt - upper) - 1
+        )
+        lowerCurrent = saturationCurrent * (
+            lowerExp * (1 + (lowerVoltage - voltage) / nVt - lower) - 1
+        )
+        current = -voltage * conductance - upperCurrent + lowerCurrent
+        derivative = -conductance - saturationCurrent * (upperExp + lowerExp) / nVt
+        return current, derivative
+
+    return termination
+
+
+class BergeronLine:
+    """
+    特性法(Bergeron法)で分布定数線路の過渡応答を時間領域で直接計算するクラス
+
+    線路の両端では、端子電圧v, 線路に流れ込む電流iに対して
+    送り出す進行波 f = (v + Z0 * i) / 2、到来する進行波 g = (v - Z0 * i) / 2 とおくと、
+    g(t) = a * (反対側の端のf(t - τ)) が成り立つ
+    (τ = l * sqrt(LC), Z0 = sqrt(L / C))
+    損失は1回の伝搬あたりの減衰 a = exp(-(R / (2 * Z0) + G * Z0 / 2) * l) で近似する
+    (低損失線路の高周波近似で、分散は考慮しない)
+
+    Parameters
+    ----------
+    cable : instance
+        Cableクラスのインスタンス
+    """
+
+    def __init__(self, cable):  # イニシャライザ
+        self.cable = cable
+        L = cable.inductance
+        C = cable.capacitance
+        self.characteristicImpedance = math.sqrt(L / C)
+        self.delay = cable.length * math.sqrt(L * C)
+        self.attenuation = math.exp(
+            -(
+                cable.resistance / (2 * self.characteristicImpedance)
+                + cable.conductance * self.characteristicImpedance / 2
+            )
+            * cable.length
+        )
+
+    def simulate(
+        self,
+        sourceTermination,
+        loadTermination,
+        nSamples,
+        samplingPeriod,
+        tolerance=1e-12,
+        maxIterations=100,
+        maxStep=0.5,
+    ):
+        """
+        送電端・受電端の端子条件を与えて、両端の電圧・電流の波形を求める
+
+        遅延τは線形補間で扱うため、サンプリング周期の整数倍でなくてもよい
+        端子条件の式はニュートン法で解く(線形の端子条件は1回の反復で収束する)
+
+        Parameters
+        ----------
+        sourceTermination : callable
+            送電端の端子条件(createVoltageSourceなど)
+        loadTermination : callable
+            受電端の端子条件(createResistorLoad, createDiodeClampLoadなど)
+        nSamples : int
+            計算する時刻の点数
+        samplingPeriod : float
+            時間の刻み幅(s)
+        tolerance : float
+            ニュートン法の収束判定の電圧(V)
+        maxIterations : int
+            ニュートン法の反復回数の上限
+        maxStep : float
+            ニュートン法の1回の反復で電圧を変化させる上限(V, 非線形素子での発散を防ぐ)
+
+        Returns
+        -------
+        waves : dict
+            inputVoltage, inputCurrent, outputVoltage, outputCurrent の配列
+            (電流は端子から線路に流れ込む向きを正とする)
+        """
+        delaySamples = self.delay / samplingPeriod
+        if delaySamples < 1:
+            raise ValueError(
+                f"線路の遅延({self.delay}s)がサンプリング周期({samplingPeriod}s)より短いため計算できません"
+            )
+        delayIndex = int(math.floor(delaySamples))
+        fraction = delaySamples - delayIndex
+        Z0 = self.characteristicImpedance
+        a = self.attenuation
+
+        voltages = np.zeros((2, nSamples))
+        currents = np.zeros((2, nSamples))
+        outgoingWaves = np.zeros((2, nSamples))
+        terminations = (sourceTermination, loadTermination)
+
+        for n in range(nSamples):
+            for end in range(2):
+                # 反対側の端から時刻n - τに送り出された進行波を補間して求める
+                opposite = outgoingWaves[1 - end]
+                m = n - delayIndex
+                incoming = 0.0
+                if m >= 0:
+                    incoming = (1 - fraction) * opposite[m]
+                    if m - 1 >= 0:
+                        incoming += fraction * opposite[m - 1]
+                incoming *= a
+
+                # 線路側は 電圧源2g と 直列のZ0 と等価なので、i_term(v) = (v - 2g) / Z0 を解く
+                voltage = voltages[end, n - 1] if n > 0 else 0.0
+                for _ in range(maxIterations):
+                    current, derivative = terminations[end](voltage, n)
+                    residual = current - (voltage - 2 * incoming) / Z0
+                    step = -residual / (derivative - 1 / Z0)
+                    step = max(-maxStep, min(maxStep, step))
+                    voltage += step
+                    if abs(step) < tolerance:
+                        break
+
+                current = (voltage - 2 * incoming) / Z0
+                voltages[end, n] = voltage
+                currents[end, n] = current
+                outgoingWaves[end, n] = (voltage + Z0 * current) / 2
+
+        return {
+            "inputVoltage": voltages[0],
+            "inputCurrent": currents[0],
+            "outputVoltage": voltages[1],
+            "outputCurrent": currents[1],
+        }
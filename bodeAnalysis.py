@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+# drawBodeFromCsv.pyで山と谷を探す周波数の範囲(Hz)
+DEFAULT_BANDS = [(3e6, 17e6), (20e6, 35e6), (36e6, 49e6)]
+
+
+def readBodeCsv(path, skiprows=27):
+    """
+    オシロスコープのボード線図のCSVを読み込む
+
+    Parameters
+    ----------
+    path : string
+        CSVファイルのパス
+    skiprows : int
+        先頭のヘッダーの行数
+
+    Returns
+    -------
+    frequencies_Hz, amps, phases : ndarray
+        周波数(Hz), 振幅(dB), 位相(deg)の配列
+    """
+    df = pd.read_csv(path, skiprows=skiprows)
+    return (
+        df["Frequency(Hz)"].to_numpy(dtype=float),
+        df["CH1 Amplitude(dB)"].to_numpy(dtype=float),
+        df["CH1 Phase(Deg)"].to_numpy(dtype=float),
+    )
+
+
+def findPeakAndValley(frequencies_Hz, amps, startFrequency, stopFrequency):
+    """
+    指定した周波数の範囲で振幅が最大(山)・最小(谷)となる周波数を求める
+
+    範囲の端は、測定点のうち指定した周波数に最も近い点とする(終端の点は含まない)
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    amps : array_like
+        振幅(dB)の配列
+    startFrequency : float
+        範囲の開始周波数(Hz)
+    stopFrequency : float
+        範囲の終了周波数(Hz)
+    """
+    frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+    amps = np.asarray(amps, dtype=float)
+    firstIndex = int(np.abs(frequencies_Hz - startFrequency).argmin())
+    lastIndex = int(np.abs(frequencies_Hz - stopFrequency).argmin())
+    maxAmpIndex = firstIndex + int(np.argmax(amps[firstIndex:lastIndex]))
+    minAmpIndex = firstIndex + int(np.argmin(amps[firstIndex:lastIndex]))
+    return {
+        "peakFrequency": frequencies_Hz[maxAmpIndex],
+        "peakAmp": amps[maxAmpIndex],
+        "valleyFrequency": frequencies_Hz[minAmpIndex],
+        "valleyAmp": amps[minAmpIndex],
+    }
+
+
+def analyzePeaks(frequencies_Hz, amps, bands=DEFAULT_BANDS):
+    """
+    周波数の範囲ごとに山と谷を求め、山の間隔の平均を求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    amps : array_like
+        振幅(dB)の配列
+    bands : list
+        (開始周波数, 終了周波数)のリスト
+
+    Returns
+    -------
+    result : dict
+        peakFrequencies, valleyFrequencies(それぞれ範囲ごとの配列)と
+        averagePeakInterval(隣り合う山の間隔の平均, Hz)
+    """
+    peaks = [findPeakAndValley(frequencies_Hz, amps, *band) for band in bands]
+    peakFrequencies = np.array([peak["peakFrequency"] for peak in peaks])
+    valleyFrequencies = np.array([peak["valleyFrequency"] for peak in peaks])
+    intervals = np.diff(peakFrequencies)
+    return {
+        "peakFrequencies": peakFrequencies,
+        "peakAmps": np.array([peak["peakAmp"] for peak in peaks]),
+        "valleyFrequencies": valleyFrequencies,
+        "valleyAmps": np.array([peak["valleyAmp"] for peak in peaks]),
+        "averagePeakInterval": float(np.mean(intervals)) if len(intervals) else 0.0,
+    }
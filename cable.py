@@ -20,6 +20,256 @@ class Cable:
             / (self.conductance + 1j * omega * self.capacitance)
         )
 
+    def calcCharacteristicImpedances(self, frequencies_Hz):
+        """
+        周波数の配列に対する特性インピーダンスを一括で求める
+
+        Parameters
+        ----------
+        frequencies_Hz : array_like
+            周波数(Hz)の配列
+        """
+        omegas = 2 * np.pi * np.asarray(frequencies_Hz, dtype=float)
+        omegas = np.where(omegas == 0, 1e-8, omegas)  # ZeroDivisionError回避
+        return np.sqrt(
+            (self.resistance + 1j * omegas * self.inductance)
+            / (self.conductance + 1j * omegas * self.capacitance)
+        )
+
+
+# CableArrayで使用する構造化配列の型(Cableクラスの属性と同じ名前の列を持つ)
+CABLE_DTYPE = np.dtype(
+    [
+        ("resistance", float),
+        ("inductance", float),
+        ("conductance", float),
+        ("capacitance", float),
+        ("length", float),
+    ]
+)
+
+
+class CableView:
+    """
+    CableArrayの1要素を参照するビュー
+
+    値は元の構造化配列に保持されたまま参照するため、Cableインスタンスのようにメモリを確保しない
+    Cableクラスと同じ属性・メソッドを持つので、Cableインスタンスの代わりに使用できる
+    """
+
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, records, index):  # イニシャライザ
+        self._records = records
+        self._index = index
+
+    def _get(name):
+        return property(
+            lambda self: float(self._records[name][self._index]),
+            lambda self, value: self._records[name].__setitem__(self._index, value),
+        )
+
+    resistance = _get("resistance")
+    inductance = _get("inductance")
+    conductance = _get("conductance")
+    capacitance = _get("capacitance")
+    length = _get("length")
+    del _get
+
+    calcCharacteristicImpedance = Cable.calcCharacteristicImpedance
+    calcCharacteristicImpedances = Cable.calcCharacteristicImpedances
+
+    def __repr__(self):
+        return (
+            f"CableView(resistance={self.resistance}, inductance={self.inductance}, "
+            f"conductance={self.conductance}, capacitance={self.capacitance}, "
+            f"length={self.length})"
+        )
+
+
+class CableArray:
+    """
+    多数のケーブルのR, L, G, C, 長さを1つの構造化配列で保持するクラス
+
+    Parameters
+    ----------
+    records : ndarray
+        CABLE_DTYPE型の1次元の構造化配列
+    """
+
+    def __init__(self, records):  # イニシャライザ
+        records = np.asarray(records)
+        if records.dtype != CABLE_DTYPE or records.ndim != 1:
+            raise ValueError("recordsはCABLE_DTYPE型の1次元配列である必要があります")
+        self.records = records
+
+    @classmethod
+    def fromParameters(
+        cls, resistances, inductances, conductances, capacitances, lengths
+    ):
+        """
+        各パラメータの配列(またはスカラー)からCableArrayを作成する(長さはブロードキャストして揃える)
+        """
+        columns = np.broadcast_arrays(
+            *[
+                np.atleast_1d(np.asarray(values, dtype=float))
+                for values in (
+                    resistances,
+                    inductances,
+                    conductances,
+                    capacitances,
+                    lengths,
+                )
+            ]
+        )
+        records = np.empty(len(columns[0]), dtype=CABLE_DTYPE)
+        for name, values in zip(CABLE_DTYPE.names, columns):
+            records[name] = values
+        return cls(records)
+
+    @classmethod
+    def fromCables(cls, cables):
+        """
+        Cableインスタンスのリストから CableArray を作成する
+        """
+        return cls(
+            np.array(
+                [
+                    (
+                        cable.resistance,
+                        cable.inductance,
+                        cable.conductance,
+                        cable.capacitance,
+                        cable.length,
+                    )
+                    for cable in cables
+                ],
+                dtype=CABLE_DTYPE,
+            )
+        )
+
+    @property
+    def resistances(self):
+        return self.records["resistance"]
+
+    @property
+    def inductances(self):
+        return self.records["inductance"]
+
+    @property
+    def conductances(self):
+        return self.records["conductance"]
+
+    @property
+    def capacitances(self):
+        return self.records["capacitance"]
+
+    @property
+    def lengths(self):
+        return self.records["length"]
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self.records)
+            if not 0 <= index < len(self.records):
+                raise IndexError(f"インデックスが範囲外です: {index}")
+            return CableView(self.records, index)
+        return CableArray(self.records[index])
+
+    def __iter__(self):
+        for index in range(len(self.records)):
+            yield CableView(self.records, index)
+
+    def _toGrid(self, frequencies_Hz):
+        # (ケーブル, 周波数)の格子に展開するため、ケーブルの列を縦ベクトルにする
+        omegas = 2 * np.pi * np.asarray(frequencies_Hz, dtype=float)
+        R = self.resistances[:, np.newaxis]
+        L = self.inductances[:, np.newaxis]
+        G = self.conductances[:, np.newaxis]
+        C = self.capacitances[:, np.newaxis]
+        return omegas, R, L, G, C
+
+    def calcCharacteristicImpedances(self, frequencies_Hz):
+        """
+        (ケーブル, 周波数)の格子について特性インピーダンスを一括で求める
+
+        Parameters
+        ----------
+        frequencies_Hz : array_like
+            周波数(Hz)の配列
+
+        Returns
+        -------
+        Z0 : ndarray
+            形状が(ケーブルの数, 周波数の数)の特性インピーダンスの配列
+        """
+        omegas, R, L, G, C = self._toGrid(frequencies_Hz)
+        omegas = np.where(omegas == 0, 1e-8, omegas)  # ZeroDivisionError回避
+        return np.sqrt((R + 1j * omegas * L) / (G + 1j * omegas * C))
+
+    def calcGammas(self, frequencies_Hz):
+        """
+        (ケーブル, 周波数)の格子について伝搬定数γを一括で求める
+
+        Parameters
+        ----------
+        frequencies_Hz : array_like
+            周波数(Hz)の配列
+        """
+        omegas, R, L, G, C = self._toGrid(frequencies_Hz)
+        return np.sqrt((R + 1j * omegas * L) * (G + 1j * omegas * C))
+
+    def calculateThetas(self, frequencies_Hz):
+        """
+        (ケーブル, 周波数)の格子について伝搬定数γと同軸ケーブルの長さlの積を一括で求める
+
+        Parameters
+        ----------
+        frequencies_Hz : array_like
+            周波数(Hz)の配列
+        """
+        return self.calcGammas(frequencies_Hz) * self.lengths[:, np.newaxis]
+
+    def calcTransferFunctions(
+        self, frequencies_Hz, endCondition, maxChunkElements=2 ** 20
+    ):
+        """
+        (ケーブル, 周波数)の格子について、受電端に抵抗を接続した分布定数回路の伝達関数を求める
+
+        Parameters
+        ----------
+        frequencies_Hz : array_like
+            周波数(Hz)の配列
+        endCondition: dict
+            受電端の抵抗の条件
+        maxChunkElements : int
+            一度に計算する要素数の上限(ケーブルの軸で分割して中間配列のメモリ使用量を抑える)
+        """
+        frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+        tfs = np.empty((len(self), len(frequencies_Hz)), dtype=complex)
+        chunkSize = max(maxChunkElements // max(len(frequencies_Hz), 1), 1)
+        for start in range(0, len(self), chunkSize):
+            cables = self[start : start + chunkSize]
+            Z0 = cables.calcCharacteristicImpedances(frequencies_Hz)
+            thetas = cables.calculateThetas(frequencies_Hz)
+            cosh = np.cosh(thetas)
+            sinh = np.sinh(thetas)
+
+            if endCondition["shouldMatching"]:
+                R2 = Z0
+            else:
+                R2 = endCondition["impedance"]
+            R1 = 50
+
+            tfs[start : start + chunkSize] = 1 / (
+                cosh + Z0 * sinh / R2 + R1 * sinh / Z0 + (R1 / R2) * cosh
+            )
+        return tfs
+
 
 # 損失有りのケーブル
 # RG58A/U
@@ -0,0 +1,203 @@
+import numpy as np
+
+import fftContext
+import scopeCsv
+
+# 真空中の光速(m/s)
+SPEED_OF_LIGHT = 299792458
+
+
+def calcCrossCorrelations(references, delayeds):
+    """
+    FFTで相互相関r[k] = Σ reference[n] * delayed[n + k]を一括で求める
+
+    巡回の影響が出ないよう、2 * 標本数 - 1以上の高速に計算できる長さまでゼロ詰めする
+
+    Parameters
+    ----------
+    references : array_like
+        形状が(..., 標本数)の基準の波形
+    delayeds : array_like
+        形状が(..., 標本数)の遅れた波形
+
+    Returns
+    -------
+    correlations : ndarray
+        形状が(..., nFft)の相互相関(遅れkは添字k, 負の遅れは末尾から並ぶ)
+    """
+    references = np.asarray(references, dtype=float)
+    delayeds = np.asarray(delayeds, dtype=float)
+    nSamples = references.shape[-1]
+    if delayeds.shape[-1] != nSamples:
+        raise ValueError(
+            f"波形の標本数が一致しません: {nSamples} != {delayeds.shape[-1]}"
+        )
+
+    nFft = fftContext.calcFastLength(2 * nSamples - 1)
+    fft = fftContext.getFftContext(nFft, 1, padToFastLength=False)
+    padding = [(0, 0)] * (references.ndim - 1) + [(0, nFft - nSamples)]
+    referenceSpectra = fft.rfft(np.pad(references, padding))
+    padding = [(0, 0)] * (delayeds.ndim - 1) + [(0, nFft - nSamples)]
+    delayedSpectra = fft.rfft(np.pad(delayeds, padding))
+    return fft.irfft(np.conj(referenceSpectra) * delayedSpectra)
+
+
+def estimateDelays(references, delayeds, samplingPeriod, useEdges=True):
+    """
+    相互相関のピークを放物線で補間し、標本間隔より細かい精度で遅延時間を求める
+
+    Parameters
+    ----------
+    references : array_like
+        形状が(..., 標本数)の基準の波形(例: 送電端の電圧C2)
+    delayeds : array_like
+        形状が(..., 標本数)の遅れた波形(例: 受電端の電圧C1)
+    samplingPeriod : float or array_like
+        サンプリング周期(s, 波形ごとに異なる場合はバッチの形状の配列)
+    useEdges : bool
+        Trueの場合、波形の差分(立ち上がり・立ち下がり)どうしの相関を求める
+        (振幅の違いや直流成分の影響を受けにくい)
+
+    Returns
+    -------
+    delays : ndarray
+        delayedsがreferencesより遅れている時間(s)
+    """
+    references = np.asarray(references, dtype=float)
+    delayeds = np.asarray(delayeds, dtype=float)
+    if useEdges:
+        references = np.diff(references, axis=-1)
+        delayeds = np.diff(delayeds, axis=-1)
+    correlations = calcCrossCorrelations(references, delayeds)
+    nFft = correlations.shape[-1]
+
+    peakIndexes = np.argmax(correlations, axis=-1)[..., np.newaxis]
+    y0 = np.take_along_axis(correlations, peakIndexes, axis=-1)[..., 0]
+    yMinus = np.take_along_axis(correlations, (peakIndexes - 1) % nFft, axis=-1)[..., 0]
+    yPlus = np.take_along_axis(correlations, (peakIndexes + 1) % nFft, axis=-1)[..., 0]
+    # 隣り合う3点を通る放物線の頂点の位置(曲率が0の場合は補間しない)
+    curvatures = yMinus - 2 * y0 + yPlus
+    offsets = np.divide(
+        0.5 * (yMinus - yPlus),
+        curvatures,
+        out=np.zeros_like(curvatures),
+        where=curvatures != 0,
+    )
+
+    # nFft / 2以上の添字は負の遅れを表す
+    lags = peakIndexes[..., 0]
+    lags = np.where(lags >= nFft // 2, lags - nFft, lags)
+    return (lags + offsets) * samplingPeriod
+
+
+def estimateCableParameters(c1Waves, c2Waves, samplingPeriod, length=6):
+    """
+    受電端(C1)と送電端(C2)の電圧波形の遅延時間から、ケーブルの伝搬特性を求める
+
+    Parameters
+    ----------
+    c1Waves : array_like
+        形状が(..., 標本数)の受電端の電圧波形
+    c2Waves : array_like
+        形状が(..., 標本数)の送電端の電圧波形
+    samplingPeriod : float or array_like
+        サンプリング周期(s)
+    length : float
+        ケーブルの物理的な長さ(m)
+
+    Returns
+    -------
+    result : dict
+        delay: 遅延時間τ(s), sqrtLC: √(LC) = τ / l(s/m), velocity: 伝搬速度(m/s),
+        velocityFactor: 光速に対する伝搬速度の比, electricalLength: 電気長c * τ(m),
+        peakInterval: 開放条件の共振周波数の間隔1 / (2τ)(Hz, drawBodeFromCsvの値に対応)
+    """
+    delays = estimateDelays(c2Waves, c1Waves, samplingPeriod)
+    velocities = length / delays
+    return {
+        "delay": delays,
+        "sqrtLC": delays / length,
+        "velocity": velocities,
+        "velocityFactor": velocities / SPEED_OF_LIGHT,
+        "electricalLength": SPEED_OF_LIGHT * delays,
+        "peakInterval": 1 / (2 * delays),
+    }
+
+
+def readCaptures(paths):
+    """
+    オシロスコープのCSVを読み込み、長さを揃えた波形の配列とサンプリング周期を返す
+
+    短い波形は最後の値を繰り返して延ばす(差分が0になるため遅延時間の推定に影響しない)
+
+    Parameters
+    ----------
+    paths : list
+        CSVファイルのパスのリスト
+
+    Returns
+    -------
+    waves : ndarray
+        形状が(len(paths), 最長の標本数)の電圧波形
+    samplingPeriods : ndarray
+        ファイルごとのサンプリング周期(s, ヘッダーのSample Interval)
+    """
+    captures = [scopeCsv.readScopeCsv(path) for path in paths]
+    nSamples = max(len(capture) for capture in captures)
+    waves = np.array(
+        [
+            np.pad(capture.values, (0, nSamples - len(capture)), mode="edge")
+            for capture in captures
+        ]
+    )
+    return waves, np.array([capture.metadata.sampleInterval for capture in captures])
+
+
+def estimateCableParametersFromCsv(c1Paths, c2Paths, length=6):
+    """
+    C1, C2のCSVの組(例: c1_200ns_open.csv, c2_200ns_open.csv)からケーブルの伝搬特性を一括で求める
+
+    Parameters
+    ----------
+    c1Paths : list
+        受電端の電圧波形のCSVファイルのパスのリスト
+    c2Paths : list
+        c1Pathsと同じ順序で並べた送電端の電圧波形のCSVファイルのパスのリスト
+    length : float
+        ケーブルの物理的な長さ(m)
+    """
+    if len(c1Paths) != len(c2Paths):
+        raise ValueError("C1とC2のファイルの数が一致しません")
+    c1Waves, c1SamplingPeriods = readCaptures(c1Paths)
+    c2Waves, c2SamplingPeriods = readCaptures(c2Paths)
+    if not np.allclose(c1SamplingPeriods, c2SamplingPeriods):
+        raise ValueError("C1とC2のサンプリング周期が一致しません")
+
+    # C1とC2の組ごとに長さが異なる場合があるため、長い方に揃える
+    nSamples = max(c1Waves.shape[-1], c2Waves.shape[-1])
+    c1Waves = np.pad(c1Waves, [(0, 0), (0, nSamples - c1Waves.shape[-1])], "edge")
+    c2Waves = np.pad(c2Waves, [(0, 0), (0, nSamples - c2Waves.shape[-1])], "edge")
+    return estimateCableParameters(c1Waves, c2Waves, c1SamplingPeriods, length)
+
+
+def estimateTimeOffset(referenceTimes, referenceWaves, times, waves):
+    """
+    測定した波形がシミュレーションの波形に対して遅れている時間を求める
+
+    時間軸が異なる場合に備えて、基準の波形を測定した波形の時刻に線形補間してから比較する
+
+    Parameters
+    ----------
+    referenceTimes : array_like
+        基準の波形(シミュレーション)の時刻(s)の配列
+    referenceWaves : array_like
+        基準の波形
+    times : array_like
+        測定した波形の時刻(s)の配列(等間隔)
+    waves : array_like
+        測定した波形
+    """
+    times = np.asarray(times, dtype=float)
+    samplingPeriod = (times[-1] - times[0]) / (len(times) - 1)
+    references = np.interp(times, referenceTimes, referenceWaves)
+    return float(estimateDelays(references, waves, samplingPeriod))
@@ -0,0 +1,151 @@
+import numpy as np
+
+import transferFunction as tfModules
+
+
+def isUniformGrid(frequencies_Hz, rtol=1e-9):
+    """
+    周波数の配列が等間隔かどうかを判定する
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    rtol : float
+        間隔のばらつきの許容誤差(間隔に対する比)
+    """
+    frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+    if len(frequencies_Hz) < 3:
+        return True
+    intervals = np.diff(frequencies_Hz)
+    return bool(np.all(np.abs(intervals - intervals[0]) <= rtol * abs(intervals[0])))
+
+
+def _calcExpsByRecurrence(thetas_anchor, thetas_mid, thetas_end, blockSize):
+    # ブロック内のθ(k)を θ0 + a * k + b * k^2 で近似し(k = 0, blockSize / 2, blockSize の値から係数を決める)、
+    # exp(θ(k + 1)) = exp(θ(k)) * R(k), R(k + 1) = R(k) * exp(2b) の漸化式でexp(θ)とexp(-θ)を求める
+    m = blockSize / 2
+    b = ((thetas_end - thetas_anchor) - 2 * (thetas_mid - thetas_anchor)) / (
+        blockSize ** 2 / 2
+    )
+    a = (thetas_mid - thetas_anchor) / m - b * m
+
+    # ブロックの先頭だけexpを計算する(再アンカーにより誤差の蓄積をブロック内に抑える)
+    exps = np.exp(thetas_anchor)
+    expsInv = 1 / exps
+    ratios = np.exp(a + b)
+    ratiosInv = 1 / ratios
+    ratioSteps = np.exp(2 * b)
+    ratioStepsInv = 1 / ratioSteps
+
+    expsByBlock = np.empty((len(thetas_anchor), blockSize), dtype=complex)
+    expsInvByBlock = np.empty((len(thetas_anchor), blockSize), dtype=complex)
+    for k in range(blockSize):
+        expsByBlock[:, k] = exps
+        expsInvByBlock[:, k] = expsInv
+        exps = exps * ratios
+        expsInv = expsInv * ratiosInv
+        ratios = ratios * ratioSteps
+        ratiosInv = ratiosInv * ratioStepsInv
+    return expsByBlock.ravel(), expsInvByBlock.ravel()
+
+
+def calcCoshSinhByRecurrence(frequencies_Hz, cable, blockSize=64, tolerance=1e-9):
+    """
+    等間隔の周波数の配列について、cosh(γl)とsinh(γl)を乗算の漸化式で求める
+
+    無損失線路ではγlが周波数に比例するため、exp(γl)は等比数列になる
+    損失のある線路でもブロック内のγlを2次式で近似して漸化式を適用し、
+    blockSize点ごとにexpを厳密に計算し直して誤差が蓄積しないようにする
+    低周波数域などで2次式の近似誤差がtoleranceを超えるブロックは、expで厳密に計算する
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        等間隔の周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    blockSize : int
+        expを厳密に計算し直す間隔(点数)
+    tolerance : float
+        ブロック内のγlの2次式による近似誤差の許容値(k = blockSize / 4 の点で評価する)
+
+    Returns
+    -------
+    cosh, sinh : ndarray
+        cosh(γl), sinh(γl)の配列
+    """
+    frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+    if not isUniformGrid(frequencies_Hz):
+        raise ValueError("周波数の配列が等間隔ではありません")
+
+    exps = np.empty(len(frequencies_Hz), dtype=complex)
+    expsInv = np.empty(len(frequencies_Hz), dtype=complex)
+
+    # 直流ではγlが周波数に対して滑らかでないため、厳密に計算する
+    start = 0
+    if len(frequencies_Hz) > 0 and frequencies_Hz[0] == 0:
+        theta = tfModules.calculateTheta(0, cable)
+        exps[0] = np.exp(theta)
+        expsInv[0] = 1 / exps[0]
+        start = 1
+
+    nPoints = len(frequencies_Hz) - start
+    if nPoints > 0:
+        interval = frequencies_Hz[1] - frequencies_Hz[0] if nPoints > 1 else 0.0
+        nBlocks = -(-nPoints // blockSize)
+        anchors = frequencies_Hz[start] + interval * blockSize * np.arange(nBlocks)
+        thetas_anchor = tfModules.calculateThetas(anchors, cable)
+        thetas_mid = tfModules.calculateThetas(
+            anchors + interval * blockSize / 2, cable
+        )
+        thetas_end = tfModules.calculateThetas(anchors + interval * blockSize, cable)
+        exps_recurrence, expsInv_recurrence = _calcExpsByRecurrence(
+            thetas_anchor, thetas_mid, thetas_end, blockSize
+        )
+
+        # 2次式の近似誤差をブロックの1/4の点で確認し、許容値を超えるブロックは厳密に計算する
+        quarter = blockSize / 4
+        thetas_quarter = tfModules.calculateThetas(anchors + interval * quarter, cable)
+        thetas_fitted = (
+            thetas_anchor + (6 * thetas_mid - 5 * thetas_anchor - thetas_end) / 8
+        )
+        indexes = np.arange(nBlocks * blockSize).reshape(nBlocks, blockSize)
+        indexes = indexes[np.abs(thetas_quarter - thetas_fitted) > tolerance].ravel()
+        indexes = indexes[indexes < nPoints]
+        thetas_exact = tfModules.calculateThetas(frequencies_Hz[start + indexes], cable)
+        exps_recurrence[indexes] = np.exp(thetas_exact)
+        expsInv_recurrence[indexes] = np.exp(-thetas_exact)
+
+        exps[start:] = exps_recurrence[:nPoints]
+        expsInv[start:] = expsInv_recurrence[:nPoints]
+
+    return (exps + expsInv) / 2, (exps - expsInv) / 2
+
+
+def createFMatrixesForDccOnUniformGrid(
+    frequencies_Hz, cable, blockSize=64, tolerance=1e-9
+):
+    """
+    等間隔の周波数の配列について、分布定数回路のF行列を漸化式を用いて一括で求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        等間隔の周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    blockSize : int
+        expを厳密に計算し直す間隔(点数)
+    tolerance : float
+        ブロック内のγlの2次式による近似誤差の許容値
+    """
+    cosh, sinh = calcCoshSinhByRecurrence(frequencies_Hz, cable, blockSize, tolerance)
+    Z0 = cable.calcCharacteristicImpedances(frequencies_Hz)
+
+    f_matrixes = np.empty(cosh.shape + (2, 2), dtype=complex)
+    f_matrixes[..., 0, 0] = cosh
+    f_matrixes[..., 0, 1] = Z0 * sinh
+    f_matrixes[..., 1, 0] = sinh / Z0
+    f_matrixes[..., 1, 1] = cosh
+    return f_matrixes
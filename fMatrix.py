@@ -0,0 +1,197 @@
+import numpy as np
+
+import transferFunction as tfModules
+
+
+class FMatrixes:
+    """
+    周波数ごとのF行列を形状(..., 2, 2)の連続した複素数配列として保持するクラス
+
+    先頭の軸は周波数(必要に応じてケーブルや条件の軸を追加してもよい)で、
+    縦続接続・逆行列・伝達関数への変換をすべて配列演算で行う
+    """
+
+    def __init__(self, matrixes):  # イニシャライザ
+        matrixes = np.ascontiguousarray(matrixes, dtype=complex)
+        if matrixes.shape[-2:] != (2, 2):
+            raise ValueError(
+                f"F行列の形状は(..., 2, 2)である必要があります: {matrixes.shape}"
+            )
+        self.matrixes = matrixes
+
+    @classmethod
+    def fromCable(cls, frequencies_Hz, cable):
+        """
+        分布定数線路のF行列を周波数の配列に対して一括で作成する
+
+        Parameters
+        ----------
+        frequencies_Hz : array_like
+            周波数(Hz)の配列
+        cable : instance
+            Cableクラスのインスタンス
+        """
+        return cls(
+            tfModules.createFMatrixesForDcc(
+                frequencies_Hz,
+                tfModules.calculateThetas(frequencies_Hz, cable),
+                cable,
+            )
+        )
+
+    @classmethod
+    def fromSeriesImpedances(cls, impedances):
+        """
+        直列に挿入したインピーダンスZのF行列 [[1, Z], [0, 1]] を作成する
+
+        Parameters
+        ----------
+        impedances : array_like
+            周波数ごとのインピーダンス(Ω)
+        """
+        impedances = np.asarray(impedances, dtype=complex)
+        matrixes = np.zeros(impedances.shape + (2, 2), dtype=complex)
+        matrixes[..., 0, 0] = 1
+        matrixes[..., 0, 1] = impedances
+        matrixes[..., 1, 1] = 1
+        return cls(matrixes)
+
+    @classmethod
+    def fromShuntAdmittances(cls, admittances):
+        """
+        並列に挿入したアドミタンスYのF行列 [[1, 0], [Y, 1]] を作成する
+
+        Parameters
+        ----------
+        admittances : array_like
+            周波数ごとのアドミタンス(S)
+        """
+        admittances = np.asarray(admittances, dtype=complex)
+        matrixes = np.zeros(admittances.shape + (2, 2), dtype=complex)
+        matrixes[..., 0, 0] = 1
+        matrixes[..., 1, 0] = admittances
+        matrixes[..., 1, 1] = 1
+        return cls(matrixes)
+
+    @classmethod
+    def fromSeriesInductance(cls, frequencies_Hz, inductance):
+        """
+        直列インダクタンスL(H)のF行列を作成する
+        """
+        omegas = 2 * np.pi * np.asarray(frequencies_Hz, dtype=float)
+        return cls.fromSeriesImpedances(1j * omegas * inductance)
+
+    @classmethod
+    def fromShuntCapacitance(cls, frequencies_Hz, capacitance):
+        """
+        並列キャパシタンスC(F)のF行列を作成する
+        """
+        omegas = 2 * np.pi * np.asarray(frequencies_Hz, dtype=float)
+        return cls.fromShuntAdmittances(1j * omegas * capacitance)
+
+    @property
+    def shape(self):
+        return self.matrixes.shape[:-2]
+
+    def __len__(self):
+        return len(self.matrixes)
+
+    def __getitem__(self, index):
+        return FMatrixes(self.matrixes[index])
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.matrixes
+        return self.matrixes.astype(dtype)
+
+    def __matmul__(self, other):
+        return self.cascade(other)
+
+    def cascade(self, other):
+        """
+        後段に二端子対回路を縦続接続したF行列を求める(周波数の軸でまとめて行列積を計算する)
+
+        Parameters
+        ----------
+        other : instance or ndarray
+            後段に接続するFMatrixesのインスタンス、または形状(..., 2, 2)の配列
+        """
+        return FMatrixes(np.matmul(self.matrixes, np.asarray(other)))
+
+    def power(self, n):
+        """
+        同じ二端子対回路をn段縦続接続したF行列を求める
+
+        Parameters
+        ----------
+        n : int
+            縦続接続する段数
+        """
+        return FMatrixes(np.linalg.matrix_power(self.matrixes, n))
+
+    def inv(self):
+        """
+        F行列の逆行列を求める(2×2の公式を配列に対して適用する)
+        """
+        A, B, C, D = self.entries()
+        det = A * D - B * C
+        matrixes = np.empty_like(self.matrixes)
+        matrixes[..., 0, 0] = D / det
+        matrixes[..., 0, 1] = -B / det
+        matrixes[..., 1, 0] = -C / det
+        matrixes[..., 1, 1] = A / det
+        return FMatrixes(matrixes)
+
+    def entries(self):
+        """
+        F行列の各要素A, B, C, Dを配列として返す
+        """
+        return (
+            self.matrixes[..., 0, 0],
+            self.matrixes[..., 0, 1],
+            self.matrixes[..., 1, 0],
+            self.matrixes[..., 1, 1],
+        )
+
+    def calcInputImpedances(self, endImpedances):
+        """
+        受電端にインピーダンスを接続したときの送電端から見たインピーダンスを求める
+
+        Parameters
+        ----------
+        endImpedances : float or ndarray
+            受電端のインピーダンス
+        """
+        A, B, C, D = self.entries()
+        return (A * endImpedances + B) / (C * endImpedances + D)
+
+    def calcTransferFunctions(self, endImpedances, sourceImpedance=50):
+        """
+        送電端に内部インピーダンスを持つ電源、受電端に抵抗を接続したときの伝達関数を求める
+
+        Parameters
+        ----------
+        endImpedances : float or ndarray
+            受電端のインピーダンス
+        sourceImpedance : float or ndarray
+            電源の内部インピーダンス
+        """
+        A, B, C, D = self.entries()
+        R1 = sourceImpedance
+        R2 = endImpedances
+        return 1 / (A + B / R2 + R1 * C + (R1 / R2) * D)
+
+
+def cascadeFMatrixes(*fMatrixes):
+    """
+    複数の二端子対回路を前段から順に縦続接続したF行列を求める
+
+    Parameters
+    ----------
+    fMatrixes : instance
+        前段から順に並べたFMatrixesのインスタンス
+    """
+    result = fMatrixes[0]
+    for fMatrix in fMatrixes[1:]:
+        result = result.cascade(fMatrix)
+    return result
@@ -0,0 +1,220 @@
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import scipy.fft as scipyFft
+except ImportError:  # scipyがインストールされていない場合はnumpy.fftを使用する
+    scipyFft = None
+
+isScipyFftAvailable = scipyFft is not None
+
+# 使い回すFftContextの数と、FftContextごとに保持する作業用の配列(バッチの形状)の数の上限
+MAX_CONTEXTS = 8
+MAX_BUFFERS = 4
+
+
+def _getOrCreate(cache, key, create, maxEntries):
+    # 最後に使われた順に並べたOrderedDictから取り出し、上限を超えたら古いものから削除する
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+        return value
+    value = create()
+    cache[key] = value
+    while len(cache) > maxEntries:
+        cache.popitem(last=False)
+    return value
+
+
+def calcFastLength(nSamples):
+    """
+    nSamples以上で、実数FFTを高速に計算できる長さ(小さな素因数のみを持つ長さ)を返す
+
+    Parameters
+    ----------
+    nSamples : int
+        標本数
+    """
+    if isScipyFftAvailable:
+        return scipyFft.next_fast_len(nSamples, real=True)
+    # 2, 3, 5の積で表されるnSamples以上の最小の数を探す
+    length = nSamples
+    while True:
+        remainder = length
+        for factor in (2, 3, 5):
+            while remainder % factor == 0:
+                remainder //= factor
+        if remainder == 1:
+            return length
+        length += 1
+
+
+class FftContext:
+    """
+    同じ時間軸で繰り返し行う波形のシミュレーションのためのFFTの計算環境
+
+    周波数の配列の保持、作業用の配列の再利用、必要に応じて高速に計算できる変換長までのゼロ詰めを行う
+    scipy.fftがあれば複数のスレッド(workers)で変換し、なければnumpy.fftを使用する
+    (scipy.fft, numpy.fftはいずれも変換長ごとの計画を内部にキャッシュしている)
+
+    Parameters
+    ----------
+    nSamples : int
+        入力波形の標本数
+    samplingPeriod : float
+        サンプリング周期(s)
+    padToFastLength : bool
+        Trueの場合、変換長を高速に計算できる長さまでゼロ詰めして延ばす
+        (巡回畳み込みの周期がnFftに変わるため、応答がnFft - nSamples標本以内に収まらない場合は
+        巡回畳み込みとも線形畳み込みとも異なる結果になる。Falseの場合は標本数を周期とする巡回畳み込み)
+    workers : int
+        scipy.fftで使用するスレッド数(-1の場合はCPUのコア数)
+    """
+
+    def __init__(
+        self, nSamples, samplingPeriod, padToFastLength=False, workers=-1
+    ):  # イニシャライザ
+        self.nSamples = nSamples
+        self.samplingPeriod = samplingPeriod
+        self.nFft = calcFastLength(nSamples) if padToFastLength else nSamples
+        self.workers = workers
+        self.backend = "scipy" if isScipyFftAvailable else "numpy"
+
+        self.frequencies = np.fft.rfftfreq(self.nFft, samplingPeriod)
+        self.frequencies.setflags(write=False)
+        self._paddedBuffers = OrderedDict()
+        self._spectrumBuffers = OrderedDict()
+
+    @property
+    def nFrequencies(self):
+        return self.nFft // 2 + 1
+
+    def _getPaddedBuffer(self, batchShape):
+        # ゼロ詰め用の配列(末尾のゼロの部分は書き換えないため、毎回0で初期化しなくてよい)
+        return _getOrCreate(
+            self._paddedBuffers,
+            batchShape,
+            lambda: np.zeros(batchShape + (self.nFft,)),
+            MAX_BUFFERS,
+        )
+
+    def _getSpectrumBuffer(self, batchShape):
+        return _getOrCreate(
+            self._spectrumBuffers,
+            batchShape,
+            lambda: np.empty(batchShape + (self.nFrequencies,), dtype=complex),
+            MAX_BUFFERS,
+        )
+
+    def clear(self):
+        """
+        作業用の配列を解放する
+        """
+        self._paddedBuffers.clear()
+        self._spectrumBuffers.clear()
+
+    def rfft(self, waves):
+        """
+        実数の波形をフーリエ変換する(最後の軸を時間の軸とし、それ以外の軸はバッチとして扱う)
+
+        Parameters
+        ----------
+        waves : array_like
+            形状が(..., nSamples)の波形
+        """
+        waves = np.asarray(waves, dtype=float)
+        if waves.shape[-1] != self.nSamples:
+            raise ValueError(
+                f"波形の標本数が一致しません: {waves.shape[-1]} != {self.nSamples}"
+            )
+        if self.nFft != self.nSamples:
+            buffer = self._getPaddedBuffer(waves.shape[:-1])
+            buffer[..., : self.nSamples] = waves
+            waves = buffer
+
+        if self.backend == "scipy":
+            return scipyFft.rfft(waves, axis=-1, workers=self.workers)
+        return np.fft.rfft(waves, axis=-1)
+
+    def irfft(self, spectra):
+        """
+        スペクトルを逆フーリエ変換し、元の標本数に切り詰めた実数の波形を返す
+
+        Parameters
+        ----------
+        spectra : array_like
+            形状が(..., nFrequencies)のスペクトル
+        """
+        if self.backend == "scipy":
+            waves = scipyFft.irfft(spectra, self.nFft, axis=-1, workers=self.workers)
+        else:
+            waves = np.fft.irfft(spectra, self.nFft, axis=-1)
+        return waves[..., : self.nSamples]
+
+    def applyTransferFunctions(self, spectra, tfs):
+        """
+        スペクトルに伝達関数を掛けてから逆フーリエ変換する(積は作業用の配列に書き込む)
+
+        Parameters
+        ----------
+        spectra : ndarray
+            rfftで求めたスペクトル
+        tfs : array_like
+            frequenciesに対する伝達関数(spectraとブロードキャストできる形状)
+        """
+        batchShape = np.broadcast_shapes(np.shape(spectra), np.shape(tfs))[:-1]
+        products = self._getSpectrumBuffer(batchShape)
+        np.multiply(spectra, tfs, out=products)
+        return self.irfft(products)
+
+    def filter(self, waves, tfs):
+        """
+        波形を伝達関数に通したときの出力波形を求める(時間軸の畳み込み積分)
+
+        Parameters
+        ----------
+        waves : array_like
+            形状が(..., nSamples)の入力波形
+        tfs : array_like
+            frequenciesに対する伝達関数
+        """
+        return self.applyTransferFunctions(self.rfft(waves), tfs)
+
+
+_contexts = OrderedDict()
+
+
+def getFftContext(nSamples, samplingPeriod, padToFastLength=False, workers=-1):
+    """
+    同じ条件のFftContextを使い回す(初回のみ作成する)
+
+    最後に使われた順にMAX_CONTEXTS個まで保持し、それを超えた場合は古いものから削除する
+
+    Parameters
+    ----------
+    nSamples : int
+        入力波形の標本数
+    samplingPeriod : float
+        サンプリング周期(s)
+    padToFastLength : bool
+        Trueの場合、変換長を高速に計算できる長さまでゼロ詰めして延ばす
+        (巡回畳み込みの周期がnFftに変わるため、応答がnFft - nSamples標本以内に収まらない場合は
+        巡回畳み込みとも線形畳み込みとも異なる結果になる。Falseの場合は標本数を周期とする巡回畳み込み)
+    workers : int
+        scipy.fftで使用するスレッド数(-1の場合はCPUのコア数)
+    """
+    key = (nSamples, float(samplingPeriod), padToFastLength, workers)
+    return _getOrCreate(
+        _contexts,
+        key,
+        lambda: FftContext(nSamples, samplingPeriod, padToFastLength, workers),
+        MAX_CONTEXTS,
+    )
+
+
+def clearFftContexts():
+    """
+    使い回しているFftContextと、その作業用の配列をすべて解放する
+    """
+    _contexts.clear()
@@ -1,5 +1,3 @@
-import math
-
 import matplotlib
 import pandas as pd
 
@@ -7,14 +5,28 @@ matplotlib.rc("font", family="Noto Sans CJK JP")
 import matplotlib.pyplot as plt
 
 import numpy as np
-from tqdm import tqdm
 
 import util
 import cable
-import transferFunction as tfModules
-
-
-def drawFrequencyResponse(frequencies_Hz, cable, showMeasuredValue=False, fileName=""):
+import resonance
+import sweep
+
+# 受電端の条件(整合, 開放, 短絡)
+DEFAULT_CONDITIONS = [
+    {"shouldMatching": True, "impedance": 50},
+    {"shouldMatching": False, "impedance": 1e6},
+    {"shouldMatching": False, "impedance": 1e-6},
+]
+
+
+def drawFrequencyResponse(
+    frequencies_Hz,
+    cable,
+    showMeasuredValue=False,
+    fileName="",
+    conditions=DEFAULT_CONDITIONS,
+    shouldShow=True,
+):
     """
     分布定数線路の周波数特性をグラフに表示する
 
@@ -26,111 +38,56 @@ def drawFrequencyResponse(frequencies_Hz, cable, showMeasuredValue=False, fileNa
         Cableクラスのインスタンス
     fileName: string
         表示するグラフを保存する際のファイル名
+    conditions : list
+        受電端の条件のリスト(条件ごとにグラフを描画する)
+    shouldShow : bool
+        Trueの場合、描画したグラフをすぐに表示する
+
+    Returns
+    -------
+    tfsByCondition : LabeledArray
+        sweep.calcTfsBySweepで求めた条件ごとの伝達関数
+    figs : list
+        条件ごとのグラフのFigureのリスト
     """
-
-    # 共振周波数の分母（開放条件）
-    resonance_denominator_open = (
-        4 * cable.length * math.sqrt(cable.inductance * cable.capacitance)
+    # 全ての受電端の条件について伝達関数をまとめて計算する
+    tfsByCondition = sweep.calcTfsBySweep(
+        frequencies_Hz,
+        cable.resistance,
+        cable.inductance,
+        cable.conductance,
+        cable.capacitance,
+        cable.length,
+        conditions,
     )
-    # 反共振周波数の分母（開放条件）
-    antiresonance_denominator_open = (
-        2 * cable.length * math.sqrt(cable.inductance * cable.capacitance)
-    )
-
-    # 開放
-    resonance_freqs_open = []  # 開放条件時の共振周波数
-    antiresonance_freqs_open = []  # 開放条件時の反共振周波数
-    # 整数n
-    n_length = range(5)  # range(3)だと, 0 ~ 2
-    for n in n_length:
-        # 共振周波数（開放）
-        # nは0から
-        resonance_freq_open = (2 * n + 1) / resonance_denominator_open
-        resonance_freqs_open.append(resonance_freq_open)
-        # 反共振周波数（開放）
-        # nは1から
-        if n == 0:
-            continue
-        antiresonance_freq_open = n / antiresonance_denominator_open
-        antiresonance_freqs_open.append(antiresonance_freq_open)
-    resonance_freqs_short = antiresonance_freqs_open  # 短絡条件時の共振周波数
-    antiresonance_freqs_short = resonance_freqs_open  # 短絡条件時の反共振周波数
-
-    conditions = [
-        {"shouldMatching": True, "impedance": 50},
-        {"shouldMatching": False, "impedance": 1e6},
-        {"shouldMatching": False, "impedance": 1e-6},
-    ]
+    figs = []
     for (i, condition) in enumerate(conditions):
         fig, ax = plt.subplots()
+        figs.append(fig)
 
-        tfs = [
-            tfModules.createTransferFunction(frequency_Hz, condition, cable)
-            for frequency_Hz in tqdm(frequencies_Hz, leave=False)
-        ]
+        tfs = tfsByCondition.isel(endCondition=i).values
 
         ax.plot(
             [freq / 1e6 for freq in frequencies_Hz],
             list(map(util.convertGain2dB, tfs)),
             label="シミレーション",
         )
-        if cable.resistance == 0 and cable.conductance == 0:
-            if i == 1:
-                # open
-                ax.scatter(
-                    [freq / 1e6 for freq in resonance_freqs_open],
-                    list(
-                        map(
-                            util.convertGain2dB,
-                            tfModules.calcTfsBySomeFreqs(
-                                resonance_freqs_open, condition, cable
-                            ),
-                        )
-                    ),
-                    marker="x",
-                    color="blue",
-                )
-                ax.scatter(
-                    [freq / 1e6 for freq in antiresonance_freqs_open],
-                    list(
-                        map(
-                            util.convertGain2dB,
-                            tfModules.calcTfsBySomeFreqs(
-                                antiresonance_freqs_open, condition, cable
-                            ),
-                        )
-                    ),
-                    color="red",
-                )
-                ax.legend(["全ての周波数", "共振周波数", "反共振周波数"], loc="best")
-            elif i == 2:
-                # short
-                ax.scatter(
-                    [freq / 1e6 for freq in resonance_freqs_short],
-                    list(
-                        map(
-                            util.convertGain2dB,
-                            tfModules.calcTfsBySomeFreqs(
-                                resonance_freqs_short, condition, cable
-                            ),
-                        )
-                    ),
-                    marker="x",
-                    color="blue",
-                )
-                ax.scatter(
-                    [freq / 1e6 for freq in antiresonance_freqs_short],
-                    list(
-                        map(
-                            util.convertGain2dB,
-                            tfModules.calcTfsBySomeFreqs(
-                                antiresonance_freqs_short, condition, cable
-                            ),
-                        )
-                    ),
-                    color="red",
-                )
-                ax.legend(["全ての周波数", "共振周波数", "反共振周波数"], loc="best")
+        if not condition["shouldMatching"]:
+            # 開放・短絡条件の共振周波数、反共振周波数を損失を考慮して求める
+            # (整合に近い条件ではNaNになり、点は描画されない)
+            resonances = resonance.findResonances(cable, condition)
+            ax.scatter(
+                [freq / 1e6 for freq in resonances["resonanceFrequencies"]],
+                list(map(util.convertGain2dB, resonances["resonanceTfs"])),
+                marker="x",
+                color="blue",
+            )
+            ax.scatter(
+                [freq / 1e6 for freq in resonances["antiresonanceFrequencies"]],
+                list(map(util.convertGain2dB, resonances["antiresonanceTfs"])),
+                color="red",
+            )
+            ax.legend(["全ての周波数", "共振周波数", "反共振周波数"], loc="best")
         text = (
             "インピーダンスマッチング条件における周波数特性"
             if condition["shouldMatching"]
@@ -164,16 +121,19 @@ def drawFrequencyResponse(frequencies_Hz, cable, showMeasuredValue=False, fileNa
     if fileName != "":
         fig.savefig(util.createImagePath(fileName))
 
-    plt.tight_layout()
-    plt.show()
-
-
-drawFrequencyResponse(
-    # 無損失ケーブル用
-    # list(range(0, 5 * util.ONE_HUNDRED, 1000)),
-    # cable.cable_noLoss_vertual,
-    # 損失ありケーブル用
-    list(range(0, 50 * util.ONE_HUNDRED, 10000)),
-    cable.cable_vertual,
-    # showMeasuredValue=True,
-)
+    if shouldShow:
+        plt.tight_layout()
+        plt.show()
+    return tfsByCondition, figs
+
+
+if __name__ == "__main__":
+    drawFrequencyResponse(
+        # 無損失ケーブル用
+        # list(range(0, 5 * util.ONE_HUNDRED, 1000)),
+        # cable.cable_noLoss_vertual,
+        # 損失ありケーブル用
+        list(range(0, 50 * util.ONE_HUNDRED, 10000)),
+        cable.cable_vertual,
+        # showMeasuredValue=True,
+    )
@@ -0,0 +1,88 @@
+import numpy as np
+
+import propagationCache
+import transferFunction as tfModules
+from sweep import LabeledArray
+
+
+def calcInputImpedanceSurface(
+    frequencies_Hz,
+    cable,
+    endImpedances,
+    lengths=None,
+    cache=propagationCache.defaultCache,
+):
+    """
+    (受電端のインピーダンス × ケーブル長 × 周波数)の格子に対する、送電端から見たインピーダンスを一括で求める
+
+    Z0とγは周波数だけで決まるため1回だけ求め、tanh(γl)は(ケーブル長 × 周波数)の格子でまとめて求めて
+    受電端のインピーダンスの軸にブロードキャストする
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    endImpedances : array_like
+        受電端のインピーダンス(Ω)の配列
+    lengths : array_like
+        ケーブル長(m)の配列(Noneの場合はcable.lengthのみ)
+    cache : instance
+        PropagationCacheのインスタンス(Noneの場合はキャッシュを使用しない)
+
+    Returns
+    -------
+    impedances : LabeledArray
+        軸が("endImpedance", "length", "frequency")の複素数配列
+    """
+    frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+    endImpedances = np.atleast_1d(np.asarray(endImpedances, dtype=complex))
+    if lengths is None:
+        lengths = [cable.length]
+    lengths = np.atleast_1d(np.asarray(lengths, dtype=float))
+
+    # γとZ0はケーブル長に依存しないため1回だけ求める
+    terms = tfModules.calcPropagationTerms(frequencies_Hz, cable, cache)
+    impedances = propagationCache.calcInputImpedances(
+        terms["Z0"],
+        terms["gamma"],
+        lengths[:, np.newaxis],
+        endImpedances[:, np.newaxis, np.newaxis],
+    )
+
+    return LabeledArray(
+        impedances,
+        ("endImpedance", "length", "frequency"),
+        {
+            "endImpedance": endImpedances,
+            "length": lengths,
+            "frequency": frequencies_Hz,
+        },
+    )
+
+
+def calcReflectionCoefficients(impedances, referenceImpedance=50):
+    """
+    インピーダンスから反射係数 Γ = (Z - Zref) / (Z + Zref) を求める(スミスチャートの座標になる)
+
+    Parameters
+    ----------
+    impedances : array_like or LabeledArray
+        インピーダンス(Ω)の配列
+    referenceImpedance : float or ndarray
+        基準インピーダンス(Ω)
+
+    Returns
+    -------
+    reflectionCoefficients : ndarray or LabeledArray
+        impedancesと同じ形状の反射係数(LabeledArrayを渡した場合は軸の情報を引き継ぐ)
+    """
+    if isinstance(impedances, LabeledArray):
+        return LabeledArray(
+            calcReflectionCoefficients(impedances.values, referenceImpedance),
+            impedances.dims,
+            impedances.coords,
+        )
+    impedances = np.asarray(impedances, dtype=complex)
+    return (impedances - referenceImpedance) / (impedances + referenceImpedance)
@@ -0,0 +1,77 @@
+import cmath
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numbaがインストールされていない場合はNumPyで計算する
+    numba = None
+
+isNumbaAvailable = numba is not None
+
+
+def _calcTransferFunctionsKernel(
+    omegas, R, L, G, C, length, R1, endImpedance, shouldMatching, out
+):
+    # γ, Z0, cosh, sinh, F行列の要素, 伝達関数を周波数ごとに1つのループで計算する
+    # (中間結果の配列を作らない)
+    for i in range(omegas.shape[0]):
+        omega = omegas[i]
+        gamma = cmath.sqrt(complex(R, omega * L) * complex(G, omega * C))
+
+        omegaForZ0 = omega
+        if omegaForZ0 == 0:
+            omegaForZ0 = 1e-8  # ZeroDivisionError回避
+        Z0 = cmath.sqrt(complex(R, omegaForZ0 * L) / complex(G, omegaForZ0 * C))
+
+        theta = gamma * length
+        cosh = cmath.cosh(theta)
+        sinh = cmath.sinh(theta)
+
+        if shouldMatching:
+            R2 = Z0
+        else:
+            R2 = endImpedance
+
+        out[i] = 1 / (cosh + Z0 * sinh / R2 + R1 * sinh / Z0 + (R1 / R2) * cosh)
+    return out
+
+
+if isNumbaAvailable:
+    # cache=Trueとすることで、コンパイル結果を__pycache__に保存して起動のたびに再コンパイルしない
+    _calcTransferFunctionsKernel = numba.njit(cache=True)(_calcTransferFunctionsKernel)
+
+
+def calcTransferFunctions(frequencies_Hz, endCondition, cable, sourceImpedance=50):
+    """
+    コンパイル済みのカーネルで、周波数の配列に対する伝達関数を一括で求める
+
+    numbaがインストールされていない場合はPythonのループで計算されるため、
+    transferFunction.createTransferFunctions(backend="numba")から呼び出すこと
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    endCondition: dict
+        受電端の抵抗の条件
+    cable : instance
+        Cableクラスのインスタンス
+    sourceImpedance : float
+        電源の内部インピーダンス
+    """
+    omegas = 2 * np.pi * np.ascontiguousarray(frequencies_Hz, dtype=float).ravel()
+    out = np.empty(omegas.shape, dtype=complex)
+    _calcTransferFunctionsKernel(
+        omegas,
+        float(cable.resistance),
+        float(cable.inductance),
+        float(cable.conductance),
+        float(cable.capacitance),
+        float(cable.length),
+        complex(sourceImpedance),
+        complex(endCondition["impedance"]),
+        bool(endCondition["shouldMatching"]),
+        out,
+    )
+    return out.reshape(np.shape(frequencies_Hz))
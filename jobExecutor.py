@@ -0,0 +1,179 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import batchSimulation
+import transferFunction as tfModules
+
+
+class SweepJob:
+    """
+    周波数の配列に対する伝達関数を求めるジョブ(周波数の軸で分割して並列に計算できる)
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    endCondition: dict
+        受電端の抵抗の条件
+    cable : instance
+        Cableクラスのインスタンス
+    """
+
+    dtype = np.dtype(complex)
+    isSplittable = True
+
+    def __init__(self, frequencies_Hz, endCondition, cable):  # イニシャライザ
+        self.frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+        self.endCondition = endCondition
+        self.cable = cable
+
+    @property
+    def shape(self):
+        return self.frequencies_Hz.shape
+
+    def createPart(self, start, stop):
+        return SweepJob(self.frequencies_Hz[start:stop], self.endCondition, self.cable)
+
+    def compute(self):
+        # 別プロセスで実行するため、プロセスごとのキャッシュは使用しない
+        return tfModules.createTransferFunctions(
+            self.frequencies_Hz, self.endCondition, self.cable, cache=None
+        )
+
+
+class WaveformJob:
+    """
+    入力波形に対する受電端・送電端の電圧波形を求めるジョブ(結果の形状は(2, 標本数))
+
+    Parameters
+    ----------
+    inputWaves : array_like
+        電源電圧の波形
+    samplingPeriod : float
+        サンプリング周期(s)
+    endCondition: dict
+        受電端の抵抗の条件
+    cable : instance
+        Cableクラスのインスタンス
+    sourceImpedance : float
+        電源の内部インピーダンス
+    """
+
+    dtype = np.dtype(float)
+    isSplittable = False
+
+    def __init__(
+        self, inputWaves, samplingPeriod, endCondition, cable, sourceImpedance=50
+    ):  # イニシャライザ
+        self.inputWaves = np.asarray(inputWaves, dtype=float)
+        self.samplingPeriod = samplingPeriod
+        self.endCondition = endCondition
+        self.cable = cable
+        self.sourceImpedance = sourceImpedance
+
+    @property
+    def shape(self):
+        return (len(batchSimulation.PROBES), len(self.inputWaves))
+
+    def compute(self):
+        times = np.arange(len(self.inputWaves)) * self.samplingPeriod
+        waves = batchSimulation.simulateBatch(
+            times,
+            self.inputWaves[np.newaxis, :],
+            self.cable,
+            [self.endCondition],
+            sourceImpedance=self.sourceImpedance,
+        )
+        return waves.isel(endCondition=0, wave=0).values
+
+
+def _runTask(task):
+    # ワーカープロセスで部分ジョブを計算し、結果を共有メモリの該当する範囲に書き込む
+    sharedMemoryName, shape, dtype, start, stop, job = task
+    sharedMemory = shared_memory.SharedMemory(name=sharedMemoryName)
+    try:
+        results = np.ndarray(shape, dtype=dtype, buffer=sharedMemory.buf)
+        results[..., start:stop] = job.compute()
+    finally:
+        sharedMemory.close()
+    return start, stop
+
+
+def calcChunkSize(nElements, maxWorkers, minChunkSize=4096, nChunksPerWorker=4):
+    """
+    分割できるジョブを、ワーカーあたりnChunksPerWorker個程度に分ける点数を求める
+
+    小さく分けすぎるとプロセス間の通信のオーバーヘッドが大きくなるため、minChunkSize点以上にする
+    """
+    chunkSize = -(-nElements // (maxWorkers * nChunksPerWorker))
+    return max(chunkSize, minChunkSize)
+
+
+def runJobs(jobs, maxWorkers=None, chunkSize=None):
+    """
+    独立したジョブをプロセスプールで並列に実行し、結果をジョブと同じ順序で返す
+
+    結果の配列は共有メモリに直接書き込まれるため、大きな複素数配列をpickleで送り返さない
+    分割できるジョブ(SweepJob)は周波数の軸で分割して複数のワーカーに割り当てる
+    各部分の計算は要素ごとに独立しているため、分割の仕方やワーカー数によらず結果は同じになる
+
+    Parameters
+    ----------
+    jobs : list
+        SweepJob, WaveformJobのインスタンスのリスト
+    maxWorkers : int
+        ワーカープロセスの数(Noneの場合はCPUのコア数, 1の場合は現在のプロセスで実行する)
+    chunkSize : int
+        分割できるジョブの1つの部分の点数(Noneの場合はcalcChunkSizeで決める)
+
+    Returns
+    -------
+    results : list
+        各ジョブの結果のndarray
+    """
+    if maxWorkers is None:
+        maxWorkers = os.cpu_count() or 1
+    if maxWorkers == 1:
+        return [np.asarray(job.compute()) for job in jobs]
+
+    sharedMemories = []
+    try:
+        tasks = []
+        for job in jobs:
+            nBytes = max(int(np.prod(job.shape)) * job.dtype.itemsize, 1)
+            sharedMemory = shared_memory.SharedMemory(create=True, size=nBytes)
+            sharedMemories.append(sharedMemory)
+
+            nElements = job.shape[-1]
+            if job.isSplittable:
+                size = chunkSize or calcChunkSize(nElements, maxWorkers)
+                parts = [
+                    (
+                        start,
+                        min(start + size, nElements),
+                        job.createPart(start, start + size),
+                    )
+                    for start in range(0, nElements, size)
+                ]
+            else:
+                parts = [(0, nElements, job)]
+            for start, stop, part in parts:
+                tasks.append(
+                    (sharedMemory.name, job.shape, job.dtype, start, stop, part)
+                )
+
+        with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+            # 例外が発生した場合は、ここで呼び出し元に送出される
+            list(executor.map(_runTask, tasks))
+
+        return [
+            np.ndarray(job.shape, dtype=job.dtype, buffer=sharedMemory.buf).copy()
+            for job, sharedMemory in zip(jobs, sharedMemories)
+        ]
+    finally:
+        for sharedMemory in sharedMemories:
+            sharedMemory.close()
+            sharedMemory.unlink()
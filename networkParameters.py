@@ -0,0 +1,174 @@
+import numpy as np
+
+
+def _toMatrixes(matrixes):
+    # FMatrixesのインスタンスも__array__で形状(..., 2, 2)の配列として受け取る
+    matrixes = np.asarray(matrixes, dtype=complex)
+    if matrixes.shape[-2:] != (2, 2):
+        raise ValueError(
+            f"行列の形状は(..., 2, 2)である必要があります: {matrixes.shape}"
+        )
+    return matrixes
+
+
+def _entries(matrixes):
+    return (
+        matrixes[..., 0, 0],
+        matrixes[..., 0, 1],
+        matrixes[..., 1, 0],
+        matrixes[..., 1, 1],
+    )
+
+
+def _stack(m11, m12, m21, m22):
+    shape = np.broadcast(m11, m12, m21, m22).shape
+    matrixes = np.empty(shape + (2, 2), dtype=complex)
+    matrixes[..., 0, 0] = m11
+    matrixes[..., 0, 1] = m12
+    matrixes[..., 1, 0] = m21
+    matrixes[..., 1, 1] = m22
+    return matrixes
+
+
+def _splitReferenceImpedances(referenceImpedances):
+    if isinstance(referenceImpedances, tuple):
+        Z01, Z02 = referenceImpedances
+    else:
+        Z01 = Z02 = referenceImpedances
+    return np.asarray(Z01, dtype=complex), np.asarray(Z02, dtype=complex)
+
+
+def convertFToZ(f_matrixes):
+    """
+    F行列(ABCDパラメータ)の配列をZパラメータに変換する
+
+    Parameters
+    ----------
+    f_matrixes : array_like
+        形状が(..., 2, 2)のF行列の配列(FMatrixesのインスタンスでもよい)
+    """
+    A, B, C, D = _entries(_toMatrixes(f_matrixes))
+    return _stack(A / C, (A * D - B * C) / C, 1 / C, D / C)
+
+
+def convertZToF(z_matrixes):
+    """
+    Zパラメータの配列をF行列に変換する
+
+    Parameters
+    ----------
+    z_matrixes : array_like
+        形状が(..., 2, 2)のZパラメータの配列
+    """
+    Z11, Z12, Z21, Z22 = _entries(_toMatrixes(z_matrixes))
+    return _stack(Z11 / Z21, (Z11 * Z22 - Z12 * Z21) / Z21, 1 / Z21, Z22 / Z21)
+
+
+def convertFToY(f_matrixes):
+    """
+    F行列(ABCDパラメータ)の配列をYパラメータに変換する
+
+    Parameters
+    ----------
+    f_matrixes : array_like
+        形状が(..., 2, 2)のF行列の配列(FMatrixesのインスタンスでもよい)
+    """
+    A, B, C, D = _entries(_toMatrixes(f_matrixes))
+    return _stack(D / B, -(A * D - B * C) / B, -1 / B, A / B)
+
+
+def convertYToF(y_matrixes):
+    """
+    Yパラメータの配列をF行列に変換する
+
+    Parameters
+    ----------
+    y_matrixes : array_like
+        形状が(..., 2, 2)のYパラメータの配列
+    """
+    Y11, Y12, Y21, Y22 = _entries(_toMatrixes(y_matrixes))
+    return _stack(-Y22 / Y21, -1 / Y21, -(Y11 * Y22 - Y12 * Y21) / Y21, -Y11 / Y21)
+
+
+def convertFToS(f_matrixes, referenceImpedances=50):
+    """
+    F行列(ABCDパラメータ)の配列をSパラメータに変換する
+
+    基準インピーダンスが複素数の場合にも対応するため、Frickeyの変換式(電力波の定義)を用いる
+
+    Parameters
+    ----------
+    f_matrixes : array_like
+        形状が(..., 2, 2)のF行列の配列(FMatrixesのインスタンスでもよい)
+    referenceImpedances : complex or tuple
+        基準インピーダンス
+        (ポート1, ポート2)のタプルで指定した場合はポートごとに異なる値を用いる
+        それぞれ周波数ごとの配列でもよい
+    """
+    A, B, C, D = _entries(_toMatrixes(f_matrixes))
+    Z01, Z02 = _splitReferenceImpedances(referenceImpedances)
+    R01 = np.real(Z01)
+    R02 = np.real(Z02)
+
+    denominator = A * Z02 + B + C * Z01 * Z02 + D * Z01
+    S11 = (A * Z02 + B - C * np.conj(Z01) * Z02 - D * np.conj(Z01)) / denominator
+    S12 = 2 * (A * D - B * C) * np.sqrt(R01 * R02) / denominator
+    S21 = 2 * np.sqrt(R01 * R02) / denominator
+    S22 = (-A * np.conj(Z02) + B - C * Z01 * np.conj(Z02) + D * Z01) / denominator
+    return _stack(S11, S12, S21, S22)
+
+
+def convertSToF(s_matrixes, referenceImpedances=50):
+    """
+    Sパラメータの配列をF行列(ABCDパラメータ)に変換する(Frickeyの変換式)
+
+    Parameters
+    ----------
+    s_matrixes : array_like
+        形状が(..., 2, 2)のSパラメータの配列
+    referenceImpedances : complex or tuple
+        基準インピーダンス
+        (ポート1, ポート2)のタプルで指定した場合はポートごとに異なる値を用いる
+    """
+    S11, S12, S21, S22 = _entries(_toMatrixes(s_matrixes))
+    Z01, Z02 = _splitReferenceImpedances(referenceImpedances)
+    R01 = np.real(Z01)
+    R02 = np.real(Z02)
+
+    denominator = 2 * S21 * np.sqrt(R01 * R02)
+    S12S21 = S12 * S21
+    A = ((np.conj(Z01) + S11 * Z01) * (1 - S22) + S12S21 * Z01) / denominator
+    B = (
+        (np.conj(Z01) + S11 * Z01) * (np.conj(Z02) + S22 * Z02) - S12S21 * Z01 * Z02
+    ) / denominator
+    C = ((1 - S11) * (1 - S22) - S12S21) / denominator
+    D = ((1 - S11) * (np.conj(Z02) + S22 * Z02) + S12S21 * Z02) / denominator
+    return _stack(A, B, C, D)
+
+
+def convertZToS(z_matrixes, referenceImpedances=50):
+    """
+    Zパラメータの配列をSパラメータに変換する
+    """
+    return convertFToS(convertZToF(z_matrixes), referenceImpedances)
+
+
+def convertSToZ(s_matrixes, referenceImpedances=50):
+    """
+    Sパラメータの配列をZパラメータに変換する
+    """
+    return convertFToZ(convertSToF(s_matrixes, referenceImpedances))
+
+
+def convertYToS(y_matrixes, referenceImpedances=50):
+    """
+    Yパラメータの配列をSパラメータに変換する
+    """
+    return convertFToS(convertYToF(y_matrixes), referenceImpedances)
+
+
+def convertSToY(s_matrixes, referenceImpedances=50):
+    """
+    Sパラメータの配列をYパラメータに変換する
+    """
+    return convertFToY(convertSToF(s_matrixes, referenceImpedances))
@@ -0,0 +1,137 @@
+import weakref
+
+import numpy as np
+
+# CallbackRegistryはメソッドを弱参照で保持するため、Axesごとに線への参照を持ち、
+# 呼び出し元が戻り値を保持しなくてもコールバックが消えないようにする
+# (線はAxesとLine2Dを弱参照で保持するため、Axesが破棄されると辞書から取り除かれる)
+_linesByAxes = weakref.WeakKeyDictionary()
+
+
+def decimateMinMax(xs, ys, xmin, xmax, nBins):
+    """
+    表示範囲のデータを二分探索で切り出し、各列(ピクセル)の最小値と最大値の組に間引く
+
+    Parameters
+    ----------
+    xs : ndarray
+        x座標の配列(昇順)
+    ys : ndarray
+        y座標の配列
+    xmin, xmax : float
+        表示範囲
+    nBins : int
+        列の数(軸の幅のピクセル数)
+
+    Returns
+    -------
+    xs, ys : ndarray
+        間引いた座標(点数は最大で2 * nBins + 2)
+    """
+    # 線が表示範囲の端で途切れないように、範囲外の点を1点ずつ含める
+    start = max(np.searchsorted(xs, xmin, side="left") - 1, 0)
+    stop = min(np.searchsorted(xs, xmax, side="right") + 1, len(xs))
+    xs = xs[start:stop]
+    ys = ys[start:stop]
+    if len(xs) <= 2 * nBins:
+        return xs, ys
+
+    # 各列に含まれる点の範囲を求め、列ごとの最小値・最大値をまとめて計算する
+    edges = np.linspace(xs[0], xs[-1], nBins + 1)
+    indexes = np.unique(np.searchsorted(xs, edges[:-1], side="left"))
+    minimums = np.minimum.reduceat(ys, indexes)
+    maximums = np.maximum.reduceat(ys, indexes)
+    centers = (xs[indexes] + xs[np.append(indexes[1:], len(xs)) - 1]) / 2
+
+    decimatedXs = np.repeat(centers, 2)
+    decimatedYs = np.empty(2 * len(indexes))
+    decimatedYs[0::2] = minimums
+    decimatedYs[1::2] = maximums
+    return decimatedXs, decimatedYs
+
+
+class DecimatedLine:
+    """
+    表示範囲に合わせて間引いたデータを描画し、拡大・移動のたびに間引き直す線
+
+    描画する点数は軸の幅のピクセル数で決まるため、データの長さによらず描画時間はほぼ一定になる
+
+    Parameters
+    ----------
+    ax : instance
+        matplotlibのAxes
+    xs : array_like
+        x座標の配列(昇順)
+    ys : array_like
+        y座標の配列
+    nBins : int
+        列の数(Noneの場合は軸の幅のピクセル数)
+    kwargs : dict
+        ax.plotに渡す引数
+    """
+
+    def __init__(self, ax, xs, ys, nBins=None, **kwargs):  # イニシャライザ
+        self._axRef = weakref.ref(ax)
+        self.xs = np.asarray(xs, dtype=float)
+        self.ys = np.asarray(ys, dtype=float)
+        self.nBins = nBins
+        (line,) = ax.plot(
+            *decimateMinMax(
+                self.xs, self.ys, self.xs[0], self.xs[-1], self._getNBins()
+            ),
+            **kwargs,
+        )
+        self._lineRef = weakref.ref(line)
+        self._callbackId = ax.callbacks.connect("xlim_changed", self.update)
+        _linesByAxes.setdefault(ax, []).append(self)
+
+    @property
+    def ax(self):
+        return self._axRef()
+
+    @property
+    def line(self):
+        return self._lineRef()
+
+    def _getNBins(self):
+        if self.nBins is not None:
+            return self.nBins
+        width = self.ax.get_window_extent().width
+        return max(int(width), 100)
+
+    def update(self, ax=None):
+        """
+        現在の表示範囲で間引き直す(xlim_changedのコールバックとして呼ばれる)
+        """
+        xmin, xmax = sorted(self.ax.get_xlim())
+        self.line.set_data(
+            *decimateMinMax(self.xs, self.ys, xmin, xmax, self._getNBins())
+        )
+
+    def remove(self):
+        """
+        線とコールバックを削除する
+        """
+        self.ax.callbacks.disconnect(self._callbackId)
+        _linesByAxes[self.ax].remove(self)
+        self.line.remove()
+
+
+def plotDecimated(ax, xs, ys, nBins=None, **kwargs):
+    """
+    間引いたデータで線を描画する(ax.plotの代わりに使用する)
+
+    Parameters
+    ----------
+    ax : instance
+        matplotlibのAxes
+    xs : array_like
+        x座標の配列(昇順)
+    ys : array_like
+        y座標の配列
+    nBins : int
+        列の数(Noneの場合は軸の幅のピクセル数)
+    kwargs : dict
+        ax.plotに渡す引数
+    """
+    return DecimatedLine(ax, xs, ys, nBins, **kwargs)
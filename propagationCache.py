@@ -0,0 +1,176 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+def calcPropagationTerms(frequencies_Hz, cable):
+    """
+    ケーブルと周波数だけで決まる値(γ, Z0, cosh(γl), sinh(γl))を一括で求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    """
+    omegas = 2 * np.pi * np.asarray(frequencies_Hz, dtype=float)
+
+    R = cable.resistance  # Ω/m
+    L = cable.inductance  # H/m
+    G = cable.conductance  # S/m
+    C = cable.capacitance  # F/m
+
+    gamma = np.sqrt((R + 1j * omegas * L) * (G + 1j * omegas * C))
+    theta = gamma * cable.length
+    return {
+        "gamma": gamma,
+        "Z0": cable.calcCharacteristicImpedances(frequencies_Hz),
+        "cosh": np.cosh(theta),
+        "sinh": np.sinh(theta),
+    }
+
+
+def calcInputImpedances(Z0, gammas, lengths, endImpedances):
+    """
+    受電端にインピーダンスを接続した線路を、送電端から見たインピーダンスを求める
+    Z0 * (Zr + Z0 * tanh(γl)) / (Z0 + Zr * tanh(γl))
+
+    Parameters
+    ----------
+    Z0 : array_like
+        特性インピーダンス
+    gammas : array_like
+        伝搬定数γ
+    lengths : float or array_like
+        ケーブル長(m)
+    endImpedances : complex or array_like
+        受電端のインピーダンス(Ω)
+        (Z0, gammas, lengthsとブロードキャストできる形状)
+    """
+    # sinh / coshは|γl|が大きいとinf / infでNaNになるため、飽和するnp.tanhを使用する
+    tanh = np.tanh(gammas * lengths)
+    Zr = endImpedances
+    return Z0 * (Zr + Z0 * tanh) / (Z0 + Zr * tanh)
+
+
+def createFrequencyFingerprint(frequencies_Hz):
+    """
+    周波数の配列の内容から、キャッシュのキーに使用する指紋を作成する
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    """
+    frequencies_Hz = np.ascontiguousarray(frequencies_Hz, dtype=float)
+    digest = hashlib.blake2b(frequencies_Hz.tobytes(), digest_size=16).hexdigest()
+    return (frequencies_Hz.shape, digest)
+
+
+class PropagationCache:
+    """
+    (ケーブルのパラメータ, 周波数の配列)をキーとしてγ, Z0, cosh(γl), sinh(γl)を保持するLRUキャッシュ
+
+    Parameters
+    ----------
+    maxBytes : int
+        キャッシュが保持する配列の合計サイズの上限(byte)
+        上限を超えた場合は、最も長い間使われていないものから削除する
+    """
+
+    def __init__(self, maxBytes=256 * 1024 ** 2):  # イニシャライザ
+        self.maxBytes = maxBytes
+        self.nBytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def createKey(self, frequencies_Hz, cable):
+        return (
+            float(cable.resistance),
+            float(cable.inductance),
+            float(cable.conductance),
+            float(cable.capacitance),
+            float(cable.length),
+            createFrequencyFingerprint(frequencies_Hz),
+        )
+
+    def getPropagationTerms(self, frequencies_Hz, cable):
+        """
+        キャッシュからγ, Z0, cosh(γl), sinh(γl)を取り出す(存在しない場合は計算して保存する)
+
+        返却する配列はキャッシュと共有しているため、書き込み不可にしている
+
+        Parameters
+        ----------
+        frequencies_Hz : array_like
+            周波数(Hz)の配列
+        cable : instance
+            Cableクラスのインスタンス
+        """
+        key = self.createKey(frequencies_Hz, cable)
+        terms = self._entries.get(key)
+        if terms is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return terms
+
+        self.misses += 1
+        terms = calcPropagationTerms(frequencies_Hz, cable)
+        for values in terms.values():
+            values.setflags(write=False)
+
+        nBytes = sum(values.nbytes for values in terms.values())
+        if nBytes <= self.maxBytes:
+            self._entries[key] = terms
+            self.nBytes += nBytes
+            self._evict()
+        return terms
+
+    def _evict(self):
+        while self.nBytes > self.maxBytes:
+            _, terms = self._entries.popitem(last=False)
+            self.nBytes -= sum(values.nbytes for values in terms.values())
+            self.evictions += 1
+
+    def setMaxBytes(self, maxBytes):
+        """
+        メモリ使用量の上限を変更する(超過している場合はすぐに削除する)
+        """
+        self.maxBytes = maxBytes
+        self._evict()
+
+    def clear(self):
+        """
+        保持している値と統計をすべて削除する
+        """
+        self._entries.clear()
+        self.nBytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def getStats(self):
+        """
+        キャッシュのヒット数・ミス数などの統計を返す
+        """
+        nRequests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": self.hits / nRequests if nRequests else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "nBytes": self.nBytes,
+            "maxBytes": self.maxBytes,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# transferFunctionモジュールの関数が既定で使用するキャッシュ
+defaultCache = PropagationCache()
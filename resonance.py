@@ -0,0 +1,197 @@
+import math
+
+import numpy as np
+
+import cable as cableModules
+
+# 黄金分割探索で区間を縮小する比率
+GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+
+
+def _toCableArray(cables):
+    if isinstance(cables, cableModules.CableArray):
+        return cables
+    if isinstance(cables, (list, tuple)):
+        return cableModules.CableArray.fromCables(cables)
+    return cableModules.CableArray.fromCables([cables])
+
+
+def _calcTfs(frequencies_Hz, cables, endCondition):
+    # ケーブルごとに異なる周波数の配列(ケーブルの数, k)に対する伝達関数を求める
+    omegas = 2 * np.pi * frequencies_Hz
+    R = cables.resistances[:, np.newaxis]
+    L = cables.inductances[:, np.newaxis]
+    G = cables.conductances[:, np.newaxis]
+    C = cables.capacitances[:, np.newaxis]
+    length = cables.lengths[:, np.newaxis]
+
+    gamma = np.sqrt((R + 1j * omegas * L) * (G + 1j * omegas * C))
+    omegas = np.where(omegas == 0, 1e-8, omegas)  # ZeroDivisionError回避
+    Z0 = np.sqrt((R + 1j * omegas * L) / (G + 1j * omegas * C))
+    cosh = np.cosh(gamma * length)
+    sinh = np.sinh(gamma * length)
+
+    R1 = 50
+    R2 = endCondition["impedance"]
+    return 1 / (cosh + Z0 * sinh / R2 + R1 * sinh / Z0 + (R1 / R2) * cosh)
+
+
+def calcLosslessResonanceFrequencies(
+    cables, endCondition, nResonances=5, matchingTolerance=0.05
+):
+    """
+    無損失線路の公式から共振周波数と反共振周波数を求める
+
+    受電端のインピーダンスが特性インピーダンスより大きい(開放に近い)場合
+        共振周波数: (2n + 1) / (4 * l * √(LC)) (n = 0, 1, ...)
+        反共振周波数: n / (2 * l * √(LC)) (n = 1, 2, ...)
+    小さい(短絡に近い)場合は共振周波数と反共振周波数が入れ替わる
+
+    Parameters
+    ----------
+    cables : instance
+        Cableクラスのインスタンス、そのリスト、またはCableArrayのインスタンス
+    endCondition: dict
+        受電端の抵抗の条件
+    nResonances : int
+        求める共振周波数(反共振周波数)の個数
+    matchingTolerance : float
+        受電端の反射係数の大きさがこの値より小さいケーブルは、整合に近く共振が生じないとみなす
+
+    Returns
+    -------
+    resonanceFrequencies, antiresonanceFrequencies : ndarray
+        形状が(ケーブルの数, nResonances)の周波数(Hz)の配列
+        (整合に近いケーブルの行はNaNになる)
+    """
+    if endCondition["shouldMatching"]:
+        raise ValueError("整合条件では共振が生じないため、共振周波数を求められません")
+    cables = _toCableArray(cables)
+
+    # 受電端のインピーダンスと高周波における特性インピーダンス√(L/C)を比較する
+    Z0 = np.sqrt(cables.inductances / cables.capacitances)
+    Zr = endCondition["impedance"]
+    isMatchedLike = (np.abs((Zr - Z0) / (Zr + Z0)) < matchingTolerance)[:, np.newaxis]
+
+    # 伝搬遅延時間 l * √(LC)
+    delays = (cables.lengths * np.sqrt(cables.inductances * cables.capacitances))[
+        :, np.newaxis
+    ]
+    n = np.arange(nResonances)
+    oddQuarterWaves = (2 * n + 1) / (4 * delays)
+    halfWaves = (n + 1) / (2 * delays)
+
+    isOpenLike = (abs(Zr) >= Z0)[:, np.newaxis]
+    resonanceFrequencies = np.where(isOpenLike, oddQuarterWaves, halfWaves)
+    antiresonanceFrequencies = np.where(isOpenLike, halfWaves, oddQuarterWaves)
+    return (
+        np.where(isMatchedLike, np.nan, resonanceFrequencies),
+        np.where(isMatchedLike, np.nan, antiresonanceFrequencies),
+    )
+
+
+def _searchExtremums(lowers, uppers, cables, endCondition, shouldFindMaximum, xtol):
+    # 黄金分割探索を全てのケーブル・全ての区間に対して同時に行う
+    sign = -1 if shouldFindMaximum else 1
+
+    def objective(frequencies_Hz):
+        return sign * np.abs(_calcTfs(frequencies_Hz, cables, endCondition))
+
+    x1 = uppers - GOLDEN_RATIO * (uppers - lowers)
+    x2 = lowers + GOLDEN_RATIO * (uppers - lowers)
+    y1 = objective(x1)
+    y2 = objective(x2)
+    # 区間の幅が許容誤差に収まるまで、収束していない要素だけを更新する
+    isActive = uppers - lowers > xtol * uppers
+    while np.any(isActive):
+        # 左側の点の方が小さい場合は[lower, x2]、そうでない場合は[x1, upper]に縮める
+        isLeft = y1 < y2
+        newUppers = np.where(isLeft, x2, uppers)
+        newLowers = np.where(isLeft, lowers, x1)
+        newX1 = np.where(isLeft, newUppers - GOLDEN_RATIO * (newUppers - newLowers), x2)
+        newX2 = np.where(isLeft, x1, newLowers + GOLDEN_RATIO * (newUppers - newLowers))
+        # 既存の点の値は使い回し、新しく配置した点だけ評価する
+        newValues = objective(np.where(isLeft, newX1, newX2))
+        newY1 = np.where(isLeft, newValues, y2)
+        newY2 = np.where(isLeft, y1, newValues)
+        uppers, lowers, x1, x2, y1, y2 = (
+            np.where(isActive, new, old)
+            for new, old in zip(
+                [newUppers, newLowers, newX1, newX2, newY1, newY2],
+                [uppers, lowers, x1, x2, y1, y2],
+            )
+        )
+        isActive = uppers - lowers > xtol * uppers
+    return (lowers + uppers) / 2
+
+
+def findResonances(cables, endCondition, nResonances=5, xtol=1e-10):
+    """
+    損失のある線路について、最初のnResonances個の共振周波数(|H|が極大)と
+    反共振周波数(|H|が極小)、およびその周波数における伝達関数を求める
+
+    無損失線路の公式で求めた周波数を初期値とし、その前後の区間で|H|の極値を探索する
+    探索は全てのケーブルについて配列演算でまとめて行う
+
+    Parameters
+    ----------
+    cables : instance
+        Cableクラスのインスタンス、そのリスト、またはCableArrayのインスタンス
+    endCondition: dict
+        受電端の抵抗の条件
+    nResonances : int
+        求める共振周波数(反共振周波数)の個数
+    xtol : float
+        周波数の相対的な許容誤差
+
+    Returns
+    -------
+    resonances : dict
+        resonanceFrequencies, resonanceTfs, antiresonanceFrequencies, antiresonanceTfs をキーに持つ辞書
+        Cableインスタンスを1つだけ与えた場合は形状が(nResonances,)、
+        それ以外の場合は(ケーブルの数, nResonances)の配列になる
+        整合に近いケーブルの周波数と伝達関数はNaNになる
+    """
+    isSingleCable = isinstance(cables, (cableModules.Cable, cableModules.CableView))
+    cables = _toCableArray(cables)
+    seeds_resonance, seeds_antiresonance = calcLosslessResonanceFrequencies(
+        cables, endCondition, nResonances
+    )
+    # 隣り合う共振周波数と反共振周波数の間隔 1 / (4 * l * √(LC))
+    spacings = (
+        1
+        / (4 * cables.lengths * np.sqrt(cables.inductances * cables.capacitances))[
+            :, np.newaxis
+        ]
+    )
+    halfWidths = 0.45 * spacings
+
+    # 整合に近いケーブル(初期値がNaN)は探索しない
+    isResonant = ~np.isnan(seeds_resonance[:, 0])
+    resonantCables = cables[isResonant]
+
+    resonances = {}
+    for name, seeds, shouldFindMaximum in [
+        ("resonance", seeds_resonance, True),
+        ("antiresonance", seeds_antiresonance, False),
+    ]:
+        frequencies_Hz = np.full(seeds.shape, np.nan)
+        tfs = np.full(seeds.shape, np.nan, dtype=complex)
+        if np.any(isResonant):
+            frequencies_Hz[isResonant] = _searchExtremums(
+                seeds[isResonant] - halfWidths[isResonant],
+                seeds[isResonant] + halfWidths[isResonant],
+                resonantCables,
+                endCondition,
+                shouldFindMaximum,
+                xtol,
+            )
+            tfs[isResonant] = _calcTfs(
+                frequencies_Hz[isResonant], resonantCables, endCondition
+            )
+        if isSingleCable:
+            frequencies_Hz = frequencies_Hz[0]
+            tfs = tfs[0]
+        resonances[f"{name}Frequencies"] = frequencies_Hz
+        resonances[f"{name}Tfs"] = tfs
+    return resonances
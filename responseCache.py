@@ -0,0 +1,257 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+import fftContext
+import transferFunction as tfModules
+
+
+def createResponseKey(cable, endCondition, samplingPeriod, nSamples):
+    """
+    ケーブルのパラメータ・受電端の条件・サンプリング周期・標本数から、キャッシュのキー(sha256)を作成する
+
+    Parameters
+    ----------
+    cable : instance
+        Cableクラスのインスタンス
+    endCondition: dict
+        受電端の抵抗の条件
+    samplingPeriod : float
+        サンプリング周期(s)
+    nSamples : int
+        標本数
+    """
+    parameters = createResponseParameters(cable, endCondition, samplingPeriod, nSamples)
+    text = json.dumps(parameters, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def createResponseParameters(cable, endCondition, samplingPeriod, nSamples):
+    # 浮動小数点数はreprで文字列にして、値が同じなら必ず同じキーになるようにする
+    return {
+        "resistance": repr(float(cable.resistance)),
+        "inductance": repr(float(cable.inductance)),
+        "conductance": repr(float(cable.conductance)),
+        "capacitance": repr(float(cable.capacitance)),
+        "length": repr(float(cable.length)),
+        "shouldMatching": bool(endCondition["shouldMatching"]),
+        "impedance": repr(complex(endCondition["impedance"])),
+        "samplingPeriod": repr(float(samplingPeriod)),
+        "nSamples": int(nSamples),
+    }
+
+
+class ResponseCache:
+    """
+    インパルス応答h(t)とステップ応答をディスクに.npyとして保存し、メモリマップで読み込むキャッシュ
+
+    キーはケーブルのパラメータ・受電端の条件・サンプリング周期・標本数のハッシュで、
+    合計サイズがmaxBytesを超えた場合は最後に使われた時刻が古いものから削除する
+    メモリに保持するインパルス応答のスペクトルも、同じmaxBytesを上限として古いものから削除する
+
+    Parameters
+    ----------
+    directory : string
+        キャッシュを保存するディレクトリ
+    maxBytes : int
+        キャッシュの合計サイズの上限(byte)
+    """
+
+    def __init__(self, directory=".responseCache", maxBytes=1024 ** 3):  # イニシャライザ
+        self.directory = directory
+        self.maxBytes = maxBytes
+        # キーごとのインパルス応答のスペクトル(同じ応答で繰り返し畳み込む場合に再利用する)
+        # 最後に使われた順に並べ、合計サイズがmaxBytesを超えたら古いものから削除する
+        self._spectra = OrderedDict()
+        self._spectraBytes = 0
+
+    def _createPath(self, key, kind):
+        if kind == "metadata":
+            return os.path.join(self.directory, f"{key}.json")
+        return os.path.join(self.directory, f"{key}_{kind}.npy")
+
+    def _touch(self, key):
+        # メタデータの更新時刻を、最後に使われた時刻として使用する
+        os.utime(self._createPath(key, "metadata"))
+
+    def getResponses(self, cable, endCondition, samplingPeriod, nSamples):
+        """
+        インパルス応答とステップ応答を返す(キャッシュになければ計算して保存する)
+
+        返却する配列は読み込み専用のメモリマップ
+
+        Parameters
+        ----------
+        cable : instance
+            Cableクラスのインスタンス
+        endCondition: dict
+            受電端の抵抗の条件
+        samplingPeriod : float
+            サンプリング周期(s)
+        nSamples : int
+            標本数
+
+        Returns
+        -------
+        impulseResponses, stepResponses : ndarray
+            インパルス応答(1標本の単位インパルスに対する応答)とステップ応答
+        """
+        key = createResponseKey(cable, endCondition, samplingPeriod, nSamples)
+        if not os.path.exists(self._createPath(key, "metadata")):
+            self._store(key, cable, endCondition, samplingPeriod, nSamples)
+        else:
+            self._touch(key)
+        return (
+            np.load(self._createPath(key, "impulse"), mmap_mode="r"),
+            np.load(self._createPath(key, "step"), mmap_mode="r"),
+        )
+
+    def _store(self, key, cable, endCondition, samplingPeriod, nSamples):
+        frequencies_Hz = np.fft.rfftfreq(nSamples, samplingPeriod)
+        tfs = tfModules.createTransferFunctions(frequencies_Hz, endCondition, cable)
+        impulseResponses = np.fft.irfft(tfs, nSamples)
+        stepResponses = np.cumsum(impulseResponses)
+
+        os.makedirs(self.directory, exist_ok=True)
+        np.save(self._createPath(key, "impulse"), impulseResponses)
+        np.save(self._createPath(key, "step"), stepResponses)
+        # メタデータは最後に書き込み、存在すれば配列の保存が完了しているものとする
+        parameters = createResponseParameters(
+            cable, endCondition, samplingPeriod, nSamples
+        )
+        with open(self._createPath(key, "metadata"), "w") as file:
+            json.dump(parameters, file, indent=2)
+        self._evict(keep=key)
+
+    def getSpectrum(self, cable, endCondition, samplingPeriod, nSamples):
+        """
+        インパルス応答のスペクトルrfft(h)を返す(インスタンスの中に保持して再利用する)
+
+        Parameters
+        ----------
+        cable : instance
+            Cableクラスのインスタンス
+        endCondition: dict
+            受電端の抵抗の条件
+        samplingPeriod : float
+            サンプリング周期(s)
+        nSamples : int
+            標本数
+        """
+        key = createResponseKey(cable, endCondition, samplingPeriod, nSamples)
+        spectrum = self._spectra.get(key)
+        if spectrum is not None:
+            self._spectra.move_to_end(key)
+            return spectrum
+
+        impulseResponses, _ = self.getResponses(
+            cable, endCondition, samplingPeriod, nSamples
+        )
+        fft = fftContext.getFftContext(nSamples, samplingPeriod)
+        spectrum = fft.rfft(impulseResponses)
+        spectrum.setflags(write=False)
+        # 上限より大きいスペクトルは保持しない
+        if spectrum.nbytes <= self.maxBytes:
+            self._spectra[key] = spectrum
+            self._spectraBytes += spectrum.nbytes
+            while self._spectraBytes > self.maxBytes:
+                _, evicted = self._spectra.popitem(last=False)
+                self._spectraBytes -= evicted.nbytes
+        return spectrum
+
+    def convolve(self, inputWaves, cable, endCondition, samplingPeriod):
+        """
+        キャッシュしたインパルス応答と入力波形を畳み込んで出力波形を求める
+
+        squareWaveFftAndIfftと同じく、入力波形の長さを周期とする巡回畳み込みになる
+        インパルス応答のスペクトルはgetSpectrumで1回だけ求め、同じ条件の呼び出しで再利用する
+
+        Parameters
+        ----------
+        inputWaves : array_like
+            形状が(..., 標本数)の入力波形
+        cable : instance
+            Cableクラスのインスタンス
+        endCondition: dict
+            受電端の抵抗の条件
+        samplingPeriod : float
+            サンプリング周期(s)
+        """
+        inputWaves = np.asarray(inputWaves, dtype=float)
+        nSamples = inputWaves.shape[-1]
+        spectrum = self.getSpectrum(cable, endCondition, samplingPeriod, nSamples)
+        fft = fftContext.getFftContext(nSamples, samplingPeriod)
+        return fft.filter(inputWaves, spectrum)
+
+    def listEntries(self):
+        """
+        保存されているエントリの一覧を、最後に使われた時刻が新しい順に返す
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for fileName in os.listdir(self.directory):
+            if not fileName.endswith(".json"):
+                continue
+            key = fileName[: -len(".json")]
+            metadataPath = self._createPath(key, "metadata")
+            with open(metadataPath) as file:
+                parameters = json.load(file)
+            nBytes = sum(
+                os.path.getsize(path)
+                for path in [
+                    metadataPath,
+                    self._createPath(key, "impulse"),
+                    self._createPath(key, "step"),
+                ]
+                if os.path.exists(path)
+            )
+            entries.append(
+                {
+                    "key": key,
+                    "parameters": parameters,
+                    "nBytes": nBytes,
+                    "lastAccess": os.path.getmtime(metadataPath),
+                }
+            )
+        return sorted(entries, key=lambda entry: entry["lastAccess"], reverse=True)
+
+    def getTotalBytes(self):
+        """
+        保存されているエントリの合計サイズ(byte)を返す
+        """
+        return sum(entry["nBytes"] for entry in self.listEntries())
+
+    def purge(self, key=None):
+        """
+        エントリを削除する(keyを指定しない場合はすべて削除する)
+
+        Parameters
+        ----------
+        key : string
+            削除するエントリのキー
+        """
+        keys = [key] if key is not None else [e["key"] for e in self.listEntries()]
+        for key in keys:
+            spectrum = self._spectra.pop(key, None)
+            if spectrum is not None:
+                self._spectraBytes -= spectrum.nbytes
+            # メタデータを先に削除し、配列だけが残った状態を有効なエントリとみなさない
+            for kind in ["metadata", "impulse", "step"]:
+                path = self._createPath(key, kind)
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _evict(self, keep=None):
+        entries = self.listEntries()
+        totalBytes = sum(entry["nBytes"] for entry in entries)
+        for entry in reversed(entries):
+            if totalBytes <= self.maxBytes:
+                break
+            if entry["key"] == keep:
+                continue
+            self.purge(entry["key"])
+            totalBytes -= entry["nBytes"]
@@ -0,0 +1,273 @@
+import argparse
+import os
+
+import matplotlib
+
+# 画面のないサーバーでも実行できるよう、非対話的なバックエンドを使用する
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+import cable as cableModules
+import drawBodeFromCsv
+import frequencyResponse
+import simulateOutputWaveform
+from sub_codes import attenuationConstant
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # pyarrowがインストールされていない場合はParquetで保存できない
+    pyarrow = None
+
+isParquetAvailable = pyarrow is not None
+
+CABLES = {
+    "vertual": cableModules.cable_vertual,
+    "noLoss": cableModules.cable_noLoss_vertual,
+}
+END_CONDITIONS = {
+    "matching": {"shouldMatching": True, "impedance": 50},
+    "open": {"shouldMatching": False, "impedance": 1e6},
+    "short": {"shouldMatching": False, "impedance": 1e-6},
+    "50ohm": {"shouldMatching": False, "impedance": 50},
+}
+
+
+def saveResults(path, columns, fileFormat="auto"):
+    """
+    同じ長さの1次元配列の辞書を.npzまたはParquetで保存する
+
+    Parquetでは複素数の列を実部(_real)と虚部(_imag)の2列に分ける
+
+    Parameters
+    ----------
+    path : string
+        拡張子を除いた出力先のパス
+    columns : dict
+        列の名前をキー、1次元配列を値とする辞書
+    fileFormat : string
+        "npz", "parquet", "auto"(pyarrowがあればParquet, なければ.npz)
+
+    Returns
+    -------
+    path : string
+        保存したファイルのパス
+    """
+    if fileFormat == "auto":
+        fileFormat = "parquet" if isParquetAvailable else "npz"
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    if fileFormat == "npz":
+        np.savez_compressed(f"{path}.npz", **columns)
+        return f"{path}.npz"
+    if fileFormat == "parquet":
+        if not isParquetAvailable:
+            raise ValueError("Parquetで保存するにはpyarrowをインストールしてください")
+        data = {}
+        for name, values in columns.items():
+            values = np.asarray(values)
+            if np.iscomplexobj(values):
+                data[f"{name}_real"] = values.real
+                data[f"{name}_imag"] = values.imag
+            else:
+                data[name] = values
+        pd.DataFrame(data).to_parquet(f"{path}.parquet")
+        return f"{path}.parquet"
+    raise ValueError(f"保存形式が不正です: {fileFormat}")
+
+
+def saveFigures(path, figs, names):
+    """
+    描画したグラフをPNGで保存する
+
+    Parameters
+    ----------
+    path : string
+        拡張子を除いた出力先のパス
+    figs : list
+        Figureのリスト
+    names : list
+        出力先のパスの末尾に付ける、グラフごとの名前のリスト
+
+    Returns
+    -------
+    paths : list
+        保存したファイルのパスのリスト
+    """
+    paths = []
+    for fig, name in zip(figs, names):
+        fig.tight_layout()
+        fig.savefig(f"{path}_{name}.png")
+        paths.append(f"{path}_{name}.png")
+    return paths
+
+
+def runSweep(args):
+    """
+    受電端の条件ごとの伝達関数を求める(frequencyResponse.drawFrequencyResponse)
+    """
+    cable = CABLES[args.cable]
+    frequencies_Hz = np.linspace(args.start, args.stop, args.num)
+    conditions = [END_CONDITIONS[name] for name in args.conditions]
+    tfs, figs = frequencyResponse.drawFrequencyResponse(
+        frequencies_Hz, cable, conditions=conditions, shouldShow=False
+    )
+
+    columns = {"frequency": frequencies_Hz}
+    for i, name in enumerate(args.conditions):
+        columns[f"H_{name}"] = tfs.isel(endCondition=i).values
+    paths = [saveResults(args.output, columns, args.format)]
+    if args.png:
+        paths.extend(saveFigures(args.output, figs, args.conditions))
+    return paths
+
+
+def runWaveform(args):
+    """
+    パルスを入力したときの受電端・送電端の電圧波形を求める
+    (simulateOutputWaveform.squareWaveFftAndIfft)
+    """
+    cable = CABLES[args.cable]
+    columns = {}
+    paths = []
+    for name in args.conditions:
+        result = simulateOutputWaveform.squareWaveFftAndIfft(
+            cable,
+            END_CONDITIONS[name],
+            showMeasuredValue=args.measured,
+            shouldShow=False,
+        )
+        columns["time"] = result["times"]
+        columns["source"] = result["inputWaves"]
+        columns[f"c1_{name}"] = result["c1Waves"]
+        columns[f"c2_{name}"] = result["c2Waves"]
+        if args.png:
+            paths.extend(
+                saveFigures(
+                    f"{args.output}_{name}",
+                    result["figs"],
+                    range(len(result["figs"])),
+                )
+            )
+        plt.close("all")
+    return [saveResults(args.output, columns, args.format)] + paths
+
+
+def runBodeAnalysis(args):
+    """
+    ボード線図のCSVから、周波数の範囲ごとの山と谷の周波数を求める(drawBodeFromCsv)
+    """
+    result, fig = drawBodeFromCsv.drawBodeFromCsv(
+        args.csv, args.skiprows, shouldShow=False
+    )
+
+    columns = {
+        "peakFrequency": result["peakFrequencies"],
+        "peakAmp": result["peakAmps"],
+        "valleyFrequency": result["valleyFrequencies"],
+        "valleyAmp": result["valleyAmps"],
+    }
+    paths = [saveResults(args.output, columns, args.format)]
+    if args.png:
+        paths.extend(saveFigures(args.output, [fig], ["amplitude"]))
+    return paths
+
+
+def runAttenuation(args):
+    """
+    周波数ごとの減衰定数と特性インピーダンスを求める
+    (sub_codes/attenuationConstant.drawAttenuationConstantAndCharaImpedance)
+    """
+    cable = CABLES[args.cable]
+    frequencies_Hz = np.logspace(np.log10(args.start), np.log10(args.stop), args.num)
+    alphas_db, characteristicImpedances, fig = (
+        attenuationConstant.drawAttenuationConstantAndCharaImpedance(
+            frequencies_Hz, cable, shouldShowOneGlaph=False
+        )
+    )
+    columns = {
+        "frequency": frequencies_Hz,
+        "alpha_dB_per_km": alphas_db * 1000,
+        "characteristicImpedance": characteristicImpedances,
+    }
+    paths = [saveResults(args.output, columns, args.format)]
+    if args.png:
+        paths.extend(saveFigures(args.output, [fig], ["alpha"]))
+    return paths
+
+
+def createParser():
+    parser = argparse.ArgumentParser(
+        description="分布定数線路のシミュレーションを画面なしで実行し、結果をファイルに保存する"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def addCommonArguments(subparser, defaultOutput):
+        subparser.add_argument(
+            "--output", default=defaultOutput, help="拡張子を除いた出力先のパス"
+        )
+        subparser.add_argument(
+            "--format", choices=["auto", "npz", "parquet"], default="auto"
+        )
+        subparser.add_argument(
+            "--png", action="store_true", help="グラフをPNGで保存する"
+        )
+
+    sweepParser = subparsers.add_parser("sweep", help="伝達関数の周波数特性")
+    addCommonArguments(sweepParser, "results/sweep")
+    sweepParser.add_argument("--cable", choices=list(CABLES), default="vertual")
+    sweepParser.add_argument("--start", type=float, default=0)
+    sweepParser.add_argument("--stop", type=float, default=50e6)
+    sweepParser.add_argument("--num", type=int, default=5001)
+    sweepParser.add_argument(
+        "--conditions",
+        nargs="+",
+        choices=list(END_CONDITIONS),
+        default=["matching", "open", "short"],
+    )
+    sweepParser.set_defaults(function=runSweep)
+
+    waveformParser = subparsers.add_parser(
+        "waveform", help="パルス入力に対する電圧波形"
+    )
+    addCommonArguments(waveformParser, "results/waveform")
+    waveformParser.add_argument("--cable", choices=list(CABLES), default="vertual")
+    waveformParser.add_argument(
+        "--measured", action="store_true", help="測定した波形を重ねて表示する"
+    )
+    waveformParser.add_argument(
+        "--conditions",
+        nargs="+",
+        choices=list(END_CONDITIONS),
+        default=["50ohm", "open"],
+    )
+    waveformParser.set_defaults(function=runWaveform)
+
+    bodeParser = subparsers.add_parser("bode-analysis", help="ボード線図の山と谷")
+    addCommonArguments(bodeParser, "results/bodeAnalysis")
+    bodeParser.add_argument("--csv", default="csv/bode_rg58au.csv")
+    bodeParser.add_argument("--skiprows", type=int, default=27)
+    bodeParser.set_defaults(function=runBodeAnalysis)
+
+    attenuationParser = subparsers.add_parser("attenuation", help="減衰定数")
+    addCommonArguments(attenuationParser, "results/attenuation")
+    attenuationParser.add_argument("--cable", choices=list(CABLES), default="vertual")
+    attenuationParser.add_argument("--start", type=float, default=1e3)
+    attenuationParser.add_argument("--stop", type=float, default=1e9)
+    attenuationParser.add_argument("--num", type=int, default=601)
+    attenuationParser.set_defaults(function=runAttenuation)
+
+    return parser
+
+
+def main(argv=None):
+    args = createParser().parse_args(argv)
+    for path in args.function(args):
+        print(f"保存しました: {path}")
+    plt.close("all")
+
+
+if __name__ == "__main__":
+    main()
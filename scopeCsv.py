@@ -0,0 +1,197 @@
+import numpy as np
+
+import util
+
+# ヘッダーの項目名と、ScopeMetadataの属性名・値の型の対応
+HEADER_FIELDS = {
+    "Record Length": ("recordLength", int),
+    "Sample Interval": ("sampleInterval", float),
+    "Vertical Units": ("verticalUnits", str),
+    "Vertical Scale": ("verticalScale", float),
+    "Vertical Offset": ("verticalOffset", float),
+    "Horizontal Units": ("horizontalUnits", str),
+    "Horizontal Scale": ("horizontalScale", float),
+    "Model Number": ("modelNumber", str),
+    "Serial Number": ("serialNumber", str),
+    "Software Version": ("softwareVersion", str),
+    "Source": ("source", str),
+}
+
+
+class ScopeMetadata:
+    """
+    オシロスコープ(T3DSO2204A)の波形のCSVのヘッダーの情報
+
+    "Sample Interval,CH1:5.000000E-10"のようにチャンネル名が付いた値は、
+    チャンネル名をchannelに、値を対応する属性に型を変換して保持する
+
+    Attributes
+    ----------
+    recordLength : int
+        標本数
+    sampleInterval : float
+        サンプリング周期(s)
+    verticalScale, verticalOffset : float
+        垂直軸の1目盛りあたりの電圧とオフセット(V)
+    horizontalScale : float
+        水平軸の1目盛りあたりの時間(s)
+    channel : string
+        チャンネル名(例: CH1)
+    columnNames : list
+        データの列の名前(例: ["Second", "Value"])
+    headerLines : int
+        データの前の行数(列の名前の行を含む)
+    startTime : float
+        最初の標本の時刻(s)
+    fields : dict
+        ヘッダーの項目名と値の文字列の辞書
+    """
+
+    def __init__(self):  # イニシャライザ
+        for attribute, _ in HEADER_FIELDS.values():
+            setattr(self, attribute, None)
+        self.channel = None
+        self.columnNames = []
+        self.headerLines = 0
+        self.startTime = None
+        self.fields = {}
+
+    @classmethod
+    def fromHeaderLines(cls, lines):
+        """
+        データの前の行(列の名前の行を含む)からメタデータを作成する
+
+        Parameters
+        ----------
+        lines : list
+            ヘッダーの各行の文字列
+        """
+        metadata = cls()
+        metadata.headerLines = len(lines)
+        for line in lines[:-1]:
+            # CH2のCSVでは"Sample Interval, CH2:1.0E-09"のようにカンマの後に空白が入る
+            key, _, value = line.strip().partition(",")
+            key = key.strip()
+            value = value.strip()
+            metadata.fields[key] = value
+            if key not in HEADER_FIELDS:
+                continue
+            attribute, convert = HEADER_FIELDS[key]
+            channel, separator, value = value.rpartition(":")
+            channel = channel.strip()
+            value = value.strip()
+            if separator and channel.startswith("CH"):
+                metadata.channel = channel
+            setattr(metadata, attribute, convert(value))
+        if lines:
+            metadata.columnNames = [
+                name.strip() for name in lines[-1].strip().split(",")
+            ]
+        return metadata
+
+    def __repr__(self):
+        return (
+            f"ScopeMetadata(source={self.source!r}, "
+            f"recordLength={self.recordLength}, "
+            f"sampleInterval={self.sampleInterval})"
+        )
+
+
+class ScopeCapture:
+    """
+    オシロスコープで取得した波形(時刻と電圧の配列およびヘッダーの情報)
+
+    Parameters
+    ----------
+    metadata : instance
+        ScopeMetadataのインスタンス
+    times : ndarray
+        時刻(s)の配列
+    values : ndarray
+        電圧(V)の配列
+    """
+
+    def __init__(self, metadata, times, values):  # イニシャライザ
+        self.metadata = metadata
+        self.times = times
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return f"ScopeCapture({self.metadata!r}, nSamples={len(self)})"
+
+
+def readScopeHeader(path):
+    """
+    CSVの先頭から数値のデータが始まるまでの行を読み込み、ヘッダーの情報を返す
+
+    Parameters
+    ----------
+    path : string
+        CSVファイルのパス
+    """
+    lines = []
+    with open(path) as file:
+        for line in file:
+            firstField = line.split(",", 1)[0]
+            if util.isNumber(firstField):
+                metadata = ScopeMetadata.fromHeaderLines(lines)
+                metadata.startTime = float(firstField)
+                return metadata
+            lines.append(line)
+    raise ValueError(f"CSVに数値のデータが見つかりません: {path}")
+
+
+def readScopeCsv(path, useSampleInterval=True, valueColumn="Value"):
+    """
+    オシロスコープの波形のCSVを読み込む
+
+    数値の部分はnp.loadtxt(C言語で実装されたパーサー)でfloat64の配列として直接読み込み、
+    pandasのDataFrameやリストへの変換を行わない
+    useSampleIntervalがTrueの場合、時刻の列は読み込まずにSample Intervalから時刻の配列を作成する
+
+    Parameters
+    ----------
+    path : string
+        CSVファイルのパス
+    useSampleInterval : bool
+        Trueの場合、ヘッダーのSample Intervalから時刻の配列を作成する
+    valueColumn : string
+        電圧の列の名前
+
+    Returns
+    -------
+    capture : instance
+        ScopeCaptureのインスタンス
+    """
+    metadata = readScopeHeader(path)
+    if valueColumn not in metadata.columnNames:
+        raise ValueError(f"電圧の列が見つかりません: {valueColumn}")
+    valueIndex = metadata.columnNames.index(valueColumn)
+
+    if useSampleInterval and metadata.sampleInterval is not None:
+        values = np.loadtxt(
+            path,
+            dtype=np.float64,
+            delimiter=",",
+            skiprows=metadata.headerLines,
+            usecols=valueIndex,
+            ndmin=1,
+        )
+        times = metadata.startTime + np.arange(len(values)) * metadata.sampleInterval
+    else:
+        data = np.loadtxt(
+            path,
+            dtype=np.float64,
+            delimiter=",",
+            skiprows=metadata.headerLines,
+            usecols=(0, valueIndex),
+            ndmin=2,
+        )
+        times = data[:, 0]
+        values = data[:, 1]
+        if metadata.sampleInterval is None and len(times) > 1:
+            metadata.sampleInterval = (times[-1] - times[0]) / (len(times) - 1)
+    return ScopeCapture(metadata, times, values)
@@ -4,14 +4,37 @@ matplotlib.rc("font", family="Noto Sans CJK JP")
 import matplotlib.pyplot as plt
 
 import numpy as np
-import pandas as pd
 
 import transferFunction as tfModules
 import cable
-import util
-
-
-def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
+import delayEstimation
+import fftContext
+import plotDecimation
+import scopeCsv
+import waveforms
+
+
+def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False, shouldShow=True):
+    """
+    パルスを入力したときの受電端(C1)と送電端(C2)の電圧波形をFFTとIFFTで求め、グラフに表示する
+
+    Parameters
+    ----------
+    cable : instance
+        Cableクラスのインスタンス
+    endCondition: dict
+        受電端の抵抗の条件
+    showMeasuredValue : bool
+        Trueの場合、オシロスコープで測定した波形を重ねて表示する
+    shouldShow : bool
+        Trueの場合、描画したグラフをすぐに表示する
+
+    Returns
+    -------
+    result : dict
+        times(時刻), inputWaves(入力波形), c1Waves(受電端の電圧), c2Waves(送電端の電圧),
+        figs(描画したグラフのFigureのリスト)
+    """
     input_wave_frequency = 100e3  # 100[kHz]
     timeLength = 10000
     samplingFrequency = (
@@ -27,27 +50,22 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
     # 足し合わされる波は、入力波の周波数の整数倍の周波数を持つ
     # squareWaves_time = np.sign(np.sin(2 * np.pi * input_wave_frequency * times))
 
-    # 指定したDuty比になるようリストの数値を調整する
+    # 指定したDuty比になるよう、0以降の最初の標本から周期10μsのパルスを1つだけ立てる
     dutyRate = 2  # [%]
-    squareWaves_time = [0] * (len(times))
-    riseLength = int(
-        len([time for time in times if 0 <= time and time <= 10e-6]) * dutyRate / 100
-    )
-    count = 0
-    for i in range(len(times)):
-        if 0 <= times[i] and times[i] <= 10e-6 and count < riseLength:
-            squareWaves_time[i] = 1
-            count += 1
-    squareWaves_time[0] = 0  # 先頭の要素を0にしてパルス波の頭とケツを一致させる
     coef = 2
-    squareWaves_time = [n * coef for n in squareWaves_time]
+    squareWaves_time = waveforms.createPulseTrain(
+        times,
+        period=10e-6,
+        duty=dutyRate / 100,
+        amplitude=coef,
+        delay=times[times >= 0][0],
+        nPulses=1,
+    )
 
-    ratio = len(
-        list(filter(lambda y: True if y == 1 * coef else False, squareWaves_time))
-    ) / len(
-        [time for time in times if 0 <= time and time <= 10e-6]
-    )  # len(squareWaves_time)
     # デューティー比は、パルス幅を周期で割り算したもの
+    ratio = waveforms.calcDutyCycle(
+        squareWaves_time, times, start=0, stop=10e-6, level=coef
+    )
     print(f"デューティー比: {ratio * 100}%")
 
     # fig, axes = plt.subplots(3, 2)
@@ -60,7 +78,7 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
     xlast = 0.5
 
     inputWaves_time = squareWaves_time
-    axes[0].plot([time * 1e6 for time in times], inputWaves_time)
+    plotDecimation.plotDecimated(axes[0], times * 1e6, inputWaves_time)
     axes[0].set_ylabel("Amp[V]", fontsize=FONT_SIZE)
     axes[0].set_xlabel("Time[μs]", fontsize=FONT_SIZE)
     axes[0].set_xlim(xfirst, xlast)
@@ -83,19 +101,19 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
     # numpy.fft.fft()の戻り値は、長さnの複素数配列
     # inputWaves_fft = np.fft.fft(inputWaves_time)
     # 工学系の用途向けに、実数のFFTに特化した np.fft.rfft が用意されている。
-    inputWaves_fft = np.fft.rfft(inputWaves_time)
+    # 同じ時間軸のシミュレーションでは、変換長の選択と作業用の配列を使い回す
+    fft = fftContext.getFftContext(len(times), 1 / samplingFrequency)
+    inputWaves_fft = fft.rfft(inputWaves_time)
 
     # 離散フーリエ変換のサンプル周波数を返す（rfft, irfftで使用するため）
     # np.fft.fftfreq(FFTを行うデータ点数, サンプリング周期)
     # # サンプリング周期次第で時系列データの時間軸の長さが決定する（100点, 0.01）なら100 * 0.01[s]の時系列データということになる？
     # input_wave_frequencyの整数倍の周波数のリストになる
     # DFTは長さnのリストを, 長さnの複素数リストに変換する
-    frequencies = np.fft.rfftfreq(len(inputWaves_time), 1 / samplingFrequency)
+    frequencies = fft.frequencies
     # print(frequencies) # [0.000e+00 1.000e+05 2.000e+05 ... 9.998e+08 9.999e+08 1.000e+09]
 
-    axes[1].plot(
-        [freq / 1e6 for freq in frequencies[:51]], np.abs(inputWaves_fft)[:51]
-    )  # absで振幅を取得
+    axes[1].plot(frequencies[:51] / 1e6, np.abs(inputWaves_fft)[:51])  # absで振幅を取得
     axes[1].set_ylabel("Amp", fontsize=FONT_SIZE)
     axes[1].set_xlabel("Frequency[MHz]", fontsize=FONT_SIZE)
     axes[1].tick_params(axis="y", labelsize=FONT_SIZE)
@@ -109,8 +127,8 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
     )
 
     axes[2].plot(
-        [freq / 1e6 for freq in frequencies[:51]],
-        list(map(lambda tf: util.convertGain2dB(tf), tfs))[:51],
+        frequencies[:51] / 1e6,
+        20 * np.log10(np.abs(tfs[:51])),
     )
     axes[2].set_ylabel("$H_{dB}$[dB]", fontsize=FONT_SIZE)
     axes[2].set_xlabel("Frequency[MHz]", fontsize=FONT_SIZE)
@@ -124,7 +142,7 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
 
     # C1(出力電圧)
     axes[3].plot(
-        [freq / 1e6 for freq in frequencies[:2501]],
+        frequencies[:2501] / 1e6,
         np.abs(convolution_out)[:2501],
         label="シミュレーション",
         linestyle="dashed" if showMeasuredValue else "solid",
@@ -139,29 +157,29 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
     ### 実測値の周波数応答
     if showMeasuredValue:
         if endCondition["impedance"] == 50:
-            # df = pd.read_csv("csv/c1_200ns_50ohm.csv", skiprows=11)
-            df = pd.read_csv("csv/c1_200ns_50ohm_c2_1Mohm.csv", skiprows=11)
-            seconds = list(df["Second"])
-            values = list(df["Value"])
+            # capture = scopeCsv.readScopeCsv("csv/c1_200ns_50ohm.csv")
+            capture = scopeCsv.readScopeCsv("csv/c1_200ns_50ohm_c2_1Mohm.csv")
+            values = capture.values
             outputWaves_50ohm_fft = np.fft.rfft(values)
             frequencies_out_50ohm = np.fft.rfftfreq(
-                len(values), seconds[2] - seconds[1]
+                len(values), capture.metadata.sampleInterval
             )
             axes[3].plot(
-                [freq / 1e6 for freq in frequencies_out_50ohm[:101]],
+                frequencies_out_50ohm[:101] / 1e6,
                 np.abs(outputWaves_50ohm_fft[:101]),
                 label="実測値",
                 zorder=1,
             )  # absで振幅を取得
             axes[3].legend(fontsize=FONT_SIZE - 2)
         elif endCondition["impedance"] == 1e6:
-            df = pd.read_csv("csv/c1_200ns_open.csv", skiprows=11)
-            seconds = list(df["Second"])
-            values = list(df["Value"])
+            capture = scopeCsv.readScopeCsv("csv/c1_200ns_open.csv")
+            values = capture.values
             outputWaves_open_fft = np.fft.rfft(values)
-            frequencies_out_open = np.fft.rfftfreq(len(values), seconds[2] - seconds[1])
+            frequencies_out_open = np.fft.rfftfreq(
+                len(values), capture.metadata.sampleInterval
+            )
             axes[3].plot(
-                [freq / 1e6 for freq in frequencies_out_open[:51]],
+                frequencies_out_open[:51] / 1e6,
                 np.abs(outputWaves_open_fft[:51]),
                 label="実測値",
                 zorder=1,
@@ -170,17 +188,16 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
     ### 実測値の周波数応答
 
     # C2(入力電圧)
-    tfs_sg = []  # 受電端抵抗を分布定数線路の送電端から見たインピーダンスとし、SGをF行列とした時の伝達関数
-    for frequency_Hz in frequencies:
-        # 送電端から見たインピーダンスを計算する
-        Z11 = tfModules.calcImpedanceAsSeenFromTransmissionEnd(
-            frequency_Hz, cable, endCondition
-        )
-        tfs_sg.append(Z11 / (50 + Z11))
-    convolution_input = np.array(inputWaves_fft) * np.array(tfs_sg)
+    # 受電端抵抗を分布定数線路の送電端から見たインピーダンスとし、SGをF行列とした時の伝達関数
+    # 送電端から見たインピーダンスを全周波数について一括で計算する
+    Z11 = tfModules.calcImpedancesAsSeenFromTransmissionEnd(
+        frequencies, cable, endCondition
+    )
+    tfs_sg = Z11 / (50 + Z11)
+    convolution_input = np.array(inputWaves_fft) * tfs_sg
 
     axes[4].plot(
-        [freq / 1e6 for freq in frequencies[:2501]],
+        frequencies[:2501] / 1e6,
         np.abs(convolution_input)[:2501],
         label="シミュレーション",
         linestyle="dashed" if showMeasuredValue else "solid",
@@ -195,31 +212,29 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
     ### 実測値の周波数応答
     if showMeasuredValue:
         if endCondition["impedance"] == 50:
-            # df = pd.read_csv("csv/c2_200ns_50ohm.csv", skiprows=11)
-            df = pd.read_csv("csv/c2_200ns_50ohm_c2_1Mohm.csv", skiprows=11)
-            seconds = list(df["Second"])
-            values = list(df["Value"])
+            # capture = scopeCsv.readScopeCsv("csv/c2_200ns_50ohm.csv")
+            capture = scopeCsv.readScopeCsv("csv/c2_200ns_50ohm_c2_1Mohm.csv")
+            values = capture.values
             inputWaves_50ohm_fft = np.fft.rfft(values)
             frequencies_input_50ohm = np.fft.rfftfreq(
-                len(values), seconds[2] - seconds[1]
+                len(values), capture.metadata.sampleInterval
             )
             axes[4].plot(
-                [freq / 1e6 for freq in frequencies_input_50ohm[:101]],
+                frequencies_input_50ohm[:101] / 1e6,
                 np.abs(inputWaves_50ohm_fft[:101]),
                 label="実測値",
                 zorder=1,
             )  # absで振幅を取得
             axes[4].legend(fontsize=FONT_SIZE - 2)
         elif endCondition["impedance"] == 1e6:
-            df = pd.read_csv("csv/c2_200ns_open.csv", skiprows=11)
-            seconds = list(df["Second"])
-            values = list(df["Value"])
+            capture = scopeCsv.readScopeCsv("csv/c2_200ns_open.csv")
+            values = capture.values
             inputWaves_open_fft = np.fft.rfft(values)
             frequencies_input_open = np.fft.rfftfreq(
-                len(values), seconds[2] - seconds[1]
+                len(values), capture.metadata.sampleInterval
             )
             axes[4].plot(
-                [freq / 1e6 for freq in frequencies_input_open[:51]],
+                frequencies_input_open[:51] / 1e6,
                 np.abs(inputWaves_open_fft[:51]),
                 label="実測値",
                 zorder=1,
@@ -233,10 +248,11 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
     # 33点のrfft結果を入力すれば64点の時間領域信号が得られる。
     # 入力波形が実数値のみなので、出力波形も虚数部分は捨ててよい？
 
-    r = np.fft.irfft(convolution_out, len(times))
+    r = fft.irfft(convolution_out)
 
-    axes[5].plot(
-        [time * 1e6 for time in times],
+    plotDecimation.plotDecimated(
+        axes[5],
+        times * 1e6,
         np.real(r),
         zorder=2,
         label="シミュレーション",
@@ -252,23 +268,33 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
     ### 実測値の時間応答
     if showMeasuredValue:
         if endCondition["impedance"] == 50:
-            # df = pd.read_csv("csv/c1_200ns_50ohm.csv", skiprows=11)
-            df = pd.read_csv("csv/c1_200ns_50ohm_c2_1Mohm.csv", skiprows=11)
-            seconds = list(df["Second"])
-            values = list(df["Value"])
-            axes[5].plot(
-                [s * 1e6 + 0.03 for s in seconds],
+            # capture = scopeCsv.readScopeCsv("csv/c1_200ns_50ohm.csv")
+            capture = scopeCsv.readScopeCsv("csv/c1_200ns_50ohm_c2_1Mohm.csv")
+            seconds = capture.times
+            values = capture.values
+            # シミュレーションとの時間のずれを相互相関で求めて補正する
+            offset = delayEstimation.estimateTimeOffset(
+                times, np.real(r), seconds, values
+            )
+            plotDecimation.plotDecimated(
+                axes[5],
+                (seconds - offset) * 1e6,
                 values,
                 zorder=1,
                 label="実測値",
             )
             axes[5].legend(fontsize=FONT_SIZE - 2)
         elif endCondition["impedance"] == 1e6:
-            df = pd.read_csv("csv/c1_200ns_open.csv", skiprows=11)
-            seconds = list(df["Second"])
-            values = list(df["Value"])
-            axes[5].plot(
-                [s * 1e6 for s in seconds],
+            capture = scopeCsv.readScopeCsv("csv/c1_200ns_open.csv")
+            seconds = capture.times
+            values = capture.values
+            # シミュレーションとの時間のずれを相互相関で求めて補正する
+            offset = delayEstimation.estimateTimeOffset(
+                times, np.real(r), seconds, values
+            )
+            plotDecimation.plotDecimated(
+                axes[5],
+                (seconds - offset) * 1e6,
                 values,
                 zorder=1,
                 label="実測値",
@@ -276,10 +302,11 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
             axes[5].legend(fontsize=FONT_SIZE - 2)
     ### 実測値の時間応答
 
-    r2 = np.fft.irfft(convolution_input, len(times))
+    r2 = fft.irfft(convolution_input)
 
-    axes[6].plot(
-        [time * 1e6 for time in times],
+    plotDecimation.plotDecimated(
+        axes[6],
+        times * 1e6,
         np.real(r2),
         label="シミュレーション",
         linestyle="dashed" if showMeasuredValue else "solid",
@@ -294,23 +321,33 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
     ### 実測値の時間応答
     if showMeasuredValue:
         if endCondition["impedance"] == 50:
-            # df = pd.read_csv("csv/c2_200ns_50ohm.csv", skiprows=11)
-            df = pd.read_csv("csv/c2_200ns_50ohm_c2_1Mohm.csv", skiprows=11)
-            seconds = list(df["Second"])
-            values = list(df["Value"])
-            axes[6].plot(
-                [s * 1e6 + 0.03 for s in seconds],
+            # capture = scopeCsv.readScopeCsv("csv/c2_200ns_50ohm.csv")
+            capture = scopeCsv.readScopeCsv("csv/c2_200ns_50ohm_c2_1Mohm.csv")
+            seconds = capture.times
+            values = capture.values
+            # シミュレーションとの時間のずれを相互相関で求めて補正する
+            offset = delayEstimation.estimateTimeOffset(
+                times, np.real(r2), seconds, values
+            )
+            plotDecimation.plotDecimated(
+                axes[6],
+                (seconds - offset) * 1e6,
                 values,
                 zorder=1,
                 label="実測値",
             )
             axes[6].legend(fontsize=FONT_SIZE - 2)
         elif endCondition["impedance"] == 1e6:
-            df = pd.read_csv("csv/c2_200ns_open.csv", skiprows=11)
-            seconds = list(df["Second"])
-            values = list(df["Value"])
-            axes[6].plot(
-                [s * 1e6 for s in seconds],
+            capture = scopeCsv.readScopeCsv("csv/c2_200ns_open.csv")
+            seconds = capture.times
+            values = capture.values
+            # シミュレーションとの時間のずれを相互相関で求めて補正する
+            offset = delayEstimation.estimateTimeOffset(
+                times, np.real(r2), seconds, values
+            )
+            plotDecimation.plotDecimated(
+                axes[6],
+                (seconds - offset) * 1e6,
                 values,
                 zorder=1,
                 label="実測値",
@@ -318,14 +355,23 @@ def squareWaveFftAndIfft(cable, endCondition, showMeasuredValue=False):
             axes[6].legend(fontsize=FONT_SIZE - 2)
     ### 実測値の時間応答
 
-    plt.tight_layout()
-    plt.show()
-
-
-# 受電端の抵抗が0のとき、断線していない正常のケーブル？
-squareWaveFftAndIfft(
-    cable.cable_vertual,
-    # {"shouldMatching": False, "impedance": 1e6},
-    {"shouldMatching": False, "impedance": 50},
-    showMeasuredValue=True,
-)
+    if shouldShow:
+        plt.tight_layout()
+        plt.show()
+    return {
+        "times": times,
+        "inputWaves": inputWaves_time,
+        "c1Waves": np.real(r),
+        "c2Waves": np.real(r2),
+        "figs": [ax.figure for ax in axes],
+    }
+
+
+if __name__ == "__main__":
+    # 受電端の抵抗が0のとき、断線していない正常のケーブル？
+    squareWaveFftAndIfft(
+        cable.cable_vertual,
+        # {"shouldMatching": False, "impedance": 1e6},
+        {"shouldMatching": False, "impedance": 50},
+        showMeasuredValue=True,
+    )
@@ -0,0 +1,239 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+import fftContext
+import scopeCsv
+import transferFunction as tfModules
+
+
+def createImpulseResponse(
+    cable,
+    endCondition,
+    samplingPeriod,
+    precursorTaps=64,
+    energyTolerance=1e-6,
+    maxTaps=2 ** 16,
+    nFftForDesign=2 ** 18,
+):
+    """
+    ケーブルの伝達関数H(f)から、打ち切ったインパルス応答(FIRフィルタの係数)を求める
+
+    H(f)を細かい周波数のグリッドで評価して逆フーリエ変換し、
+    末尾のエネルギーがenergyTolerance以下になる長さで打ち切る
+    帯域制限による負の時刻の応答(プリカーサ)はprecursorTaps点だけ先頭に残すため、
+    出力はprecursorTaps点だけ遅れる
+
+    Parameters
+    ----------
+    cable : instance
+        Cableクラスのインスタンス
+    endCondition: dict
+        受電端の抵抗の条件
+    samplingPeriod : float
+        サンプリング周期(s)
+    precursorTaps : int
+        先頭に残す負の時刻の点数(出力の遅延の点数になる)
+    energyTolerance : float
+        打ち切った部分のエネルギーの全体に対する比の上限
+    maxTaps : int
+        インパルス応答の点数の上限
+    nFftForDesign : int
+        インパルス応答を求めるときの変換長(2 * maxTaps以上)
+
+    Returns
+    -------
+    taps : ndarray
+        インパルス応答の係数(taps[precursorTaps]が時刻0に対応する)
+    """
+    nFftForDesign = max(nFftForDesign, 2 * maxTaps)
+    frequencies_Hz = np.fft.rfftfreq(nFftForDesign, samplingPeriod)
+    tfs = tfModules.createTransferFunctions(
+        frequencies_Hz, endCondition, cable, cache=None
+    )
+    responses = np.fft.irfft(tfs, nFftForDesign)
+
+    # 変換長の後半は負の時刻の応答のため、前半(正の時刻)の末尾から累積したエネルギーで打ち切る位置を決める
+    energies = responses[: nFftForDesign // 2] ** 2
+    tailEnergies = np.cumsum(energies[::-1])[::-1]
+    totalEnergy = np.sum(responses ** 2)
+    nTaps = np.count_nonzero(tailEnergies > energyTolerance * totalEnergy)
+    nTaps = min(max(nTaps, 1), maxTaps)
+
+    return np.concatenate(
+        [responses[nFftForDesign - precursorTaps :], responses[:nTaps]]
+    )
+
+
+class OverlapSaveSimulator:
+    """
+    重畳保存法(overlap-save)で入力波形をブロックごとにインパルス応答と畳み込むクラス
+
+    直前のブロックの末尾(インパルス応答の長さ - 1点)だけを保持するため、
+    記録の長さによらずメモリの使用量は一定で、周期的なFFTによる回り込みも生じない
+
+    Parameters
+    ----------
+    taps : array_like
+        インパルス応答の係数
+    latency : int
+        出力の遅延の点数(createImpulseResponseのprecursorTaps)
+    blockSize : int
+        1回の変換で処理する入力の点数(Noneの場合はインパルス応答の長さから決める)
+    """
+
+    def __init__(self, taps, latency=0, blockSize=None):  # イニシャライザ
+        self.taps = np.asarray(taps, dtype=float)
+        self.latency = latency
+        nTaps = len(self.taps)
+        if blockSize is None:
+            # 変換長がインパルス応答の4倍程度になるようにする
+            blockSize = max(fftContext.calcFastLength(4 * nTaps) - nTaps + 1, 1)
+        self.blockSize = blockSize
+        self.nFft = fftContext.calcFastLength(nTaps + blockSize - 1)
+        self._tapsSpectrum = np.fft.rfft(self.taps, self.nFft)
+        self._history = np.zeros(nTaps - 1)
+        self._buffer = np.empty(self.nFft)
+
+    @classmethod
+    def fromCable(cls, cable, endCondition, samplingPeriod, blockSize=None, **kwargs):
+        """
+        ケーブルの伝達関数からインパルス応答を求めてインスタンスを作成する
+
+        Parameters
+        ----------
+        cable : instance
+            Cableクラスのインスタンス
+        endCondition: dict
+            受電端の抵抗の条件
+        samplingPeriod : float
+            サンプリング周期(s)
+        blockSize : int
+            1回の変換で処理する入力の点数
+        kwargs : dict
+            createImpulseResponseに渡す引数
+        """
+        precursorTaps = kwargs.get("precursorTaps", 64)
+        taps = createImpulseResponse(cable, endCondition, samplingPeriod, **kwargs)
+        return cls(taps, latency=precursorTaps, blockSize=blockSize)
+
+    def reset(self):
+        """
+        保持している過去の入力を0に戻す
+        """
+        self._history[:] = 0
+
+    def process(self, inputWaves):
+        """
+        入力のブロックを畳み込み、同じ点数の出力を返す(出力はlatency点だけ遅れる)
+
+        Parameters
+        ----------
+        inputWaves : array_like
+            入力波形のブロック(長さは任意)
+        """
+        inputWaves = np.asarray(inputWaves, dtype=float)
+        nHistory = len(self._history)
+        outputWaves = np.empty(len(inputWaves))
+        for start in range(0, len(inputWaves), self.blockSize):
+            block = inputWaves[start : start + self.blockSize]
+            nInput = nHistory + len(block)
+
+            self._buffer[:nHistory] = self._history
+            self._buffer[nHistory:nInput] = block
+            self._buffer[nInput:] = 0
+            spectrum = np.fft.rfft(self._buffer) * self._tapsSpectrum
+            outputWaves[start : start + len(block)] = np.fft.irfft(spectrum, self.nFft)[
+                nHistory:nInput
+            ]
+
+            if nHistory > 0:
+                self._history[:] = self._buffer[nInput - nHistory : nInput]
+        return outputWaves
+
+    def processStream(self, blocks, compensateLatency=True):
+        """
+        入力のブロックを順に処理し、出力のブロックを順に返すジェネレータ
+
+        Parameters
+        ----------
+        blocks : iterable
+            入力波形のブロック(ジェネレータ、iterateArrayBlocks、iterateCsvBlocksなど)
+        compensateLatency : bool
+            Trueの場合、遅延の分だけ出力の先頭を捨て、最後に0を入力して末尾を出力する
+            (入力と時刻が揃い、合計の点数も入力と同じになる)
+        """
+        nSkip = self.latency if compensateLatency else 0
+        if compensateLatency and self.latency > 0:
+            # 遅延の分の0を最後に入力する(入力が遅延より短い場合も、先頭を捨てる処理は共通にする)
+            blocks = itertools.chain(blocks, [np.zeros(self.latency)])
+        for block in blocks:
+            outputWaves = self.process(block)
+            if nSkip > 0:
+                nSkipped = min(nSkip, len(outputWaves))
+                outputWaves = outputWaves[nSkipped:]
+                nSkip -= nSkipped
+            if len(outputWaves) > 0:
+                yield outputWaves
+
+    def simulate(self, inputWaves, blockSize=None):
+        """
+        入力波形全体をブロックに分けて処理し、入力と時刻を揃えた出力波形を返す
+
+        Parameters
+        ----------
+        inputWaves : array_like
+            入力波形(np.memmapでもよい)
+        blockSize : int
+            一度に読み出す入力の点数(Noneの場合はself.blockSize)
+        """
+        self.reset()
+        blocks = iterateArrayBlocks(inputWaves, blockSize or self.blockSize)
+        return np.concatenate([np.empty(0)] + list(self.processStream(blocks)))
+
+
+def iterateArrayBlocks(waves, blockSize):
+    """
+    配列(np.memmapなど)をブロックに分けて順に返すジェネレータ
+
+    np.memmapの場合は、ブロックごとに必要な部分だけがファイルから読み込まれる
+
+    Parameters
+    ----------
+    waves : array_like
+        波形の配列
+    blockSize : int
+        1ブロックの点数
+    """
+    for start in range(0, len(waves), blockSize):
+        yield np.asarray(waves[start : start + blockSize], dtype=float)
+
+
+def iterateCsvBlocks(path, blockSize, column="Value"):
+    """
+    オシロスコープのCSVをブロックに分けて読み込み、電圧の配列を順に返すジェネレータ
+
+    データが始まる行はscopeCsv.readScopeHeaderでヘッダーから求める
+
+    Parameters
+    ----------
+    path : string
+        CSVファイルのパス
+    blockSize : int
+        1ブロックの行数
+    column : string
+        電圧の列の名前
+    """
+    metadata = scopeCsv.readScopeHeader(path)
+    if column not in metadata.columnNames:
+        raise ValueError(f"電圧の列が見つかりません: {column}")
+    for df in pd.read_csv(
+        path,
+        skiprows=metadata.headerLines,
+        header=None,
+        names=metadata.columnNames,
+        usecols=[column],
+        chunksize=blockSize,
+    ):
+        yield df[column].to_numpy(dtype=float)
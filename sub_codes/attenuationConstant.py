@@ -15,20 +15,38 @@ import util
 def drawAttenuationConstantAndCharaImpedance(
     frequencies_Hz, cable, shouldShowOneGlaph=True
 ):
+    """
+    周波数ごとの減衰定数と特性インピーダンスをグラフに表示する
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    shouldShowOneGlaph : bool
+        Trueの場合、描画したグラフをすぐに表示する
+
+    Returns
+    -------
+    alphas_db : ndarray
+        減衰定数(dB/m)の配列
+    characteristicImpedances : ndarray
+        特性インピーダンスの配列
+    fig : instance
+        描画したグラフのFigure
+    """
+    frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
     fig, axes = plt.subplots(2, 1)
 
-    # 周波数ごとにalphaを求める
-    alphas_db = []
-    for frequency_Hz in tqdm(frequencies_Hz, leave=False):
-        #  5C-2V + Zrの回路の入力インピーダンスを受電端側の抵抗Zrとする
-        alpha_np = util.calcAttenuationConstant(frequency_Hz, cable)  # Np/m
-        alpha_db = util.np2db(alpha_np)  # dB/m
-        alphas_db.append(alpha_db)
+    # 全ての周波数についてalphaをまとめて求める
+    alphas_np = util.calcAttenuationConstant(frequencies_Hz, cable)  # Np/m
+    alphas_db = util.np2db(alphas_np)  # dB/m
     # 縦軸alpha, 横軸周波数でプロットする(alphaの値を1000倍して単位をdb/kmにしてプロットする？)
     FONT_SIZE = 12
     axes[0].plot(
         frequencies_Hz,
-        list(map(lambda x: x * 1000, alphas_db)),
+        alphas_db * 1000,
         label="vertual cable",
         zorder=5,
     )  # absで振幅を取得
@@ -49,16 +67,13 @@ def drawAttenuationConstantAndCharaImpedance(
         )
         axes[0].legend()
 
-    characteristicImpedances = []
-    for frequency_Hz in list(frequencies_Hz):
-        characteristicImpedances.append(
-            cableModules.cable_vertual.calcCharacteristicImpedance(frequency_Hz)
-        )
+    characteristicImpedances = cable.calcCharacteristicImpedances(frequencies_Hz)
     axes[1].plot(frequencies_Hz, np.abs(characteristicImpedances))
 
     if shouldShowOneGlaph:
         plt.tight_layout()
         plt.show()
+    return alphas_db, characteristicImpedances, fig
 
 
 # 横軸距離、縦軸減衰定数でグラフを描画する
@@ -98,23 +113,24 @@ def drawAttenuationConstantByDistance(cable):
     plt.show()
 
 
-drawAttenuationConstantAndCharaImpedance(
-    list(range(0, 220 * util.ONE_HUNDRED, 10000)), cableModules.cable_vertual
-)
-# drawAttenuationConstantByDistance(cableModules.cable_vertual)
-
-# print(
-#     util.calcConductanceFromAttenuationConstant(
-#         util.ONE_HUNDRED, cableModules.cable_vertual, 7.3 / 1000
-#     )
-# )
-# print(
-#     util.calcConductanceFromAttenuationConstant(
-#         10 * util.ONE_HUNDRED, cableModules.cable_vertual, 26 / 1000
-#     )
-# )
-# print(
-#     util.calcConductanceFromAttenuationConstant(
-#         200 * util.ONE_HUNDRED, cableModules.cable_vertual, 125 / 1000
-#     )
-# )
+if __name__ == "__main__":
+    drawAttenuationConstantAndCharaImpedance(
+        list(range(0, 220 * util.ONE_HUNDRED, 10000)), cableModules.cable_vertual
+    )
+    # drawAttenuationConstantByDistance(cableModules.cable_vertual)
+
+    # print(
+    #     util.calcConductanceFromAttenuationConstant(
+    #         util.ONE_HUNDRED, cableModules.cable_vertual, 7.3 / 1000
+    #     )
+    # )
+    # print(
+    #     util.calcConductanceFromAttenuationConstant(
+    #         10 * util.ONE_HUNDRED, cableModules.cable_vertual, 26 / 1000
+    #     )
+    # )
+    # print(
+    #     util.calcConductanceFromAttenuationConstant(
+    #         200 * util.ONE_HUNDRED, cableModules.cable_vertual, 125 / 1000
+    #     )
+    # )
@@ -0,0 +1,42 @@
+import time
+
+import numpy as np
+
+import cable as cableModules
+import jitKernels
+import transferFunction as tfModules
+
+if __name__ == "__main__":
+    # simulateOutputWaveform.pyと同じ周波数のグリッド(25001点)
+    frequencies_Hz = np.fft.rfftfreq(50000, 1e-9)
+    conditions = [
+        {"shouldMatching": True, "impedance": 50},
+        {"shouldMatching": False, "impedance": 1e6},
+        {"shouldMatching": False, "impedance": 50},
+        {"shouldMatching": False, "impedance": 1e-6},
+    ]
+    cables = [cableModules.cable_vertual, cableModules.cable_noLoss_vertual]
+
+    print(f"numba: {'有効' if jitKernels.isNumbaAvailable else '無効(NumPyで計算)'}")
+
+    # NumPyの計算結果と一致するか確認する(初回呼び出しでコンパイルされる)
+    for cable in cables:
+        for condition in conditions:
+            tfs_numpy = tfModules.createTransferFunctions(
+                frequencies_Hz, condition, cable, cache=None
+            )
+            tfs_numba = tfModules.createTransferFunctions(
+                frequencies_Hz, condition, cable, backend="numba"
+            )
+            np.testing.assert_allclose(tfs_numba, tfs_numpy, rtol=1e-10)
+    print("NumPyとnumbaの計算結果は一致しました")
+
+    for backend in ["numpy", "numba"]:
+        nRepeats = 20
+        start = time.perf_counter()
+        for _ in range(nRepeats):
+            tfModules.createTransferFunctions(
+                frequencies_Hz, conditions[1], cables[0], cache=None, backend=backend
+            )
+        elapsed = (time.perf_counter() - start) / nRepeats
+        print(f"{backend}: {elapsed * 1e3:.2f}[ms] ({len(frequencies_Hz)}点)")
@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+
+import cable as cableModules
+import exponentialRecurrence
+import transferFunction as tfModules
+
+
+def createFMatrixesByLoop(frequencies_Hz, cable):
+    return np.array(
+        [
+            tfModules.createFMatrixForDcc(
+                frequency_Hz, tfModules.calculateTheta(frequency_Hz, cable), cable
+            )
+            for frequency_Hz in frequencies_Hz
+        ]
+    )
+
+
+def measure(function, nRepeats):
+    start = time.perf_counter()
+    for _ in range(nRepeats):
+        function()
+    return (time.perf_counter() - start) / nRepeats
+
+
+if __name__ == "__main__":
+    # simulateOutputWaveform.pyと同じ周波数のグリッド(25001点)
+    frequencies_Hz = np.fft.rfftfreq(50000, 1e-9)
+    cables = [cableModules.cable_vertual, cableModules.cable_noLoss_vertual]
+
+    for cable in cables:
+        print(f"ケーブル長: {cable.length}[m], 抵抗: {cable.resistance}[Ω/m]")
+
+        # 精度の確認(createFMatrixForDccとの最大相対誤差)
+        f_matrixes_loop = createFMatrixesByLoop(frequencies_Hz, cable)
+        f_matrixes_recurrence = (
+            exponentialRecurrence.createFMatrixesForDccOnUniformGrid(
+                frequencies_Hz, cable
+            )
+        )
+        errors = np.abs(f_matrixes_recurrence - f_matrixes_loop) / np.max(
+            np.abs(f_matrixes_loop), axis=(1, 2), keepdims=True
+        )
+        print(f"  最大相対誤差: {np.max(errors):.3e}")
+
+        elapsed_loop = measure(lambda: createFMatrixesByLoop(frequencies_Hz, cable), 1)
+        elapsed_vectorized = measure(
+            lambda: tfModules.createFMatrixesForDcc(
+                frequencies_Hz, tfModules.calculateThetas(frequencies_Hz, cable), cable
+            ),
+            20,
+        )
+        elapsed_recurrence = measure(
+            lambda: exponentialRecurrence.createFMatrixesForDccOnUniformGrid(
+                frequencies_Hz, cable
+            ),
+            20,
+        )
+        print(f"  createFMatrixForDcc(ループ): {elapsed_loop * 1e3:.2f}[ms]")
+        print(f"  createFMatrixesForDcc(配列): {elapsed_vectorized * 1e3:.2f}[ms]")
+        print(f"  漸化式: {elapsed_recurrence * 1e3:.2f}[ms]")
@@ -0,0 +1,90 @@
+import time
+
+import matplotlib
+
+matplotlib.rc("font", family="Noto Sans CJK JP")
+import matplotlib.pyplot as plt
+import numpy as np
+
+import bergeron
+import cable as cableModules
+import fftContext
+import transferFunction as tfModules
+import waveforms
+
+if __name__ == "__main__":
+    # simulateOutputWaveform.squareWaveFftAndIfftと同じ時間軸と入力波形
+    samplingPeriod = 1e-9
+    times = np.arange(-25e-6, 25e-6, samplingPeriod)[:50000]
+    inputWaves = waveforms.createPulseTrain(
+        times,
+        period=10e-6,
+        duty=0.02,
+        amplitude=2,
+        delay=times[times >= 0][0],
+        nPulses=1,
+    )
+
+    cable = cableModules.cable_vertual
+    line = bergeron.BergeronLine(cable)
+    fft = fftContext.getFftContext(len(times), samplingPeriod)
+    print(
+        f"Z0: {line.characteristicImpedance:.3f}[Ω], 遅延: {line.delay * 1e9:.3f}[ns]"
+    )
+
+    FONT_SIZE = 16
+    isInRange = (-0.1e-6 <= times) & (times <= 0.5e-6)
+
+    for impedance in [50, 1e6]:
+        endCondition = {"shouldMatching": False, "impedance": impedance}
+
+        # 周波数領域(squareWaveFftAndIfftと同じ計算)
+        outputWaves_fft = fft.filter(
+            inputWaves,
+            tfModules.createTransferFunctions(fft.frequencies, endCondition, cable),
+        )
+
+        # 時間領域(Bergeron法)
+        start = time.perf_counter()
+        waves = bergeron.BergeronLine(cable).simulate(
+            bergeron.createVoltageSource(inputWaves, 50),
+            bergeron.createResistorLoad(impedance),
+            len(times),
+            samplingPeriod,
+        )
+        elapsed = time.perf_counter() - start
+        errors = waves["outputVoltage"] - outputWaves_fft
+        print(
+            f"受電端{impedance}[Ω]: 計算時間 {elapsed:.2f}[s], "
+            f"RMS誤差 {np.sqrt(np.mean(errors ** 2)):.3e}[V], "
+            f"最大誤差 {np.max(np.abs(errors)):.3e}[V]"
+        )
+
+        ax = plt.subplots()[1]
+        ax.plot(times[isInRange] * 1e6, outputWaves_fft[isInRange], label="FFT")
+        ax.plot(
+            times[isInRange] * 1e6,
+            waves["outputVoltage"][isInRange],
+            label="Bergeron法",
+            linestyle="dashed",
+        )
+        ax.set_title(f"受電端{impedance}[Ω]", fontsize=FONT_SIZE)
+        ax.set_ylabel("Amp[V]", fontsize=FONT_SIZE)
+        ax.set_xlabel("Time[μs]", fontsize=FONT_SIZE)
+        ax.legend(fontsize=FONT_SIZE - 2)
+
+    # 非線形の終端(クランプダイオード)の例
+    waves = line.simulate(
+        bergeron.createVoltageSource(inputWaves * 2, 50),
+        bergeron.createDiodeClampLoad(upperVoltage=3.3),
+        len(times),
+        samplingPeriod,
+    )
+    ax = plt.subplots()[1]
+    ax.plot(times[isInRange] * 1e6, waves["outputVoltage"][isInRange])
+    ax.set_title("受電端: クランプダイオード(3.3V)", fontsize=FONT_SIZE)
+    ax.set_ylabel("Amp[V]", fontsize=FONT_SIZE)
+    ax.set_xlabel("Time[μs]", fontsize=FONT_SIZE)
+
+    plt.tight_layout()
+    plt.show()
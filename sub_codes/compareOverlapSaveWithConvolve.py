@@ -0,0 +1,37 @@
+import time
+
+import numpy as np
+from scipy import signal
+
+import cable as cableModules
+import streamingSimulation
+
+if __name__ == "__main__":
+    # 重畳保存法の出力を、同じインパルス応答とsignal.fftconvolveで求めた線形畳み込みと比較する
+    samplingPeriod = 1e-9
+    endCondition = {"shouldMatching": False, "impedance": 50}
+    simulator = streamingSimulation.OverlapSaveSimulator.fromCable(
+        cableModules.cable_vertual, endCondition, samplingPeriod
+    )
+    print(
+        f"インパルス応答: {len(simulator.taps)}点, 遅延: {simulator.latency}点, "
+        f"ブロック: {simulator.blockSize}点"
+    )
+
+    rng = np.random.default_rng(0)
+    # 遅延より短い入力・ブロックの境界をまたぐ入力・長い入力
+    for nSamples in [1, 30, simulator.latency, simulator.blockSize + 7, 500000]:
+        inputWaves = rng.standard_normal(nSamples)
+        references = signal.fftconvolve(inputWaves, simulator.taps)[
+            simulator.latency : simulator.latency + nSamples
+        ]
+        for blockSize in [10000, None]:
+            start = time.perf_counter()
+            outputWaves = simulator.simulate(inputWaves, blockSize)
+            elapsed = time.perf_counter() - start
+            print(
+                f"入力{nSamples}点, 読み出し{blockSize or simulator.blockSize}点: "
+                f"出力{len(outputWaves)}点, "
+                f"最大誤差 {np.max(np.abs(outputWaves - references)):.3e}, "
+                f"計算時間 {elapsed:.3f}[s]"
+            )
@@ -8,17 +8,18 @@ import numpy as np
 import util
 import cable as cableModules
 
-frequencies_Hz = range(0, 100 * util.ONE_HUNDRED, 10000)
+if __name__ == "__main__":
+    frequencies_Hz = range(0, 100 * util.ONE_HUNDRED, 10000)
 
-characteristicImpedances = []
-for frequency_Hz in list(frequencies_Hz):
-    characteristicImpedances.append(
-        cableModules.cable_vertual.calcCharacteristicImpedance(frequency_Hz)
-    )
+    characteristicImpedances = []
+    for frequency_Hz in list(frequencies_Hz):
+        characteristicImpedances.append(
+            cableModules.cable_vertual.calcCharacteristicImpedance(frequency_Hz)
+        )
 
-fig, ax = plt.subplots()
+    fig, ax = plt.subplots()
 
-ax.plot(frequencies_Hz, np.abs(characteristicImpedances))
+    ax.plot(frequencies_Hz, np.abs(characteristicImpedances))
 
-plt.tight_layout()
-plt.show()
+    plt.tight_layout()
+    plt.show()
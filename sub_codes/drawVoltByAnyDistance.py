@@ -91,37 +91,40 @@ def calcEndVoltByAnyFreqUnderEndOpenCondition(frequency_Hz):
     )
 
 
-# fig, ax = plt.subplots()
-fig, axes = plt.subplots(2, 1)
-
-distances = list(range(0, 3 * util.ONE_HUNDRED, 1000))
-FONT_SIZE = 12
-
-axes[0].plot(
-    distances,
-    list(map(calcVoltByAnyDistanceUnderEndOpenCondition, distances)),
-)
-axes[0].set_ylabel("Volt[V]", fontsize=FONT_SIZE)  # y軸は、伝達関数の絶対値
-axes[0].set_xlabel("distance [m]", fontsize=FONT_SIZE)
-
-frequencies_Hz = list(range(0, 100 * util.ONE_HUNDRED, 10000))
-
-axes[1].plot(
-    frequencies_Hz,
-    list(
-        map(
-            lambda freq: util.convertGain2dB(
-                calcEndVoltByAnyFreqUnderEndOpenCondition(freq) / 1000  # Vout / Vin
-            ),
-            frequencies_Hz,
-        )
-    ),
-)
+if __name__ == "__main__":
+    # fig, ax = plt.subplots()
+    fig, axes = plt.subplots(2, 1)
+
+    distances = list(range(0, 3 * util.ONE_HUNDRED, 1000))
+    FONT_SIZE = 12
+
+    axes[0].plot(
+        distances,
+        list(map(calcVoltByAnyDistanceUnderEndOpenCondition, distances)),
+    )
+    axes[0].set_ylabel("Volt[V]", fontsize=FONT_SIZE)  # y軸は、伝達関数の絶対値
+    axes[0].set_xlabel("distance [m]", fontsize=FONT_SIZE)
+
+    frequencies_Hz = list(range(0, 100 * util.ONE_HUNDRED, 10000))
+
+    axes[1].plot(
+        frequencies_Hz,
+        list(
+            map(
+                lambda freq: util.convertGain2dB(
+                    calcEndVoltByAnyFreqUnderEndOpenCondition(freq) / 1000  # Vout / Vin
+                ),
+                frequencies_Hz,
+            )
+        ),
+    )
 
-axes[1].set_ylabel("Gain[dB]", fontsize=FONT_SIZE)  # y軸は、伝達関数の絶対値
-axes[1].set_xlabel("frequency [MHz]", fontsize=FONT_SIZE)
-axes[1].xaxis.set_major_formatter(pltSettings.FixedOrderFormatter(6, useMathText=True))
-axes[1].ticklabel_format(style="sci", axis="x", scilimits=(0, 0))
+    axes[1].set_ylabel("Gain[dB]", fontsize=FONT_SIZE)  # y軸は、伝達関数の絶対値
+    axes[1].set_xlabel("frequency [MHz]", fontsize=FONT_SIZE)
+    axes[1].xaxis.set_major_formatter(
+        pltSettings.FixedOrderFormatter(6, useMathText=True)
+    )
+    axes[1].ticklabel_format(style="sci", axis="x", scilimits=(0, 0))
 
-plt.tight_layout()
-plt.show()
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,186 @@
+import numpy as np
+
+# 掃引で扱うパラメータの軸名(この順番で結果の軸が並ぶ)
+PARAMETER_NAMES = ["resistance", "inductance", "conductance", "capacitance", "length"]
+
+
+class LabeledArray:
+    """
+    軸の名前と座標を持つndarray
+
+    Parameters
+    ----------
+    values : ndarray
+        値の配列
+    dims : tuple
+        各軸の名前
+    coords : dict
+        軸の名前をキー、その軸の座標を値とする辞書
+    """
+
+    def __init__(self, values, dims, coords):  # イニシャライザ
+        if np.ndim(values) != len(dims):
+            raise ValueError(f"軸の数が一致しません: {np.shape(values)}, {dims}")
+        self.values = values
+        self.dims = tuple(dims)
+        self.coords = dict(coords)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def getAxis(self, dim):
+        """
+        軸の名前から軸の番号を返す
+        """
+        return self.dims.index(dim)
+
+    def isel(self, **indexers):
+        """
+        軸の名前とインデックスを指定して値を取り出す(整数で指定した軸は取り除かれる)
+
+        Parameters
+        ----------
+        indexers : int or slice
+            軸の名前をキーワードとしたインデックス
+        """
+        keys = []
+        dims = []
+        coords = {}
+        for dim in self.dims:
+            index = indexers.pop(dim, slice(None))
+            keys.append(index)
+            if isinstance(index, slice):
+                dims.append(dim)
+                coords[dim] = self.coords[dim][index]
+        if indexers:
+            raise KeyError(f"存在しない軸が指定されました: {list(indexers)}")
+        return LabeledArray(self.values[tuple(keys)], dims, coords)
+
+    def __repr__(self):
+        dims = ", ".join(f"{dim}: {size}" for dim, size in zip(self.dims, self.shape))
+        return f"LabeledArray({dims}, dtype={self.values.dtype})"
+
+
+def calcTfsBySweep(
+    frequencies_Hz,
+    resistances,
+    inductances,
+    conductances,
+    capacitances,
+    lengths,
+    endConditions,
+    sourceImpedance=50,
+    dtype=complex,
+    maxChunkElements=2 ** 20,
+):
+    """
+    ケーブルのパラメータ、受電端の条件、周波数のすべての組み合わせについて伝達関数を一括で求める
+
+    配列で与えたパラメータはそれぞれ一つの軸になり、スカラーで与えたパラメータは軸を持たない
+    結果の軸は resistance, inductance, conductance, capacitance, length, endCondition, frequency の順に並ぶ
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    resistances, inductances, conductances, capacitances, lengths : float or array_like
+        R(Ω/m), L(H/m), G(S/m), C(F/m), 線路長(m)
+    endConditions : dict or list
+        受電端の抵抗の条件、またはそのリスト
+    sourceImpedance : float
+        電源の内部インピーダンス
+    dtype : dtype
+        結果の型(np.complex64 とするとメモリ使用量が半分になる)
+    maxChunkElements : int
+        一度に計算する要素数の上限(中間配列のメモリ使用量を抑えるため周波数の軸で分割する)
+
+    Returns
+    -------
+    tfs : instance
+        伝達関数を値に持つLabeledArrayのインスタンス
+    """
+    frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+    parameters = [resistances, inductances, conductances, capacitances, lengths]
+
+    dims = []
+    coords = {}
+    for name, parameter in zip(PARAMETER_NAMES, parameters):
+        if np.ndim(parameter) > 0:
+            dims.append(name)
+            coords[name] = np.asarray(parameter, dtype=float)
+
+    isEndConditionAxis = not isinstance(endConditions, dict)
+    conditions = list(endConditions) if isEndConditionAxis else [endConditions]
+    if isEndConditionAxis:
+        dims.append("endCondition")
+        coords["endCondition"] = conditions
+    dims.append("frequency")
+    coords["frequency"] = frequencies_Hz
+
+    # 各パラメータを、自分の軸以外の長さが1になる形状に変形してブロードキャストさせる
+    def toBroadcastShape(name, values):
+        shape = [1] * len(dims)
+        if name in dims:
+            shape[dims.index(name)] = -1
+        return np.reshape(values, shape)
+
+    R, L, G, C, length = [
+        toBroadcastShape(name, parameter)
+        for name, parameter in zip(PARAMETER_NAMES, parameters)
+    ]
+    shouldMatching = toBroadcastShape(
+        "endCondition", [condition["shouldMatching"] for condition in conditions]
+    )
+    endImpedances = toBroadcastShape(
+        "endCondition",
+        np.array([condition["impedance"] for condition in conditions], dtype=complex),
+    )
+
+    shape = tuple(
+        len(coords[dim]) if dim != "frequency" else len(frequencies_Hz) for dim in dims
+    )
+    tfs = np.empty(shape, dtype=dtype)
+
+    # 計算は結果と同じ精度で行う(complex64の場合は単精度で計算する)
+    realDtype = np.finfo(dtype).dtype
+    R, L, G, C, length = [
+        parameter.astype(realDtype) for parameter in (R, L, G, C, length)
+    ]
+    endImpedances = endImpedances.astype(dtype)
+    R1 = realDtype.type(sourceImpedance)
+
+    nElementsPerFrequency = max(int(np.prod(shape[:-1])), 1)
+    chunkSize = max(maxChunkElements // nElementsPerFrequency, 1)
+    for start in range(0, len(frequencies_Hz), chunkSize):
+        chunk = slice(start, start + chunkSize)
+        isDc = frequencies_Hz[chunk] == 0
+        omegas = toBroadcastShape(
+            "frequency", (2 * np.pi * frequencies_Hz[chunk]).astype(realDtype)
+        )
+
+        seriesImpedance = R + 1j * omegas * L
+        gamma = np.sqrt(seriesImpedance * (G + 1j * omegas * C))
+        # Z0 = sqrt(z / y) = z / γ の関係を使い、平方根の計算を1回で済ませる
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Z0 = seriesImpedance / gamma
+        if np.any(isDc):
+            # 直流の場合はCable.calcCharacteristicImpedanceと同じくω=1e-8として求める
+            omegaForDc = realDtype.type(1e-8)
+            Z0[..., isDc] = np.sqrt(
+                (R + 1j * omegaForDc * L) / (G + 1j * omegaForDc * C)
+            )
+
+        # cosh, sinhはexpを1回だけ計算して求める
+        exp = np.exp(gamma * length)
+        expInv = 1 / exp
+        cosh = (exp + expInv) / 2
+        sinh = (exp - expInv) / 2
+
+        # 整合条件の場合は受電端のインピーダンスを特性インピーダンスにする
+        R2 = np.where(shouldMatching, Z0, endImpedances)
+
+        # 1 / (A + B / R2 + R1 * C + (R1 / R2) * D)
+        tfs[..., chunk] = 1 / (cosh * (1 + R1 / R2) + sinh * (Z0 / R2 + R1 / Z0))
+
+    return LabeledArray(tfs, dims, coords)
@@ -0,0 +1,302 @@
+import numpy as np
+
+import fftContext
+import fMatrix
+import transferFunction as tfModules
+
+# 受電端を開放した場合の条件
+OPEN_END = {"shouldMatching": False, "impedance": 1e6}
+
+
+def calcPropagationVelocity(cable):
+    """
+    無損失と近似したときの伝搬速度v = 1 / √(LC)(m/s)を求める
+
+    Parameters
+    ----------
+    cable : instance
+        Cableクラスのインスタンス
+    """
+    return 1 / np.sqrt(cable.inductance * cable.capacitance)
+
+
+def convertTimesToDistances(times, cable):
+    """
+    反射波が戻ってくるまでの時間を、送電端から反射点までの距離に変換する(往復のため2で割る)
+
+    Parameters
+    ----------
+    times : array_like
+        時刻(s)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    """
+    return calcPropagationVelocity(cable) * np.asarray(times, dtype=float) / 2
+
+
+def convertDistancesToTimes(distances, cable):
+    """
+    送電端から反射点までの距離を、反射波が戻ってくるまでの時間に変換する
+
+    Parameters
+    ----------
+    distances : array_like
+        距離(m)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    """
+    return 2 * np.asarray(distances, dtype=float) / calcPropagationVelocity(cable)
+
+
+def createLineFMatrixes(frequencies_Hz, cable, lengths):
+    """
+    同じ種類で長さだけが異なるケーブルのF行列を一括で求める
+
+    伝搬定数γと特性インピーダンスは長さに依存しないため、周波数ごとに1回だけ求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    lengths : float or array_like
+        ケーブルの長さ(m)
+
+    Returns
+    -------
+    f_matrixes : instance
+        形状がnp.shape(lengths) + (周波数の数,)のFMatrixes
+    """
+    lengths = np.asarray(lengths, dtype=float)
+    gammas = tfModules.calcGammas(frequencies_Hz, cable)
+    thetas = lengths[..., np.newaxis] * gammas
+    return fMatrix.FMatrixes(
+        tfModules.createFMatrixesForDcc(frequencies_Hz, thetas, cable)
+    )
+
+
+def createDiscontinuityFMatrixes(discontinuity):
+    """
+    線路の途中のインピーダンスの不連続点のF行列を作成する
+
+    Parameters
+    ----------
+    discontinuity : dict
+        kind: "series"(直列に挿入したインピーダンス, 断線に近い故障)または
+        "shunt"(並列に挿入したインピーダンス, 短絡に近い故障),
+        impedance: インピーダンス(Ω, 周波数ごとの配列でもよい)
+    """
+    impedances = np.asarray(discontinuity["impedance"], dtype=complex)
+    if discontinuity["kind"] == "series":
+        return fMatrix.FMatrixes.fromSeriesImpedances(impedances)
+    if discontinuity["kind"] == "shunt":
+        return fMatrix.FMatrixes.fromShuntAdmittances(1 / impedances)
+    raise ValueError(f"不連続点の種類が不正です: {discontinuity['kind']}")
+
+
+def calcSourceReflections(
+    frequencies_Hz,
+    cable,
+    discontinuities=(),
+    endCondition=OPEN_END,
+    referenceImpedance=50,
+):
+    """
+    不連続点を含むケーブルの送電端から見た反射係数Γ(f)を求める
+
+    不連続点の位置に配列を指定すると、位置の候補ごとの反射係数をまとめて求める
+    (ケーブルのF行列は位置の軸と周波数の軸を持つ配列として一括で計算する)
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス(lengthがケーブル全体の長さ)
+    discontinuities : list
+        送電端に近い順に並べた不連続点のリスト
+        (position: 送電端からの距離(m, 配列でもよい)とcreateDiscontinuityFMatrixesの引数の辞書)
+    endCondition: dict
+        受電端の抵抗の条件
+    referenceImpedance : float
+        反射係数の基準インピーダンス(電源の内部インピーダンス)
+
+    Returns
+    -------
+    reflections : ndarray
+        形状が(位置の候補の形状..., 周波数の数)の反射係数
+    """
+    frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+    positions = [
+        np.asarray(discontinuity["position"], dtype=float)
+        for discontinuity in discontinuities
+    ]
+    for position in positions:
+        if np.any(position < 0) or np.any(position > cable.length):
+            raise ValueError("不連続点の位置はケーブルの範囲内である必要があります")
+    for previous, position in zip(positions, positions[1:]):
+        if np.any(position < previous):
+            raise ValueError("不連続点は送電端に近い順に並べる必要があります")
+
+    # 不連続点で区切った区間のF行列と不連続点のF行列を、送電端から順に縦続接続する
+    f_matrixes = None
+    previousPosition = 0.0
+    for discontinuity, position in zip(discontinuities, positions):
+        section = createLineFMatrixes(
+            frequencies_Hz, cable, position - previousPosition
+        ).cascade(createDiscontinuityFMatrixes(discontinuity))
+        f_matrixes = section if f_matrixes is None else f_matrixes.cascade(section)
+        previousPosition = position
+    lastSection = createLineFMatrixes(
+        frequencies_Hz, cable, cable.length - previousPosition
+    )
+    f_matrixes = lastSection if f_matrixes is None else f_matrixes.cascade(lastSection)
+
+    if endCondition["shouldMatching"]:
+        endImpedances = cable.calcCharacteristicImpedances(frequencies_Hz)
+    else:
+        endImpedances = endCondition["impedance"]
+    inputImpedances = f_matrixes.calcInputImpedances(endImpedances)
+    return (inputImpedances - referenceImpedance) / (
+        inputImpedances + referenceImpedance
+    )
+
+
+def simulateTdr(
+    cable,
+    samplingPeriod,
+    nSamples,
+    discontinuities=(),
+    endCondition=OPEN_END,
+    sourceImpedance=50,
+    amplitude=1,
+):
+    """
+    TDR(時間領域反射測定)で送電端に現れる反射波を求める
+
+    電源電圧Vsのステップを加えたとき、送電端の電圧はVs * (1 + Γ) / 2となるため、
+    整合した線路の場合の電圧Vs / 2からのずれVs * Γ / 2を反射波とする
+
+    Parameters
+    ----------
+    cable : instance
+        Cableクラスのインスタンス
+    samplingPeriod : float
+        サンプリング周期(s)
+    nSamples : int
+        標本数(ケーブルの往復の時間より十分長くする)
+    discontinuities : list
+        不連続点のリスト(calcSourceReflectionsを参照)
+    endCondition: dict
+        受電端の抵抗の条件
+    sourceImpedance : float
+        電源の内部インピーダンス
+    amplitude : float
+        ステップの振幅Vs(V)
+
+    Returns
+    -------
+    result : dict
+        times(時刻), distances(時刻を距離に変換したもの),
+        impulseResponses(1標本の単位インパルスに対する反射波), stepResponses(ステップに対する反射波)
+    """
+    fft = fftContext.getFftContext(nSamples, samplingPeriod, padToFastLength=False)
+    reflections = calcSourceReflections(
+        fft.frequencies, cable, discontinuities, endCondition, sourceImpedance
+    )
+    impulseResponses = amplitude / 2 * fft.irfft(reflections)
+    times = np.arange(nSamples) * samplingPeriod
+    return {
+        "times": times,
+        "distances": convertTimesToDistances(times, cable),
+        "impulseResponses": impulseResponses,
+        "stepResponses": np.cumsum(impulseResponses, axis=-1),
+    }
+
+
+def findReflectionDistances(impulseResponses, times, cable, minDistance=0):
+    """
+    反射波のインパルス応答の絶対値が最大となる時刻から、反射点までの距離を求める
+
+    Parameters
+    ----------
+    impulseResponses : array_like
+        形状が(..., len(times))の反射波のインパルス応答(ステップ応答の差分でもよい)
+    times : array_like
+        時刻(s)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    minDistance : float
+        探索を始める距離(m, 送電端での不整合による反射を除くために使用する)
+    """
+    distances = convertTimesToDistances(times, cable)
+    firstIndex = int(np.searchsorted(distances, minDistance))
+    indexes = firstIndex + np.argmax(
+        np.abs(np.asarray(impulseResponses)[..., firstIndex:]), axis=-1
+    )
+    return distances[indexes]
+
+
+def locateFault(
+    measuredResponses,
+    samplingPeriod,
+    cable,
+    candidatePositions,
+    discontinuity,
+    endCondition=OPEN_END,
+    sourceImpedance=50,
+    amplitude=1,
+    chunkSize=256,
+):
+    """
+    故障の位置の候補ごとにTDRのステップ応答を一括で求め、測定値との二乗誤差が最小の位置を求める
+
+    Parameters
+    ----------
+    measuredResponses : array_like
+        測定したステップに対する反射波(simulateTdrのstepResponsesと同じ時刻の配列)
+    samplingPeriod : float
+        サンプリング周期(s)
+    cable : instance
+        Cableクラスのインスタンス
+    candidatePositions : array_like
+        故障の位置の候補(m)の配列
+    discontinuity : dict
+        故障の種類とインピーダンス(createDiscontinuityFMatrixesを参照)
+    endCondition: dict
+        受電端の抵抗の条件
+    sourceImpedance : float
+        電源の内部インピーダンス
+    amplitude : float
+        ステップの振幅(V)
+    chunkSize : int
+        一度に計算する候補の数(F行列の配列のメモリ使用量を抑えるため)
+
+    Returns
+    -------
+    result : dict
+        position(推定した故障の位置), errors(候補ごとの二乗誤差), candidatePositions
+    """
+    measuredResponses = np.asarray(measuredResponses, dtype=float)
+    candidatePositions = np.asarray(candidatePositions, dtype=float)
+    errors = np.empty(len(candidatePositions))
+    for start in range(0, len(candidatePositions), chunkSize):
+        stop = min(start + chunkSize, len(candidatePositions))
+        result = simulateTdr(
+            cable,
+            samplingPeriod,
+            len(measuredResponses),
+            [{**discontinuity, "position": candidatePositions[start:stop]}],
+            endCondition,
+            sourceImpedance,
+            amplitude,
+        )
+        errors[start:stop] = np.sum(
+            (result["stepResponses"] - measuredResponses) ** 2, axis=-1
+        )
+    return {
+        "position": candidatePositions[np.argmin(errors)],
+        "errors": errors,
+        "candidatePositions": candidatePositions,
+    }
@@ -0,0 +1,386 @@
+import io
+import re
+
+import numpy as np
+
+import fMatrix
+import networkParameters
+import util
+
+# Touchstoneの周波数の単位と倍率
+FREQUENCY_UNITS = {"HZ": 1.0, "KHZ": 1e3, "MHZ": 1e6, "GHZ": 1e9}
+# Touchstoneのデータ形式(RI: 実部・虚部, MA: 振幅・角度[deg], DB: 振幅[dB]・角度[deg])
+DATA_FORMATS = ("RI", "MA", "DB")
+
+
+def _formatPairs(values, dataFormat):
+    # 複素数の配列を、データ形式に合わせた2列の実数の組に変換する
+    if dataFormat == "RI":
+        return np.real(values), np.imag(values)
+    angles = np.angle(values, deg=True)
+    if dataFormat == "MA":
+        return np.abs(values), angles
+    return 20 * np.log10(np.abs(values)), angles
+
+
+def _writeHeader(file, frequencyUnit, dataFormat, referenceImpedance, comments):
+    if frequencyUnit not in FREQUENCY_UNITS:
+        raise ValueError(f"周波数の単位が不正です: {frequencyUnit}")
+    if dataFormat not in DATA_FORMATS:
+        raise ValueError(f"データ形式が不正です: {dataFormat}")
+    if np.imag(referenceImpedance) != 0:
+        raise ValueError(
+            f"Touchstoneの基準インピーダンスは実数である必要があります: {referenceImpedance}"
+        )
+    for comment in comments:
+        file.write(f"! {comment}\n")
+    file.write(
+        f"# {frequencyUnit} S {dataFormat} R {np.real(referenceImpedance):.12g}\n"
+    )
+
+
+def _writeRows(file, frequencies_Hz, s_matrixes, frequencyUnit, dataFormat):
+    # 2ポートのTouchstone(v1)の列の順序は 周波数, S11, S21, S12, S22
+    rows = np.empty((len(frequencies_Hz), 9))
+    rows[:, 0] = frequencies_Hz / FREQUENCY_UNITS[frequencyUnit]
+    for column, (i, j) in enumerate([(0, 0), (1, 0), (0, 1), (1, 1)]):
+        rows[:, 1 + 2 * column], rows[:, 2 + 2 * column] = _formatPairs(
+            s_matrixes[:, i, j], dataFormat
+        )
+    # 行ごとにPythonのループを回さず、ブロック全体を1つの書式文字列で整形する
+    lineFormat = " ".join(["%.12g"] * 9) + "\n"
+    file.write((lineFormat * len(rows)) % tuple(rows.ravel()))
+
+
+def writeS2p(
+    path,
+    frequencies_Hz,
+    s_matrixes,
+    referenceImpedance=50,
+    dataFormat="RI",
+    frequencyUnit="HZ",
+    comments=(),
+    chunkSize=100000,
+):
+    """
+    2ポートのSパラメータをTouchstone(.s2p)形式で書き出す
+
+    Parameters
+    ----------
+    path : string
+        出力先のパス
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    s_matrixes : array_like
+        形状が(N, 2, 2)のSパラメータの配列
+    referenceImpedance : float
+        基準インピーダンス(Touchstone v1では実数のみ)
+    dataFormat : string
+        "RI", "MA", "DB" のいずれか
+    frequencyUnit : string
+        "HZ", "KHZ", "MHZ", "GHZ" のいずれか
+    comments : list
+        ファイルの先頭に書き込むコメント
+    chunkSize : int
+        一度に整形して書き込む行数
+    """
+    frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+    s_matrixes = np.asarray(s_matrixes, dtype=complex)
+    with open(path, "w") as file:
+        _writeHeader(file, frequencyUnit, dataFormat, referenceImpedance, comments)
+        for start in range(0, len(frequencies_Hz), chunkSize):
+            stop = start + chunkSize
+            _writeRows(
+                file,
+                frequencies_Hz[start:stop],
+                s_matrixes[start:stop],
+                frequencyUnit,
+                dataFormat,
+            )
+
+
+def writeS2pFromFMatrixes(
+    path,
+    frequencies_Hz,
+    f_matrixes,
+    referenceImpedance=50,
+    dataFormat="RI",
+    frequencyUnit="HZ",
+    comments=(),
+    chunkSize=100000,
+):
+    """
+    F行列の配列をSパラメータに変換しながら、Touchstone(.s2p)形式で書き出す
+
+    変換はchunkSize行ごとに行うため、Sパラメータ全体の配列をメモリ上に作らない
+
+    Parameters
+    ----------
+    path : string
+        出力先のパス
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    f_matrixes : array_like
+        形状が(N, 2, 2)のF行列の配列(FMatrixesのインスタンスでもよい)
+    referenceImpedance : float
+        基準インピーダンス(Touchstone v1では実数のみ)
+    dataFormat : string
+        "RI", "MA", "DB" のいずれか
+    frequencyUnit : string
+        "HZ", "KHZ", "MHZ", "GHZ" のいずれか
+    comments : list
+        ファイルの先頭に書き込むコメント
+    chunkSize : int
+        一度に変換・書き込みする行数
+    """
+    frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+    f_matrixes = np.asarray(f_matrixes, dtype=complex)
+    with open(path, "w") as file:
+        _writeHeader(file, frequencyUnit, dataFormat, referenceImpedance, comments)
+        for start in range(0, len(frequencies_Hz), chunkSize):
+            stop = start + chunkSize
+            _writeRows(
+                file,
+                frequencies_Hz[start:stop],
+                networkParameters.convertFToS(
+                    f_matrixes[start:stop], referenceImpedance
+                ),
+                frequencyUnit,
+                dataFormat,
+            )
+
+
+class TouchstoneData:
+    """
+    Touchstone(.s2p)から読み込んだ2ポートのSパラメータ
+
+    Parameters
+    ----------
+    frequencies_Hz : ndarray
+        周波数(Hz)の配列
+    s_matrixes : ndarray
+        形状が(N, 2, 2)のSパラメータの配列
+    referenceImpedance : float
+        基準インピーダンス
+    comments : list
+        ファイル中のコメント
+    """
+
+    def __init__(
+        self, frequencies_Hz, s_matrixes, referenceImpedance=50, comments=()
+    ):  # イニシャライザ
+        self.frequencies_Hz = frequencies_Hz
+        self.s_matrixes = s_matrixes
+        self.referenceImpedance = referenceImpedance
+        self.comments = list(comments)
+
+    def __len__(self):
+        return len(self.frequencies_Hz)
+
+    def toFMatrixes(self):
+        """
+        測定点の周波数のままF行列に変換する
+        """
+        return fMatrix.FMatrixes(
+            networkParameters.convertSToF(self.s_matrixes, self.referenceImpedance)
+        )
+
+    def interpolateSParameters(self, frequencies_Hz, extrapolate=False):
+        """
+        Sパラメータをシミュレーションの周波数のグリッドに補間する
+
+        振幅と(アンラップした)位相をそれぞれ線形補間する
+
+        Parameters
+        ----------
+        frequencies_Hz : array_like
+            補間先の周波数(Hz)の配列
+        extrapolate : bool
+            Falseの場合、測定範囲外の周波数を含むとValueErrorを送出する
+            Trueの場合、測定範囲外では端の値を用いる
+        """
+        frequencies_Hz = np.asarray(frequencies_Hz, dtype=float)
+        if not extrapolate and (
+            np.min(frequencies_Hz) < self.frequencies_Hz[0]
+            or np.max(frequencies_Hz) > self.frequencies_Hz[-1]
+        ):
+            raise ValueError(
+                "補間先の周波数が測定範囲"
+                f"({self.frequencies_Hz[0]}〜{self.frequencies_Hz[-1]}Hz)外です"
+            )
+
+        s_matrixes = self.s_matrixes.reshape(len(self), 4)
+        magnitudes = np.abs(s_matrixes)
+        phases = np.unwrap(np.angle(s_matrixes), axis=0)
+
+        interpolated = np.empty((len(frequencies_Hz), 4), dtype=complex)
+        for i in range(4):
+            interpolated[:, i] = np.interp(
+                frequencies_Hz, self.frequencies_Hz, magnitudes[:, i]
+            ) * np.exp(
+                1j * np.interp(frequencies_Hz, self.frequencies_Hz, phases[:, i])
+            )
+        return interpolated.reshape(len(frequencies_Hz), 2, 2)
+
+    def interpolateFMatrixes(self, frequencies_Hz, extrapolate=False):
+        """
+        Sパラメータを補間してからF行列に変換する(分布定数線路などと縦続接続するため)
+
+        Parameters
+        ----------
+        frequencies_Hz : array_like
+            補間先の周波数(Hz)の配列
+        extrapolate : bool
+            Trueの場合、測定範囲外では端の値を用いる
+        """
+        return fMatrix.FMatrixes(
+            networkParameters.convertSToF(
+                self.interpolateSParameters(frequencies_Hz, extrapolate),
+                self.referenceImpedance,
+            )
+        )
+
+
+def _parseOptionLine(line):
+    # 例: "# MHZ S RI R 50" (省略された項目は規格の既定値 GHZ S MA R 50 とする)
+    options = {"frequencyUnit": "GHZ", "parameter": "S", "dataFormat": "MA"}
+    referenceImpedance = 50.0
+    tokens = line.lstrip("#").upper().split()
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token in FREQUENCY_UNITS:
+            options["frequencyUnit"] = token
+        elif token in ("S", "Y", "Z", "G", "H"):
+            options["parameter"] = token
+        elif token in DATA_FORMATS:
+            options["dataFormat"] = token
+        elif token == "R":
+            referenceImpedance = float(tokens[i + 1])
+            i += 1
+        i += 1
+    options["referenceImpedance"] = referenceImpedance
+    return options
+
+
+def _parsePairs(first, second, dataFormat):
+    if dataFormat == "RI":
+        return first + 1j * second
+    magnitudes = first if dataFormat == "MA" else 10 ** (first / 20)
+    return magnitudes * np.exp(1j * np.deg2rad(second))
+
+
+_COMMENT_PATTERN = re.compile(r"!.*")
+# オプション行(Touchstone v1では2行目以降は無視される)
+_OPTION_PATTERN = re.compile(r"^\s*#(.*)$", re.MULTILINE)
+
+
+def readS2p(path, chunkSize=2 ** 22):
+    """
+    2ポートのTouchstone(.s2p)ファイルを読み込む
+
+    ファイルをchunkSizeバイトずつ読み込み、コメントとオプション行を正規表現で取り除いてから
+    np.loadtxt(C言語で実装されたパーサー)でfloat64の配列に変換する
+    (数値でない文字列があればValueErrorを送出する)
+
+    Parameters
+    ----------
+    path : string
+        入力するファイルのパス
+    chunkSize : int
+        一度に読み込むバイト数
+
+    Returns
+    -------
+    data : instance
+        TouchstoneDataのインスタンス
+    """
+    options = None
+    comments = []
+    blocks = []
+    remainder = ""
+    with open(path, "r") as file:
+        while True:
+            chunk = file.read(chunkSize)
+            text = remainder + chunk
+            if chunk:
+                # 途中で切れた最終行は次のチャンクと連結して処理する
+                text, _, remainder = text.rpartition("\n")
+            else:
+                remainder = ""
+            if not text:
+                if not chunk:
+                    break
+                continue
+
+            if "!" in text:
+                comments.extend(
+                    comment[1:].strip() for comment in _COMMENT_PATTERN.findall(text)
+                )
+                text = _COMMENT_PATTERN.sub("", text)
+            if "#" in text:
+                optionLines = _OPTION_PATTERN.findall(text)
+                if options is None and optionLines:
+                    options = _parseOptionLine(optionLines[0])
+                text = _OPTION_PATTERN.sub("", text)
+            if "[" in text:
+                raise ValueError("Touchstone v2のキーワードには対応していません")
+
+            if text.strip():
+                try:
+                    values = np.loadtxt(io.StringIO(text), dtype=np.float64, ndmin=2)
+                except ValueError:
+                    # 数値でない文字列はエラーの場合にだけ探す
+                    invalidTokens = [
+                        token for token in text.split() if not util.isNumber(token)
+                    ]
+                    if not invalidTokens:
+                        raise
+                    raise ValueError(
+                        f"数値に変換できないデータがあります: {invalidTokens[:5]}"
+                    ) from None
+                blocks.append(values.ravel())
+            if not chunk:
+                break
+
+    if options is None:
+        options = _parseOptionLine("")
+    if options["parameter"] != "S":
+        raise ValueError(
+            f"Sパラメータ以外のTouchstoneには対応していません: {options['parameter']}"
+        )
+
+    values = np.concatenate(blocks) if blocks else np.empty(0)
+    if len(values) % 9 != 0:
+        raise ValueError(
+            f"2ポートのデータの数値の数が9の倍数ではありません: {len(values)}"
+        )
+    values = values.reshape(-1, 9)
+
+    # 2ポートのTouchstone(v1)の列の順序は 周波数, S11, S21, S12, S22
+    s_matrixes = np.empty((len(values), 2, 2), dtype=complex)
+    for column, (i, j) in enumerate([(0, 0), (1, 0), (0, 1), (1, 1)]):
+        s_matrixes[:, i, j] = _parsePairs(
+            values[:, 1 + 2 * column], values[:, 2 + 2 * column], options["dataFormat"]
+        )
+    frequencies_Hz = values[:, 0] * FREQUENCY_UNITS[options["frequencyUnit"]]
+
+    return TouchstoneData(
+        frequencies_Hz, s_matrixes, options["referenceImpedance"], comments
+    )
+
+
+def readS2pAsFMatrixes(path, frequencies_Hz, extrapolate=False):
+    """
+    Touchstone(.s2p)ファイルを読み込み、シミュレーションの周波数に補間したF行列を返す
+
+    Parameters
+    ----------
+    path : string
+        入力するファイルのパス
+    frequencies_Hz : array_like
+        補間先の周波数(Hz)の配列
+    extrapolate : bool
+        Trueの場合、測定範囲外では端の値を用いる
+    """
+    return readS2p(path).interpolateFMatrixes(frequencies_Hz, extrapolate)
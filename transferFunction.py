@@ -1,5 +1,7 @@
 import numpy as np
-from tqdm import tqdm
+
+import jitKernels
+import propagationCache
 
 
 def calculateTheta(frequency_Hz, cable):
@@ -94,7 +96,7 @@ def createTransferFunction(frequency_Hz, endCondition, cable):
     return createTransferFunctionFromFMatrix(endImpedance, f_matrix_dcc)
 
 
-def createTransferFunctionFromFMatrix(resistance, f_matrix):
+def createTransferFunctionFromFMatrix(resistance, f_matrix, sourceImpedance=50):
     """
     与えられたF行列と受電端の抵抗値から伝達関数を求める
 
@@ -104,8 +106,10 @@ def createTransferFunctionFromFMatrix(resistance, f_matrix):
         受電端のインピーダンス
     f_matrix: ndarray
         F行列
+    sourceImpedance : float
+        電源の内部インピーダンス
     """
-    R1 = 50
+    R1 = sourceImpedance
     R2 = resistance
 
     A = f_matrix[0][0]
@@ -118,11 +122,166 @@ def createTransferFunctionFromFMatrix(resistance, f_matrix):
 
 
 def calcTfsBySomeFreqs(frequencies_Hz, endCondition, cable):
-    tfs = []
-    for frequency_Hz in tqdm(frequencies_Hz, leave=False):
-        tf = createTransferFunction(frequency_Hz, endCondition, cable)
-        tfs.append(tf)
-    return tfs
+    return createTransferFunctions(frequencies_Hz, endCondition, cable)
+
+
+def calcGammas(frequencies_Hz, cable):
+    """
+    周波数の配列に対する伝搬定数γを一括で求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    """
+    omegas = 2 * np.pi * np.asarray(frequencies_Hz, dtype=float)
+
+    R = cable.resistance  # Ω/m
+    L = cable.inductance  # H/m
+    G = cable.conductance  # S/m
+    C = cable.capacitance  # F/m
+
+    return np.sqrt((R + 1j * omegas * L) * (G + 1j * omegas * C))
+
+
+def calculateThetas(frequencies_Hz, cable):
+    """
+    周波数の配列に対する伝搬定数γと同軸ケーブルの長さlの積を一括で求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    """
+    return calcGammas(frequencies_Hz, cable) * cable.length
+
+
+def createFMatrixesForDcc(frequencies_Hz, thetas, cable, terms=None):
+    """
+    周波数の配列に対する分布定数回路のF行列を一括で求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    thetas : ndarray
+        周波数ごとの伝搬定数γと同軸ケーブルの長さlの積
+    cable : instance
+        Cableクラスのインスタンス
+    terms : dict
+        calcPropagationTermsで求めたZ0, cosh, sinh(与えた場合は再計算しない)
+
+    Returns
+    -------
+    f_matrixes : ndarray
+        形状が(周波数の数, 2, 2)のF行列の配列
+    """
+    thetas = np.asarray(thetas)
+    if terms is None:
+        Z0 = cable.calcCharacteristicImpedances(frequencies_Hz)
+        cosh = np.cosh(thetas)
+        sinh = np.sinh(thetas)
+    else:
+        Z0 = terms["Z0"]
+        cosh = terms["cosh"]
+        sinh = terms["sinh"]
+
+    f_matrixes = np.empty(thetas.shape + (2, 2), dtype=complex)
+    f_matrixes[..., 0, 0] = cosh
+    f_matrixes[..., 0, 1] = Z0 * sinh
+    f_matrixes[..., 1, 0] = sinh / Z0
+    f_matrixes[..., 1, 1] = cosh
+    return f_matrixes
+
+
+def calcPropagationTerms(frequencies_Hz, cable, cache=propagationCache.defaultCache):
+    """
+    周波数の配列に対するγ, Z0, cosh(γl), sinh(γl)を求める(キャッシュがあれば再利用する)
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    cache : instance
+        PropagationCacheのインスタンス(Noneの場合はキャッシュを使用しない)
+    """
+    if cache is None:
+        return propagationCache.calcPropagationTerms(frequencies_Hz, cable)
+    return cache.getPropagationTerms(frequencies_Hz, cable)
+
+
+def createTransferFunctions(
+    frequencies_Hz,
+    endCondition,
+    cable,
+    cache=propagationCache.defaultCache,
+    backend="numpy",
+):
+    """
+    周波数の配列に対する、受電端に抵抗を接続した分布定数回路の伝達関数を一括で求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    endCondition: dict
+        受電端の抵抗の条件
+    cable : instance
+        Cableクラスのインスタンス
+    cache : instance
+        PropagationCacheのインスタンス(Noneの場合はキャッシュを使用しない)
+    backend : string
+        "numpy" または "numba"
+        "numba" の場合はコンパイル済みのカーネルで計算する(キャッシュは使用しない)
+        numbaがインストールされていない場合はNumPyで計算する
+    """
+    if backend not in ("numpy", "numba"):
+        raise ValueError(f"backendは'numpy'または'numba'を指定してください: {backend}")
+    if backend == "numba" and jitKernels.isNumbaAvailable:
+        return jitKernels.calcTransferFunctions(frequencies_Hz, endCondition, cable)
+
+    terms = calcPropagationTerms(frequencies_Hz, cable, cache)
+    f_matrixes = createFMatrixesForDcc(
+        frequencies_Hz, terms["gamma"] * cable.length, cable, terms
+    )
+
+    if endCondition["shouldMatching"]:
+        # 線路の特性インピーダンスと、受電端の抵抗のインピーダンスを同じにする
+        endImpedances = terms["Z0"]
+    else:
+        endImpedances = endCondition["impedance"]
+
+    return createTransferFunctionsFromFMatrixes(endImpedances, f_matrixes)
+
+
+def createTransferFunctionsFromFMatrixes(resistances, f_matrixes, sourceImpedance=50):
+    """
+    F行列の配列と受電端の抵抗値から伝達関数を一括で求める
+
+    Parameters
+    ----------
+    resistances : float or ndarray
+        受電端のインピーダンス(周波数ごとに異なる場合は配列)
+    f_matrixes: ndarray
+        形状が(..., 2, 2)のF行列の配列
+    sourceImpedance : float or ndarray
+        電源の内部インピーダンス
+    """
+    R1 = sourceImpedance
+    R2 = resistances
+
+    A = f_matrixes[..., 0, 0]
+    B = f_matrixes[..., 0, 1]
+    C = f_matrixes[..., 1, 0]
+    D = f_matrixes[..., 1, 1]
+
+    return 1 / (A + B / R2 + R1 * C + (R1 / R2) * D)
 
 
 def calcImpedanceAsSeenFromTransmissionEnd(frequency_Hz, cable, endCondition):
@@ -131,3 +290,26 @@ def calcImpedanceAsSeenFromTransmissionEnd(frequency_Hz, cable, endCondition):
     tanh = np.tanh(calculateTheta(frequency_Hz, cable))
 
     return Z0 * (Zr + Z0 * tanh) / (Z0 + Zr * tanh)
+
+
+def calcImpedancesAsSeenFromTransmissionEnd(
+    frequencies_Hz, cable, endCondition, cache=propagationCache.defaultCache
+):
+    """
+    周波数の配列に対する、送電端から見たインピーダンスを一括で求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    cable : instance
+        Cableクラスのインスタンス
+    endCondition: dict
+        受電端の抵抗の条件
+    cache : instance
+        PropagationCacheのインスタンス(Noneの場合はキャッシュを使用しない)
+    """
+    terms = calcPropagationTerms(frequencies_Hz, cable, cache)
+    return propagationCache.calcInputImpedances(
+        terms["Z0"], terms["gamma"], cable.length, endCondition["impedance"]
+    )
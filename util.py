@@ -141,3 +141,19 @@ def getNearestNumber(list, num):
 
 ONE_THUOSAND = 1000
 ONE_HUNDRED = 1000000
+
+
+def isNumber(text):
+    """
+    文字列が数値(floatに変換できる値)かどうかを返す
+
+    Parameters
+    ----------
+    text : string
+        判定する文字列
+    """
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,343 @@
+import json
+
+import numpy as np
+from scipy import signal
+
+
+class RationalModel:
+    """
+    伝達関数を極・留数の形 H(s) = d + e * s + Σ r_k / (s - p_k) で表したモデル
+
+    極は全て左半平面にあり(安定)、複素数の極は共役な組で保持する
+
+    Parameters
+    ----------
+    poles : ndarray
+        極 p_k(rad/s)
+    residues : ndarray
+        留数 r_k
+    d : float
+        定数項
+    e : float
+        sに比例する項の係数
+    """
+
+    def __init__(self, poles, residues, d=0.0, e=0.0):  # イニシャライザ
+        self.poles = np.asarray(poles, dtype=complex)
+        self.residues = np.asarray(residues, dtype=complex)
+        self.d = float(d)
+        self.e = float(e)
+
+    def __len__(self):
+        return len(self.poles)
+
+    def evaluate(self, frequencies_Hz):
+        """
+        任意の周波数の配列について伝達関数の値を求める
+
+        Parameters
+        ----------
+        frequencies_Hz : array_like
+            周波数(Hz)の配列
+        """
+        s = 2j * np.pi * np.asarray(frequencies_Hz, dtype=float)[..., np.newaxis]
+        return (
+            self.d
+            + self.e * s[..., 0]
+            + np.sum(self.residues / (s - self.poles), axis=-1)
+        )
+
+    def calcImpulseResponse(self, times):
+        """
+        インパルス応答 h(t) = Σ r_k * exp(p_k * t) (t >= 0) を解析的に求める
+        (定数項dによるデルタ関数の成分は含まない)
+
+        Parameters
+        ----------
+        times : array_like
+            時刻(s)の配列
+        """
+        times = np.asarray(times, dtype=float)
+        responses = np.real(
+            np.sum(self.residues * np.exp(self.poles * times[..., np.newaxis]), axis=-1)
+        )
+        return np.where(times >= 0, responses, 0.0)
+
+    def calcStepResponse(self, times):
+        """
+        ステップ応答 d + Σ r_k / p_k * (exp(p_k * t) - 1) (t >= 0) を解析的に求める
+
+        Parameters
+        ----------
+        times : array_like
+            時刻(s)の配列
+        """
+        times = np.asarray(times, dtype=float)
+        responses = self.d + np.real(
+            np.sum(
+                self.residues
+                / self.poles
+                * (np.exp(self.poles * times[..., np.newaxis]) - 1),
+                axis=-1,
+            )
+        )
+        return np.where(times >= 0, responses, 0.0)
+
+    def simulate(self, inputWaves, samplingPeriod):
+        """
+        入力波形に対する出力波形を、極ごとの漸化式(再帰的畳み込み)で求める
+
+        サンプル間の入力を線形補間として各極の状態を厳密に更新するため、
+        1サンプル・1極あたり数回の積和演算で計算でき、FFTを使用しない
+
+        Parameters
+        ----------
+        inputWaves : array_like
+            一定の時間間隔でサンプリングした入力波形(最後の軸が時間)
+        samplingPeriod : float
+            サンプリング周期(s)
+        """
+        inputWaves = np.asarray(inputWaves, dtype=float)
+        outputWaves = self.d * inputWaves
+        if self.e != 0:
+            outputWaves = outputWaves + self.e * np.gradient(
+                inputWaves, samplingPeriod, axis=-1
+            )
+        for pole, residue in zip(self.poles, self.residues):
+            if pole.imag < 0:
+                continue  # 共役な極は実部を2倍することで考慮する
+            alpha = np.exp(pole * samplingPeriod)
+            I0 = (alpha - 1) / pole
+            I1 = (alpha - 1) / (pole ** 2 * samplingPeriod) - 1 / pole
+            states = signal.lfilter([I1, I0 - I1], [1, -alpha], inputWaves, axis=-1)
+            contributions = residue * states
+            outputWaves = outputWaves + (
+                2 * np.real(contributions) if pole.imag > 0 else np.real(contributions)
+            )
+        return outputWaves
+
+    def toDict(self):
+        return {
+            "poles": {
+                "real": self.poles.real.tolist(),
+                "imag": self.poles.imag.tolist(),
+            },
+            "residues": {
+                "real": self.residues.real.tolist(),
+                "imag": self.residues.imag.tolist(),
+            },
+            "d": self.d,
+            "e": self.e,
+        }
+
+    @classmethod
+    def fromDict(cls, model):
+        return cls(
+            np.array(model["poles"]["real"]) + 1j * np.array(model["poles"]["imag"]),
+            np.array(model["residues"]["real"])
+            + 1j * np.array(model["residues"]["imag"]),
+            model["d"],
+            model["e"],
+        )
+
+    def save(self, path):
+        """
+        モデルをJSONファイルに保存する
+        """
+        with open(path, "w") as f:
+            json.dump(self.toDict(), f)
+
+    @classmethod
+    def load(cls, path):
+        """
+        JSONファイルに保存したモデルを読み込む
+        """
+        with open(path) as f:
+            return cls.fromDict(json.load(f))
+
+
+def _createInitialPoles(frequencies_Hz, nPoles):
+    # 周波数の範囲に虚部を等間隔に並べた、減衰の小さい共役な複素数の極の組を初期値とする
+    omegas = 2 * np.pi * np.asarray(frequencies_Hz, dtype=float)
+    betas = np.linspace(
+        max(omegas.min(), omegas.max() / 1000), omegas.max(), nPoles // 2
+    )
+    poles = np.empty(2 * len(betas), dtype=complex)
+    poles[0::2] = -betas / 100 + 1j * betas
+    poles[1::2] = -betas / 100 - 1j * betas
+    if nPoles % 2:
+        poles = np.append(poles, -omegas.max())
+    return poles
+
+
+def _createBasis(s, poles):
+    # 極から実数の係数で表せる基底関数を作成する
+    # 実数の極 a: 1 / (s - a)
+    # 共役な極の組 (a, a*): 1 / (s - a) + 1 / (s - a*), j / (s - a) - j / (s - a*)
+    basis = np.empty((len(s), len(poles)), dtype=complex)
+    index = 0
+    while index < len(poles):
+        pole = poles[index]
+        if pole.imag == 0:
+            basis[:, index] = 1 / (s - pole)
+            index += 1
+        else:
+            basis[:, index] = 1 / (s - pole) + 1 / (s - np.conj(pole))
+            basis[:, index + 1] = 1j / (s - pole) - 1j / (s - np.conj(pole))
+            index += 2
+    return basis
+
+
+def _solveRealLeastSquares(matrix, values):
+    # 複素数の連立方程式を実部・虚部に分けて、列の大きさを正規化してから最小二乗法で解く
+    realMatrix = np.vstack([matrix.real, matrix.imag])
+    realValues = np.concatenate([values.real, values.imag])
+    scales = np.linalg.norm(realMatrix, axis=0)
+    scales[scales == 0] = 1
+    solutions = np.linalg.lstsq(realMatrix / scales, realValues, rcond=None)[0]
+    return solutions / scales
+
+
+def _sortPoles(poles):
+    # 実数の極と、虚部が正・負の順に並んだ共役な極の組に整理する
+    poles = np.where(np.abs(poles.imag) < 1e-12 * np.abs(poles), poles.real, poles)
+    realPoles = np.sort(poles[poles.imag == 0].real)
+    upperPoles = np.sort_complex(poles[poles.imag > 0])
+    sortedPoles = list(realPoles.astype(complex))
+    for pole in upperPoles:
+        sortedPoles.extend([pole, np.conj(pole)])
+    return np.array(sortedPoles, dtype=complex)
+
+
+def _relocatePoles(s, tfs, poles, weights, hasE):
+    # σ(s) * H(s) ≒ (σ(s) * H(s))_fit となるσ(s)の零点を新しい極とする
+    basis = _createBasis(s, poles)
+    nPoles = len(poles)
+    columns = [basis, np.ones((len(s), 1))]
+    if hasE:
+        columns.append(s[:, np.newaxis])
+    columns.append(-tfs[:, np.newaxis] * basis)
+    matrix = np.hstack(columns) * weights[:, np.newaxis]
+    solutions = _solveRealLeastSquares(matrix, tfs * weights)
+    sigmaResidues = solutions[-nPoles:]
+
+    # σ(s)の零点 = eig(A - b * c~^T)(A, bは極の実数表現)
+    A = np.zeros((nPoles, nPoles))
+    b = np.zeros(nPoles)
+    index = 0
+    while index < nPoles:
+        pole = poles[index]
+        if pole.imag == 0:
+            A[index, index] = pole.real
+            b[index] = 1
+            index += 1
+        else:
+            A[index : index + 2, index : index + 2] = [
+                [pole.real, pole.imag],
+                [-pole.imag, pole.real],
+            ]
+            b[index] = 2
+            index += 2
+    newPoles = np.linalg.eigvals(A - np.outer(b, sigmaResidues))
+    # 不安定な極(実部が正)は虚軸に対して反転させて安定にする
+    newPoles = np.where(newPoles.real > 0, -np.conj(newPoles), newPoles)
+    return _sortPoles(newPoles)
+
+
+def _identifyResidues(s, tfs, poles, weights, hasE):
+    basis = _createBasis(s, poles)
+    columns = [basis, np.ones((len(s), 1))]
+    if hasE:
+        columns.append(s[:, np.newaxis])
+    matrix = np.hstack(columns) * weights[:, np.newaxis]
+    solutions = _solveRealLeastSquares(matrix, tfs * weights)
+
+    # 実数の係数を複素数の留数に戻す
+    residues = np.empty(len(poles), dtype=complex)
+    index = 0
+    while index < len(poles):
+        if poles[index].imag == 0:
+            residues[index] = solutions[index]
+            index += 1
+        else:
+            residues[index] = solutions[index] + 1j * solutions[index + 1]
+            residues[index + 1] = solutions[index] - 1j * solutions[index + 1]
+            index += 2
+    d = solutions[len(poles)]
+    e = solutions[len(poles) + 1] if hasE else 0.0
+    return residues, d, e
+
+
+def fitRationalModel(
+    frequencies_Hz, tfs, nPoles=10, nIterations=10, hasE=False, weights=None
+):
+    """
+    ベクトルフィッティングで伝達関数を安定な極・留数のモデルに近似する
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    tfs : array_like
+        各周波数の伝達関数
+    nPoles : int
+        極の数
+    nIterations : int
+        極の再配置を繰り返す回数
+    hasE : bool
+        sに比例する項を含めるかどうか
+    weights : array_like
+        各周波数の重み(Noneの場合は全て1)
+    """
+    s = 2j * np.pi * np.asarray(frequencies_Hz, dtype=float)
+    tfs = np.asarray(tfs, dtype=complex)
+    weights = np.ones(len(s)) if weights is None else np.asarray(weights, dtype=float)
+
+    poles = _createInitialPoles(frequencies_Hz, nPoles)
+    for _ in range(nIterations):
+        poles = _relocatePoles(s, tfs, poles, weights, hasE)
+    residues, d, e = _identifyResidues(s, tfs, poles, weights, hasE)
+    return RationalModel(poles, residues, d, e)
+
+
+def calcRelativeError(model, frequencies_Hz, tfs):
+    """
+    モデルの値と伝達関数の値との相対的な二乗平均平方根誤差を求める
+    """
+    tfs = np.asarray(tfs)
+    return np.linalg.norm(model.evaluate(frequencies_Hz) - tfs) / np.linalg.norm(tfs)
+
+
+def fitRationalModelWithinTolerance(
+    frequencies_Hz, tfs, tolerance=1e-3, maxPoles=100, nIterations=10, hasE=False
+):
+    """
+    相対誤差がtolerance以下になるまで極の数を2つずつ増やしながらモデルを求める
+
+    Parameters
+    ----------
+    frequencies_Hz : array_like
+        周波数(Hz)の配列
+    tfs : array_like
+        各周波数の伝達関数
+    tolerance : float
+        許容する相対的な二乗平均平方根誤差
+    maxPoles : int
+        極の数の上限(上限に達した場合は、その時点で最も誤差の小さいモデルを返す)
+
+    Returns
+    -------
+    model : instance
+        RationalModelのインスタンス
+    error : float
+        モデルの相対誤差
+    """
+    bestModel, bestError = None, np.inf
+    for nPoles in range(2, maxPoles + 1, 2):
+        model = fitRationalModel(frequencies_Hz, tfs, nPoles, nIterations, hasE)
+        error = calcRelativeError(model, frequencies_Hz, tfs)
+        if error < bestError:
+            bestModel, bestError = model, error
+        if error <= tolerance:
+            break
+    return bestModel, bestError
@@ -0,0 +1,307 @@
+import numpy as np
+
+# PRBSの生成多項式 x^n + x^m + 1 の(n, m)
+PRBS_TAPS = {
+    7: (7, 6),
+    9: (9, 5),
+    11: (11, 9),
+    15: (15, 14),
+    23: (23, 18),
+    31: (31, 28),
+}
+
+
+def createTimes(samplingFrequency, start, stop):
+    """
+    サンプリング周波数と開始・終了時刻から時刻の配列を作成する(終了時刻は含まない)
+
+    Parameters
+    ----------
+    samplingFrequency : float
+        サンプリング周波数(Hz)
+    start : float
+        開始時刻(s)
+    stop : float
+        終了時刻(s)
+    """
+    nSamples = int(round((stop - start) * samplingFrequency))
+    return start + np.arange(nSamples) / samplingFrequency
+
+
+def _calcTolerance(times):
+    # サンプリング周期の半分(立ち上がり・立ち下がりの判定の許容誤差)
+    # np.arangeで作成した時刻の丸め誤差で、パルスの幅が1サンプル変わらないようにする
+    times = np.asarray(times, dtype=float)
+    if len(times) < 2:
+        return 0.0
+    return (times[1] - times[0]) / 2
+
+
+def _calcEdges(phases, riseTime, width, fallTime, tolerance):
+    # 周期の先頭からの経過時間に対する波形(0〜1)を求める(SPICEのPULSEと同じ定義)
+    if riseTime > 0:
+        rising = np.clip(phases / riseTime, 0, 1)
+    else:
+        rising = (phases > -tolerance).astype(float)
+
+    fallStart = riseTime + width
+    if fallTime > 0:
+        falling = np.clip(1 - (phases - fallStart) / fallTime, 0, 1)
+    else:
+        falling = (phases < fallStart - tolerance).astype(float)
+    return np.minimum(rising, falling)
+
+
+def createPulseTrain(
+    times,
+    period,
+    duty,
+    amplitude=1,
+    lowLevel=0,
+    riseTime=0,
+    fallTime=0,
+    delay=0,
+    nPulses=None,
+):
+    """
+    パルス列を作成する
+
+    各パルスは delay + k * period から始まり、riseTimeで立ち上がり、
+    duty * periodの間だけamplitudeを保ち、fallTimeで立ち下がる
+
+    Parameters
+    ----------
+    times : array_like
+        時刻(s)の配列
+    period : float
+        周期(s)
+    duty : float
+        デューティー比(0〜1, 立ち上がり・立ち下がり時間を除いた幅を周期で割った値)
+    amplitude : float
+        パルスの電圧(V)
+    lowLevel : float
+        パルス以外の区間の電圧(V)
+    riseTime : float
+        立ち上がり時間(s)
+    fallTime : float
+        立ち下がり時間(s)
+    delay : float
+        最初のパルスの開始時刻(s)
+    nPulses : int
+        パルスの数(Noneの場合はdelay以降の全区間で繰り返す)
+    """
+    times = np.asarray(times, dtype=float)
+    width = duty * period
+    if riseTime + width + fallTime > period:
+        raise ValueError(
+            "立ち上がり・立ち下がり時間とパルス幅の合計が周期を超えています"
+        )
+
+    tolerance = _calcTolerance(times)
+    indexes = np.floor((times - delay + tolerance) / period)
+    phases = times - delay - indexes * period
+    levels = _calcEdges(phases, riseTime, width, fallTime, tolerance)
+
+    isInRange = indexes >= 0
+    if nPulses is not None:
+        isInRange &= indexes < nPulses
+    levels = np.where(isInRange, levels, 0)
+    return lowLevel + (amplitude - lowLevel) * levels
+
+
+def createStep(times, amplitude=1, lowLevel=0, riseTime=0, delay=0):
+    """
+    ステップ波形を作成する
+
+    Parameters
+    ----------
+    times : array_like
+        時刻(s)の配列
+    amplitude : float
+        立ち上がった後の電圧(V)
+    lowLevel : float
+        立ち上がる前の電圧(V)
+    riseTime : float
+        立ち上がり時間(s)
+    delay : float
+        立ち上がりの開始時刻(s)
+    """
+    times = np.asarray(times, dtype=float)
+    tolerance = _calcTolerance(times)
+    phases = times - delay
+    if riseTime > 0:
+        levels = np.clip(phases / riseTime, 0, 1)
+    else:
+        levels = (phases > -tolerance).astype(float)
+    return lowLevel + (amplitude - lowLevel) * levels
+
+
+def createSquareWave(
+    times, period, amplitude=1, duty=0.5, riseTime=0, fallTime=0, delay=0, bipolar=True
+):
+    """
+    方形波を作成する
+
+    Parameters
+    ----------
+    times : array_like
+        時刻(s)の配列
+    period : float
+        周期(s)
+    amplitude : float
+        電圧の振幅(V)
+    duty : float
+        デューティー比(0〜1)
+    riseTime : float
+        立ち上がり時間(s)
+    fallTime : float
+        立ち下がり時間(s)
+    delay : float
+        最初の立ち上がりの開始時刻(s)
+    bipolar : bool
+        Trueの場合は±amplitude、Falseの場合は0とamplitudeの間で振れる
+    """
+    times = np.asarray(times, dtype=float)
+    # delay以前も周期的に続くように、開始時刻を最初の時刻より前に移動する
+    if len(times) > 0:
+        delay = delay - np.ceil((delay - times[0]) / period) * period
+    return createPulseTrain(
+        times,
+        period,
+        duty,
+        amplitude=amplitude,
+        lowLevel=-amplitude if bipolar else 0,
+        riseTime=riseTime,
+        fallTime=fallTime,
+        delay=delay,
+    )
+
+
+def createPrbsBits(order, nBits, seed=1):
+    """
+    線形帰還シフトレジスタ(LFSR)で擬似ランダムビット列(PRBS)を作成する
+
+    生成多項式 x^n + x^m + 1 の漸化式 a[k] = a[k - n] xor a[k - m] は、
+    m個のビットが互いに依存しないため、m個ずつまとめて配列演算で計算する
+
+    Parameters
+    ----------
+    order : int
+        PRBSの次数(7, 9, 11, 15, 23, 31)
+    nBits : int
+        作成するビット数
+    seed : int
+        シフトレジスタの初期値(0以外)
+    """
+    if order not in PRBS_TAPS:
+        raise ValueError(
+            f"PRBSの次数は{list(PRBS_TAPS)}のいずれかを指定してください: {order}"
+        )
+    n, m = PRBS_TAPS[order]
+    if seed % (2 ** n) == 0:
+        raise ValueError("シフトレジスタの初期値は0以外を指定してください")
+
+    bits = np.empty(max(nBits, n), dtype=np.uint8)
+    bits[:n] = (seed >> np.arange(n)) & 1
+    for start in range(n, len(bits), m):
+        stop = min(start + m, len(bits))
+        bits[start:stop] = bits[start - n : stop - n] ^ bits[start - m : stop - m]
+    return bits[:nBits]
+
+
+def createPrbs(times, bitPeriod, order=7, amplitude=1, lowLevel=0, seed=1, delay=0):
+    """
+    PRBS(NRZ)の波形を作成する
+
+    Parameters
+    ----------
+    times : array_like
+        時刻(s)の配列
+    bitPeriod : float
+        1ビットの時間(s)
+    order : int
+        PRBSの次数(7, 9, 11, 15, 23, 31)
+    amplitude : float
+        ビットが1のときの電圧(V)
+    lowLevel : float
+        ビットが0のとき、およびdelay以前の電圧(V)
+    seed : int
+        シフトレジスタの初期値(0以外)
+    delay : float
+        最初のビットの開始時刻(s)
+    """
+    times = np.asarray(times, dtype=float)
+    tolerance = _calcTolerance(times)
+    indexes = np.floor((times - delay + tolerance) / bitPeriod).astype(np.int64)
+    nBits = int(indexes.max()) + 1 if len(indexes) > 0 else 0
+
+    levels = np.zeros(len(times))
+    if nBits > 0:
+        bits = createPrbsBits(order, nBits, seed)
+        isStarted = indexes >= 0
+        levels[isStarted] = bits[indexes[isStarted]]
+    return lowLevel + (amplitude - lowLevel) * levels
+
+
+def createArbitraryWave(times, sampleTimes, samples, interpolation="linear"):
+    """
+    任意の標本値(測定した波形など)から、指定した時刻の波形を作成する
+
+    Parameters
+    ----------
+    times : array_like
+        時刻(s)の配列
+    sampleTimes : array_like
+        標本値の時刻(s)の配列(昇順)
+    samples : array_like
+        標本値(V)の配列
+    interpolation : string
+        "linear"(線形補間) または "hold"(0次ホールド)
+        範囲外は先頭または末尾の値を用いる
+    """
+    times = np.asarray(times, dtype=float)
+    sampleTimes = np.asarray(sampleTimes, dtype=float)
+    samples = np.asarray(samples, dtype=float)
+    if interpolation == "linear":
+        return np.interp(times, sampleTimes, samples)
+    if interpolation == "hold":
+        indexes = np.searchsorted(sampleTimes, times, side="right") - 1
+        return samples[np.clip(indexes, 0, len(samples) - 1)]
+    raise ValueError(
+        f"interpolationは'linear'または'hold'を指定してください: {interpolation}"
+    )
+
+
+def calcDutyCycle(waves, times=None, start=None, stop=None, level=None):
+    """
+    波形から実際のデューティー比(levelを超える標本の割合)を求める
+
+    Parameters
+    ----------
+    waves : array_like
+        電圧(V)の配列
+    times : array_like
+        時刻(s)の配列(start, stopを指定する場合に使用する)
+    start : float
+        集計する区間の開始時刻(s, 区間に含む)
+    stop : float
+        集計する区間の終了時刻(s, 区間に含む)
+    level : float
+        ハイレベルとみなす電圧(V, Noneの場合は最大値と最小値の中間)
+    """
+    waves = np.asarray(waves, dtype=float)
+    isInWindow = np.ones(len(waves), dtype=bool)
+    if times is not None:
+        times = np.asarray(times, dtype=float)
+        if start is not None:
+            isInWindow &= start <= times
+        if stop is not None:
+            isInWindow &= times <= stop
+
+    waves = waves[isInWindow]
+    if len(waves) == 0:
+        return 0.0
+    if level is None:
+        level = (waves.max() + waves.min()) / 2
+        return float(np.count_nonzero(waves > level) / len(waves))
+    return float(np.count_nonzero(waves >= level) / len(waves))